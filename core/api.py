@@ -15,6 +15,8 @@ import time
 import aiohttp
 import asyncio
 
+from core.log_pipeline import LazyJson
+
 log = logging.getLogger("CasperFinder")
 
 
@@ -117,13 +119,13 @@ async def fetch_exhibition(
     layout_hash = await get_layout_hash(session, headers)
     if layout_hash:
         headers["X-UX-State-Key"] = layout_hash
-        log.info(f"[API] 획득한 레이아웃 해시 적용: {layout_hash}")
+        log.info("[API] 획득한 레이아웃 해시 적용: %s", layout_hash)
     else:
         log.warning("[API] 레이아웃 해시를 획득하지 못했습니다. 가짜 응답 가능성 있음.")
 
     # API 디버그 로그
-    log.info(f"[API] >>> REQUEST: {url}")
-    log.info(f"[API] PAYLOAD: {json.dumps(payload, ensure_ascii=False)}")
+    log.info("[API] >>> REQUEST: %s", url)
+    log.info("[API] PAYLOAD: %s", LazyJson(payload))
 
     try:
         async with session.post(url, json=payload, headers=headers) as resp:
@@ -131,10 +133,11 @@ async def fetch_exhibition(
             text = await resp.text()
 
             # API 디버그 로그 2: 응답 정보
-            log.info(f"[API] <<< RESPONSE Status: {status_code}")
+            log.info("[API] <<< RESPONSE Status: %s", status_code)
             try:
                 raw = json.loads(text)
-                log.info(f"[API] BODY: {json.dumps(raw, ensure_ascii=False)}")
+                # 응답 원문을 그대로 기록 (재직렬화 없음)
+                log.info("[API] BODY: %s", text)
 
                 # 가짜 성공응답(data가 아예 비어있음) 체크
                 if raw.get("rspStatus", {}).get("rspCode") == "0000" and not raw.get(
@@ -144,14 +147,14 @@ async def fetch_exhibition(
                     return False, [], 0, "봇 탐지 패치 (가짜 응답)"
 
             except json.JSONDecodeError:
-                log.info(f"[API] BODY: (Raw Text) {text[:1000]}")
+                log.info("[API] BODY: (Raw Text) %.1000s", text)
                 return False, [], 0, "JSON 파싱 실패 (HTML 응답?)"
 
             if status_code != 200:
                 return False, [], 0, f"HTTP {status_code}"
 
     except aiohttp.ClientError as e:
-        log.info(f"[API] !!! ERROR: {type(e).__name__}")
+        log.info("[API] !!! ERROR: %s", type(e).__name__)
         return False, [], 0, f"요청 실패: {type(e).__name__}"
     except asyncio.TimeoutError:
         log.info("[API] !!! TIMEOUT")
@@ -1,12 +1,121 @@
+"""
+현대차 통합 계정 인증 모듈
+로그인 세션(쿠키)을 도메인/경로/만료까지 그대로 저장·복원하고,
+공유 ClientSession 1개를 재사용하며, 만료 전에 세션을 갱신(keep-alive)한다.
+
+- 쿠키 파일: cookies.json — [{name, value, domain, path, expires, secure, httponly}, ...]
+  (구버전 {이름: 값} 형식도 읽음 → 다음 저장 시 새 형식으로 변환)
+- 공유 세션: get_session() — 로그인/상태 확인/인증 요청 모두 같은 세션·커넥션 재사용
+- keep-alive: start_keepalive() — 가장 빠른 쿠키 만료 REFRESH_MARGIN 전,
+  또는 KEEPALIVE_INTERVAL 마다 상태 확인 요청으로 세션 연장 + 쿠키 저장
+
+[수정 가이드]
+- 갱신 주기: KEEPALIVE_INTERVAL / REFRESH_MARGIN.
+- 인증이 필요한 요청: `session = await casper_auth.get_session()` (공유 세션, 상태는 is_logged_in).
+- 로그인 상태 변화 알림: casper_auth.on_change = fn(is_logged_in) (루프 스레드에서 호출,
+  앱은 로그인 탭 다시 그리기에 사용).
+"""
+
+import re
 import json
-import aiohttp
+import time
+import asyncio
 import logging
+from http.cookies import SimpleCookie
+from email.utils import formatdate, parsedate_to_datetime
+
+import aiohttp
+from yarl import URL
+
 from core.config import APP_DATA_DIR
 
 logger = logging.getLogger("CasperFinder.Auth")
 
 COOKIE_PATH = APP_DATA_DIR / "cookies.json"
 
+# 구버전 쿠키 파일(이름→값)을 복원할 도메인
+LEGACY_COOKIE_DOMAINS = ("casper.hyundai.com", "idpconnect-kr.hyundai.com")
+
+STATUS_URL = "https://casper.hyundai.com/ccsp/ccspinfo"
+
+KEEPALIVE_INTERVAL = 10 * 60  # 초 — 만료 정보가 없어도 이 주기로 세션 연장
+REFRESH_MARGIN = 5 * 60  # 초 — 쿠키 만료 이만큼 전에 갱신
+RETRY_INTERVAL = 60  # 초 — 네트워크 오류 시 재시도 간격, 갱신 대기 최소값
+
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Referer": "https://casper.hyundai.com/login",
+}
+
+
+def _morsel_expiry(morsel, previous=None):
+    """Morsel → 만료 시각(epoch 초). 세션 쿠키면 None.
+
+    max-age/expires 가 있으면 항상 그 값으로 계산 (같은 값으로 재발급된 슬라이딩 세션도 연장 반영).
+    max-age 는 지금 기준 → 쿠키를 처음 본 시점에 한 번만 호출할 것 (CasperAuth._jar_records).
+    둘 다 없을 때만 이전 레코드의 만료 시각 유지.
+    """
+    max_age = morsel["max-age"]
+    if max_age:
+        try:
+            return time.time() + int(max_age)
+        except ValueError:
+            pass
+    expires = morsel["expires"]
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            pass
+    if previous and previous.get("value") == morsel.value:
+        return previous.get("expires")
+    return None
+
+
+def _cookie_key(record):
+    return (record["domain"], record["path"], record["name"])
+
+
+def _load_cookie_records():
+    """cookies.json → 쿠키 레코드 목록 (만료된 항목 제외)."""
+    if not COOKIE_PATH.exists():
+        return []
+    try:
+        with open(COOKIE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        logger.error(f"쿠키 파일 로드 실패: {e}")
+        return []
+
+    if isinstance(data, dict):  # 구버전: {이름: 값}
+        return [
+            {"name": k, "value": v, "domain": d, "path": "/", "expires": None}
+            for k, v in data.items()
+            for d in LEGACY_COOKIE_DOMAINS
+        ]
+    now = time.time()
+    return [r for r in data if not r.get("expires") or r["expires"] > now]
+
+
+def _records_to_jar(records, jar):
+    """쿠키 레코드를 도메인/경로/만료 그대로 CookieJar 에 복원."""
+    for r in records:
+        cookie = SimpleCookie()
+        cookie[r["name"]] = r["value"]
+        morsel = cookie[r["name"]]
+        host = r["domain"].lstrip(".")
+        morsel["domain"] = host
+        morsel["path"] = r.get("path") or "/"
+        if r.get("expires"):
+            morsel["expires"] = formatdate(r["expires"], usegmt=True)
+        if r.get("secure"):
+            morsel["secure"] = True
+        if r.get("httponly"):
+            morsel["httponly"] = True
+        jar.update_cookies(cookie, response_url=URL(f"https://{host}/"))
+
 
 class CasperAuth:
     def __init__(self):
@@ -14,159 +123,260 @@ class CasperAuth:
         self._cookie_jar = None
         self.user_info = None
         self.is_logged_in = False
+        self.on_change = None  # fn(is_logged_in) — 상태가 바뀔 때 (루프 스레드)
+        # 쿠키별 (Morsel, 만료 시각) — 재발급되면 CookieJar 가 새 Morsel 로 바꾸므로 그때만 다시 계산
+        self._expiry_seen = {}
+
+        self._keepalive_task = None
 
-        # 저장된 쿠키 데이터 임시 보관
-        self._saved_cookies_data = {}
-        self._load_cookies_from_file()
+        # 저장된 쿠키 레코드 (CookieJar 는 루프 안에서 생성)
+        self._saved_records = _load_cookie_records()
+        if self._saved_records:
+            logger.info("기존 세션 정보를 로드했습니다.")
+
+    # ── 쿠키 ──
 
     def _ensure_cookie_jar(self):
-        """CookieJar가 없으면 생성하고 저장된 쿠키 주입"""
+        """CookieJar가 없으면 생성하고 저장된 쿠키를 도메인/경로/만료 그대로 주입"""
         if self._cookie_jar is None:
             self._cookie_jar = aiohttp.CookieJar()
-            if self._saved_cookies_data:
-                for key, val in self._saved_cookies_data.items():
-                    for domain in ["casper.hyundai.com", "idpconnect-kr.hyundai.com"]:
-                        self._cookie_jar.update_cookies(
-                            {key: val},
-                            response_url=aiohttp.helpers.URL(f"https://{domain}/"),
-                        )
+            _records_to_jar(self._saved_records, self._cookie_jar)
         return self._cookie_jar
 
-    def _load_cookies_from_file(self):
-        """파일에서 쿠키 데이터를 읽어오기만 함 (루프 불필요)"""
-        if COOKIE_PATH.exists():
-            try:
-                with open(COOKIE_PATH, "r", encoding="utf-8") as f:
-                    self._saved_cookies_data = json.load(f)
-                    logger.info("기존 세션 정보를 로드했습니다.")
-            except Exception as e:
-                logger.error(f"쿠키 파일 로드 실패: {e}")
-
     @property
     def cookie_jar(self):
         return self._ensure_cookie_jar()
 
+    def _jar_records(self):
+        """현재 CookieJar → 쿠키 레코드 목록."""
+        previous = {_cookie_key(r): r for r in self._saved_records}
+        seen, self._expiry_seen = self._expiry_seen, {}
+        records = []
+        for morsel in self.cookie_jar:
+            record = {"name": morsel.key, "value": morsel.value, "domain": morsel["domain"]}
+            record["path"] = morsel["path"] or "/"
+            key = _cookie_key(record)
+            known = seen.get(key)
+            if known is not None and known[0] is morsel:
+                record["expires"] = known[1]  # 같은 쿠키 → max-age 를 다시 더하지 않음
+            else:
+                record["expires"] = _morsel_expiry(morsel, previous.get(key))
+            self._expiry_seen[key] = (morsel, record["expires"])
+            record["secure"] = bool(morsel["secure"])
+            record["httponly"] = bool(morsel["httponly"])
+            records.append(record)
+        return records
+
     def _save_cookies(self):
-        """현재 CookieJar의 쿠키를 파일로 저장"""
-        if not self.session:
+        """현재 CookieJar의 쿠키를 파일로 저장 (바뀐 경우만)"""
+        records = self._jar_records()
+        if records == self._saved_records:
             return
-
-        cookies = {}
-        for cookie in self.session.cookie_jar:
-            cookies[cookie.key] = cookie.value
-
         try:
-            with open(COOKIE_PATH, "w", encoding="utf-8") as f:
-                json.dump(cookies, f, indent=2)
+            COOKIE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = COOKIE_PATH.with_name(f"{COOKIE_PATH.name}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, indent=2)
+            tmp_path.replace(COOKIE_PATH)
+            self._saved_records = records
             logger.info("세션 쿠키를 저장했습니다.")
         except Exception as e:
             logger.error(f"쿠키 저장 실패: {e}")
 
+    def _next_expiry(self):
+        """가장 빨리 만료되는 쿠키의 남은 시간(초). 만료 정보가 없으면 None."""
+        expiries = [r["expires"] for r in self._jar_records() if r.get("expires")]
+        return min(expiries) - time.time() if expiries else None
+
+    # ── 공유 세션 ──
+
     async def get_session(self):
-        """인증 정보가 포함된 aiohttp 세션 반환"""
+        """인증 정보가 포함된 공유 aiohttp 세션 반환 (루프 스레드, 커넥션 재사용)"""
         if self.session is None or self.session.closed:
-            jar = aiohttp.CookieJar()
-            # 저장된 쿠키 주입 (필요 시)
-            self.session = aiohttp.ClientSession(cookie_jar=jar)
-            # TODO: 실제 현대차 도메인에 대한 쿠키 주입 로직 필요
-
+            self.session = aiohttp.ClientSession(
+                cookie_jar=self.cookie_jar, headers=BROWSER_HEADERS
+            )
         return self.session
 
+    def _set_logged_in(self, value, user_info=None):
+        changed = value != self.is_logged_in
+        self.is_logged_in = value
+        self.user_info = user_info if value else None
+        if changed and self.on_change:
+            try:
+                self.on_change(value)
+            except Exception as e:
+                logger.error(f"[Auth] 상태 변경 콜백 실패: {e}")
+
+    # ── 로그인 ──
+
     async def login(self, email, password):
         """현대차 통합 계정 로그인 시도 (동적 리다이렉트 체인 추적)"""
         logger.info(f"[Auth] 현대차 통합 계정 로그인 프로세스 시작: {email}")
+        session = await self.get_session()
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Referer": "https://casper.hyundai.com/login",
-        }
+        try:
+            # 1. 초기 세션 및 쿠키 정렬
+            logger.info("[Auth] Casper 사이트 초기 세션 연결 중...")
+            async with session.get("https://casper.hyundai.com/login") as resp:
+                await resp.read()
 
-        async with aiohttp.ClientSession(cookie_jar=self.cookie_jar) as session:
-            try:
-                # 1. 초기 세션 및 쿠키 정렬
-                logger.info("[Auth] Casper 사이트 초기 세션 연결 중...")
-                await session.get("https://casper.hyundai.com/login", headers=headers)
-
-                # 2. 로그인 게이트웨이 호출 (IDP로의 리다이렉트 발생)
-                ccsp_url = "https://casper.hyundai.com/ccsp/ccspLogin"
-                logger.info("[Auth] 로그인 게이트웨이 진입 및 인증 서버 전환...")
-                async with session.get(
-                    ccsp_url, headers=headers, allow_redirects=True
-                ) as resp:
-                    # 최종 도달한 IDP URL 및 HTML 획득
-                    auth_url = str(resp.url)
-                    html = await resp.text()
-
-                    import re
-
-                    csrf_match = re.search(r'name="_csrf"\s+value="([^"]+)"', html)
-                    csrf_token = csrf_match.group(1) if csrf_match else ""
-
-                    logger.info(f"[Auth] 인증 페이지 도달 (CSRF: {csrf_token[:8]}...)")
-
-                if not csrf_token:
-                    logger.error(
-                        "[Auth] ❌ 인증 토큰(CSRF) 추출 실패. (서버 응답 확인 필요)"
-                    )
-                    return False
-
-                # 3. 로그인 정보 전송 (POST)
-                payload = {"email": email, "password": password, "_csrf": csrf_token}
-                logger.info("[Auth] 계정 인증 정보(ID/PW) 전송 중...")
-                async with session.post(
-                    auth_url, data=payload, headers=headers, allow_redirects=True
-                ) as resp:
-                    logger.info(f"[Auth] 인증 서버 응답 상태: {resp.status}")
-
-                # 4. 최종 로그인 상태 확인
-                logger.info("[Auth] 최종 로그인 상태 확인 중...")
-                success = await self.check_login_status_internal(session)
-                if success:
-                    logger.info("✅ [Auth] 현대차 통합 계정 로그인 최종 성공!")
-                    self._save_cookies()
-                    return True
-                else:
-                    logger.error(
-                        "❌ [Auth] 로그인 실패 (계정 정보 불일치 또는 보안 절차 필요)"
-                    )
+            # 2. 로그인 게이트웨이 호출 (IDP로의 리다이렉트 발생)
+            ccsp_url = "https://casper.hyundai.com/ccsp/ccspLogin"
+            logger.info("[Auth] 로그인 게이트웨이 진입 및 인증 서버 전환...")
+            async with session.get(ccsp_url, allow_redirects=True) as resp:
+                # 최종 도달한 IDP URL 및 HTML 획득
+                auth_url = str(resp.url)
+                html = await resp.text()
 
-            except Exception as e:
-                logger.error(f"⚠️ [Auth] 로그인 프로세스 도중 예외 발생: {e}")
+                csrf_match = re.search(r'name="_csrf"\s+value="([^"]+)"', html)
+                csrf_token = csrf_match.group(1) if csrf_match else ""
+
+                logger.info(f"[Auth] 인증 페이지 도달 (CSRF: {csrf_token[:8]}...)")
+
+            if not csrf_token:
+                logger.error("[Auth] ❌ 인증 토큰(CSRF) 추출 실패. (서버 응답 확인 필요)")
+                return False
+
+            # 3. 로그인 정보 전송 (POST)
+            payload = {"email": email, "password": password, "_csrf": csrf_token}
+            logger.info("[Auth] 계정 인증 정보(ID/PW) 전송 중...")
+            async with session.post(auth_url, data=payload, allow_redirects=True) as resp:
+                logger.info(f"[Auth] 인증 서버 응답 상태: {resp.status}")
+
+            # 4. 최종 로그인 상태 확인
+            logger.info("[Auth] 최종 로그인 상태 확인 중...")
+            success = await self.check_login_status_internal(session)
+            if success:
+                logger.info("✅ [Auth] 현대차 통합 계정 로그인 최종 성공!")
+                self._save_cookies()
+                self.start_keepalive()
+                return True
+            logger.error("❌ [Auth] 로그인 실패 (계정 정보 불일치 또는 보안 절차 필요)")
+
+        except Exception as e:
+            logger.error(f"⚠️ [Auth] 로그인 프로세스 도중 예외 발생: {e}")
 
         return False
 
     async def check_login_status_internal(self, session):
-        """내부 세션을 사용하여 로그인 상태 확인"""
-        url = "https://casper.hyundai.com/ccsp/ccspinfo"
+        """세션으로 로그인 상태 확인 (True/False, 네트워크 오류 시 None)"""
         try:
-            async with session.get(url, timeout=5) as resp:
+            timeout = aiohttp.ClientTimeout(total=5)
+            async with session.get(STATUS_URL, timeout=timeout) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(content_type=None)
                     # custNm 존재 시 활성 세션으로 간주
                     if data.get("data") and data["data"].get("custNm"):
-                        self.user_info = data["data"]
-                        self.is_logged_in = True
+                        self._set_logged_in(True, data["data"])
                         return True
-        except Exception as e:
+                self._set_logged_in(False)
+                return False
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
             logger.debug(f"[Auth] 내부 상태 체크 실패: {e}")
-        return False
+            return None
 
     async def check_login_status(self):
-        """외부 호출용 로그인 상태 확인"""
-        async with aiohttp.ClientSession(cookie_jar=self.cookie_jar) as session:
-            return await self.check_login_status_internal(session)
+        """외부 호출용 로그인 상태 확인 (공유 세션 사용)"""
+        session = await self.get_session()
+        ok = await self.check_login_status_internal(session)
+        if ok:
+            self._save_cookies()  # 서버가 연장해 준 쿠키 반영
+        return bool(ok)
+
+    # ── keep-alive ──
+
+    async def start(self):
+        """시작 시 1회: 저장된 세션 확인 후 로그인 상태면 keep-alive 시작."""
+        if not self._saved_records:
+            return False
+        ok = await self.check_login_status()
+        if ok:
+            logger.info(f"[Auth] 저장된 세션 복원: {self.user_info.get('custNm', '')}")
+            self.start_keepalive()
+        return ok
+
+    def start_keepalive(self):
+        """세션 갱신 작업 시작 (루프 스레드에서 호출, 이미 실행 중이면 무시)."""
+        if self._keepalive_task and not self._keepalive_task.done():
+            return
+        self._keepalive_task = asyncio.get_running_loop().create_task(
+            self._keepalive()
+        )
+
+    def _refresh_delay(self):
+        """다음 갱신까지 대기 시간(초): 가장 빠른 쿠키 만료 REFRESH_MARGIN 전과 기본 주기 중 짧은 쪽.
+
+        최소 RETRY_INTERVAL (만료 정보가 어긋나도 상태 확인 요청이 몰리지 않도록).
+        """
+        remaining = self._next_expiry()
+        if remaining is None:
+            return KEEPALIVE_INTERVAL
+        return max(RETRY_INTERVAL, min(KEEPALIVE_INTERVAL, remaining - REFRESH_MARGIN))
+
+    async def _keepalive(self):
+        logger.info("[Auth] 세션 유지 시작")
+        while True:
+            await asyncio.sleep(self._refresh_delay())
+            session = await self.get_session()
+            ok = await self.check_login_status_internal(session)
+            if ok:
+                self._save_cookies()
+                logger.debug("[Auth] 세션 연장 완료")
+            elif ok is None:
+                await asyncio.sleep(RETRY_INTERVAL)  # 네트워크 오류 → 잠시 후 재시도
+            else:
+                logger.warning("[Auth] 세션 만료 — 다시 로그인이 필요합니다.")
+                return
+
+    # ── 로그아웃 / 종료 ──
 
     async def logout(self):
         """로그아웃 및 세션 정보 삭제"""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
         if COOKIE_PATH.exists():
             COOKIE_PATH.unlink()
-        self.cookie_jar = aiohttp.CookieJar()
-        self.is_logged_in = False
-        self.user_info = None
+        self.cookie_jar.clear()
+        self._saved_records = []
+        self._set_logged_in(False)
         logger.info("로그아웃 되었습니다.")
 
+    async def close(self):
+        """keep-alive 중지 + 공유 세션 닫기 (앱 종료 시)."""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+
+# 싱글톤 인스턴스 — 최초 접근 시 생성 (import 시점에 cookies.json 을 읽지 않음)
+_casper_auth = None
+
+
+def get_casper_auth():
+    global _casper_auth
+    if _casper_auth is None:
+        _casper_auth = CasperAuth()
+    return _casper_auth
+
+
+def close_auth(timeout=2.0):
+    """공유 세션 정리 (종료 시, 생성된 적 없으면 무시)."""
+    if _casper_auth is None:
+        return
+    from core.runtime import get_runtime
+
+    try:
+        get_runtime().submit(_casper_auth.close()).result(timeout)
+    except Exception as e:
+        logger.warning(f"[Auth] 세션 정리 실패: {e}")
+
 
-# 싱글톤 인스턴스
-casper_auth = CasperAuth()
+def __getattr__(name):
+    # `from core.auth import casper_auth` 호환 (PEP 562)
+    if name == "casper_auth":
+        return get_casper_auth()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
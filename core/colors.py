@@ -0,0 +1,88 @@
+"""
+컬러칩 이름 규칙 및 아틀라스 경로 모듈
+API 색상명 ↔ 에셋 파일명 매핑을 한 곳에서 관리 (GUI 의존성 없음).
+
+[수정 가이드]
+- API 색상명이 에셋 파일명과 다를 때: COLOR_NAME_MAP에 추가.
+- 칩 표시 크기 변경 시: CHIP_SIZE 수정 후 scripts/build_color_atlas.py 재실행.
+"""
+
+from core.config import BASE_DIR
+
+COLORS_DIR = BASE_DIR / "assets" / "colors"
+ATLAS_PNG_PATH = COLORS_DIR / "atlas.png"
+ATLAS_INDEX_PATH = COLORS_DIR / "atlas.json"
+ATLAS_VERSION = 1
+
+CHIP_TYPES = ("exterior", "interior")
+CHIP_SIZE = (55, 22)  # 카드에 표시되는 논리 크기
+
+# API 응답명 → 에셋 파일명 (정규화 후 비교하므로 공백/괄호 변형은 불필요)
+COLOR_NAME_MAP = {
+    # 외장
+    "소울트로닉 오렌지 펄": "시에나 오렌지 메탈릭",
+    "소울트로닉 오렌지 펄투톤": "시에나 오렌지 메탈릭투톤",
+    # 내장
+    "블랙(직물)": "블랙 인조가죽",
+}
+
+
+def normalize_color_name(name):
+    """비교용 정규화: 공백/밑줄/슬래시/괄호 제거.
+
+    예: "블랙 (인조가죽)", "블랙_인조가죽" → "블랙인조가죽"
+    """
+    if not name:
+        return ""
+    for ch in (" ", "_", "/", "(", ")"):
+        name = name.replace(ch, "")
+    return name.strip()
+
+
+def match_stem(name, stems):
+    """색상명 하나를 에셋 파일명(stem)에 매칭. 실패 시 None.
+
+    1) 별칭 적용 후 정확 일치 → 2) 파일명이 이름을 포함 → 3) 이름이 파일명을 포함(최장).
+    """
+    target = normalize_color_name(COLOR_NAME_MAP.get(name, name))
+    if not target:
+        return None
+    by_norm = {normalize_color_name(s): s for s in stems}
+    if target in by_norm:
+        return by_norm[target]
+    for norm, stem in by_norm.items():
+        if target in norm:
+            return stem
+    contained = [norm for norm in by_norm if norm in target]
+    if contained:
+        return by_norm[max(contained, key=len)]
+    return None
+
+
+def build_name_index(stems_by_type, extra_names=None):
+    """{chip_type: {정규화 이름: "chip_type/stem"}} 테이블 생성.
+
+    Args:
+        stems_by_type: {chip_type: [에셋 파일명(확장자 제외), ...]}
+        extra_names: {chip_type: [미리 매칭해 둘 색상명, ...]} (필터 기본값 등)
+
+    알려진 이름의 유사 일치는 여기(빌드 시점/시작 시 1회)에서 수행한다.
+    테이블에 없는 이름은 조회하는 쪽이 처음 한 번만 match_stem() 으로 찾고 결과를 기억한다.
+    """
+    extra_names = extra_names or {}
+    index = {}
+    for chip_type in CHIP_TYPES:
+        stems = stems_by_type.get(chip_type, [])
+        names = {}
+        for stem in stems:
+            names[normalize_color_name(stem)] = f"{chip_type}/{stem}"
+        candidates = list(COLOR_NAME_MAP) + list(extra_names.get(chip_type, []))
+        for name in candidates:
+            norm = normalize_color_name(name)
+            if not norm or norm in names:
+                continue
+            stem = match_stem(name, stems)
+            if stem:
+                names[norm] = f"{chip_type}/{stem}"
+        index[chip_type] = names
+    return index
@@ -4,12 +4,17 @@ config.json 로드/저장 및 경로 상수 정의.
 관리자 권한 문제를 방지하기 위해 사용자 로컬 앱 데이터 폴더(%LOCALAPPDATA%)를 사용합니다.
 """
 
+import copy
 import json
 import os
+import atexit
 import shutil
 import logging
+import threading
 from pathlib import Path
 
+from core.migrations import migrate_config, TARGET_EXHB_NOS
+
 # --- 경로 상수 ---
 import sys
 
@@ -38,19 +43,19 @@ HISTORY_PATH = DATA_DIR / "history.json"
 DEFAULT_CONFIG = {
     "targets": [
         {
-            "exhbNo": "E20260277",
+            "exhbNo": TARGET_EXHB_NOS[0],
             "label": "특별기획전",
             "deliveryAreaCode": "T",
             "deliveryLocalAreaCode": "T1",
             "subsidyRegion": "1100",
         },
         {
-            "exhbNo": "D0003",
+            "exhbNo": TARGET_EXHB_NOS[1],
             "label": "전시차",
             "subsidyRegion": "1100",
         },
         {
-            "exhbNo": "R0003",
+            "exhbNo": TARGET_EXHB_NOS[2],
             "label": "리퍼브",
             "deliveryAreaCode": "T",
             "deliveryLocalAreaCode": "T1",
@@ -65,12 +70,25 @@ DEFAULT_CONFIG = {
         "autoStartWithWindows": False,
         "checkUpdateOnStart": True,
         "updateDismissUntil": "",
+        "logBodyMaxBytes": 65536,  # 디버그 콘솔에서 펼칠 본문 최대 크기
+        "jsonLog": False,  # logs/casperfinder.jsonl 구조화 로그 추가 출력
+        "historyRetentionDays": 90,  # 알림 히스토리 보관 기간 (0 = 무제한)
+        "soundBackend": "auto",  # 알림음 백엔드: auto | winmm | linux | null
+        "updatePrefetch": True,  # 새 버전 발견 시 백그라운드로 미리 받아 둔 뒤 알림
     },
     "lastState": {
         "lastTab": 0,
         "geometry": "1024x720+300+150",
     },
     "pollInterval": 3,
+    # 외부 알림 싱크 (webhook / telegram / discord) — 형식은 core/sinks.py 참고
+    "notifySinks": [],
+    # 알림 요약: 창(초) 안에 몰린 신규 차량은 요약 1건으로 (0 = 요약 없이 모두 즉시)
+    "alertDigest": {"window": 300},
+    # 로컬 API (127.0.0.1 전용, 읽기 + 폴링 제어) — core/local_api.py 참고
+    "localApi": {"enabled": False, "port": 8765, "token": ""},
+    # 알림 규칙: [{"name", "when": "<조건식>", "actions": [...], "enabled"}] — core/rules.py 참고
+    "alertRules": [],
     "api": {
         "baseUrl": "https://casper.hyundai.com/gw/wp/product/v2/product/exhibition/cars",
         "headers": {
@@ -118,17 +136,119 @@ log = logging.getLogger("CasperFinder")
 
 
 def save_json(path, data):
-    """JSON 파일 저장. 디렉토리 자동 생성."""
+    """JSON 파일 원자적 저장 (임시 파일 + fsync + 교체). 디렉토리 자동 생성."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
     except Exception as e:
         log.error(f"저장 실패 ({path}): {e}")
 
 
+# ── 설정 스냅샷 + 지연 저장 ──
+# 변경은 메모리 스냅샷에 즉시 반영하고, 디스크 쓰기는 짧은 구간으로 모아
+# 백그라운드 타이머 스레드에서 수행 (UI 스레드는 디스크에 닿지 않음).
+
+CONFIG_WRITE_DELAY = 0.5  # 초
+
+_snapshot = None
+_config_lock = threading.RLock()
+_write_lock = threading.Lock()
+_write_timer = None
+_dirty = False
+
+
 def load_config():
-    """config.json 로드. 없으면 기본 설정 복사."""
+    """설정 사본 반환. 최초 호출 시에만 디스크에서 읽고 정리 로직을 실행."""
+    global _snapshot
+    with _config_lock:
+        if _snapshot is None:
+            config, needs_save = _load_config_file()
+            _snapshot = config
+            if needs_save:
+                _schedule_write()
+        return copy.deepcopy(_snapshot)
+
+
+def save_config(config):
+    """설정 전체 교체 (메모리 즉시 반영, 디스크는 지연 저장)."""
+    global _snapshot
+    with _config_lock:
+        _snapshot = copy.deepcopy(config)
+        _schedule_write()
+
+
+def update_config(changes):
+    """변경분만 병합 (중첩 dict 는 재귀 병합). 예: {"lastState": {"lastTab": 2}}"""
+    global _snapshot
+    with _config_lock:
+        if _snapshot is None:
+            load_config()
+        _merge(_snapshot, copy.deepcopy(changes))
+        _schedule_write()
+
+
+def flush_config():
+    """대기 중인 설정 쓰기를 즉시 수행 (종료 시 호출)."""
+    global _write_timer
+    with _config_lock:
+        timer, _write_timer = _write_timer, None
+    if timer is not None:
+        timer.cancel()
+    _write_snapshot()  # 진행 중인 쓰기가 있으면 끝날 때까지 대기
+
+
+def _merge(dst, src):
+    for key, val in src.items():
+        if isinstance(val, dict) and isinstance(dst.get(key), dict):
+            _merge(dst[key], val)
+        else:
+            dst[key] = val
+
+
+def _schedule_write():
+    global _write_timer, _dirty
+    with _config_lock:
+        _dirty = True
+        if _write_timer is not None:
+            _write_timer.cancel()
+        _write_timer = threading.Timer(CONFIG_WRITE_DELAY, _on_write_timer)
+        _write_timer.daemon = True
+        _write_timer.start()
+
+
+def _on_write_timer():
+    global _write_timer
+    with _config_lock:
+        _write_timer = None
+    _write_snapshot()
+
+
+def _write_snapshot():
+    global _dirty
+    # 쓰기끼리는 직렬화, 스냅샷 복사 시점에만 설정 잠금
+    with _write_lock:
+        with _config_lock:
+            if not _dirty or _snapshot is None:
+                return
+            data = copy.deepcopy(_snapshot)
+            _dirty = False
+        save_json(CONFIG_PATH, data)
+
+
+atexit.register(flush_config)
+
+
+def _load_config_file():
+    """config.json 로드 + 마이그레이션. 없으면 기본 설정 복사.
+
+    Returns:
+        (config: dict, needs_save: bool)
+    """
     # 앱 데이터 경로 보장
     APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -142,65 +262,13 @@ def load_config():
                 save_json(CONFIG_PATH, DEFAULT_CONFIG)
         else:
             save_json(CONFIG_PATH, DEFAULT_CONFIG)
-        return DEFAULT_CONFIG.copy()
-
-    config = load_json(CONFIG_PATH, DEFAULT_CONFIG.copy())
-
-    # --- 핵심 코드 강제 업데이트 로직 (버전/기획전 코드 등) ---
-    needs_save = False
-
-    # 1. 기획전 코드 동기화 + 타입별 필드 정리
-    for i, def_t in enumerate(DEFAULT_CONFIG["targets"]):
-        if i < len(config.get("targets", [])):
-            curr_t = config["targets"][i]
-            # 기획전 코드가 다르면 최신 정보로 덮어씀
-            if curr_t.get("exhbNo") != def_t["exhbNo"]:
-                curr_t["exhbNo"] = def_t["exhbNo"]
-                needs_save = True
-
-            # 기획전 타입에 따라 불필요한 필드 강제 정리
-            exhb = curr_t.get("exhbNo", "")
-            # R(리퍼브): 보조금 설정 없음 → subsidyRegion 강제 비움
-            if exhb.startswith("R"):
-                if curr_t.get("subsidyRegion", "") != "":
-                    curr_t["subsidyRegion"] = ""
-                    needs_save = True
-            # D(전시차): 배송지 설정 없음 → deliveryArea 강제 비움
-            if exhb.startswith("D"):
-                if curr_t.get("deliveryAreaCode", "") != "":
-                    curr_t["deliveryAreaCode"] = ""
-                    needs_save = True
-                if curr_t.get("deliveryLocalAreaCode", "") != "":
-                    curr_t["deliveryLocalAreaCode"] = ""
-                    needs_save = True
-
-    # 2. defaultPayload 동기화
-    payload = config.get("api", {}).get("defaultPayload", {})
-
-    # 2a. 항상 강제 초기화 (poller에서 carCode별 개별 호출하므로)
-    force_keys = {"carCode": "", "sortCode": "10"}
-    for key, val in force_keys.items():
-        if payload.get(key) != val:
-            payload[key] = val
-            needs_save = True
-
-    # 2b. 키가 없을 때만 기본값 보충 (사용자 설정 존중)
-    optional_keys = {
-        "subsidyRegion": "",
-        "deliveryAreaCode": "",
-        "deliveryLocalAreaCode": "",
-    }
-    for key, val in optional_keys.items():
-        if key not in payload:
-            payload[key] = val
-            needs_save = True
-
-    if needs_save:
-        save_config(config)
-
-    return config
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        return config, bool(migrate_config(config))
 
+    config = load_json(CONFIG_PATH, copy.deepcopy(DEFAULT_CONFIG))
 
-def save_config(config):
-    """config.json 저장."""
-    save_json(CONFIG_PATH, config)
+    # 버전 단위 마이그레이션 (이미 적용된 버전은 건너뜀)
+    applied = migrate_config(config)
+    if applied:
+        log.info(f"[설정] 마이그레이션 적용: v{applied[0]} → v{applied[-1]}")
+    return config, bool(applied)
@@ -0,0 +1,78 @@
+"""
+SQLite 연결 관리 모듈
+앱 데이터 DB(DATA_DIR/casperfinder.db) 공유 연결 + 스키마 등록.
+GUI 프레임워크 의존성 없음.
+
+[수정 가이드]
+- 테이블 추가: 사용하는 모듈에서 ensure_schema(이름, DDL) 호출 (CREATE ... IF NOT EXISTS).
+- 모든 쓰기는 transaction() 안에서 수행 (여러 스레드가 같은 연결을 공유).
+"""
+
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+
+from core.config import DATA_DIR
+
+DB_PATH = DATA_DIR / "casperfinder.db"
+
+log = logging.getLogger("CasperFinder")
+
+_conn = None
+_lock = threading.RLock()
+_schemas = set()
+
+
+def get_connection():
+    """공유 연결 반환 (최초 호출 시 생성, WAL 모드)."""
+    global _conn
+    with _lock:
+        if _conn is None:
+            DATA_DIR.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _conn = conn
+        return _conn
+
+
+@contextmanager
+def transaction():
+    """잠금 + 트랜잭션. 블록이 정상 종료되면 커밋, 예외 시 롤백."""
+    with _lock:
+        conn = get_connection()
+        with conn:
+            yield conn
+
+
+def query(sql, params=()):
+    """읽기 전용 조회 → [sqlite3.Row, ...]"""
+    with _lock:
+        return get_connection().execute(sql, params).fetchall()
+
+
+def ensure_schema(name, ddl, on_create=None):
+    """스키마(DDL 스크립트)를 프로세스당 1회 적용.
+
+    on_create(conn): 스키마 적용 직후 1회 실행할 초기화 (레거시 데이터 이전 등).
+    """
+    with _lock:
+        if name in _schemas:
+            return
+        conn = get_connection()
+        conn.executescript(ddl)
+        if on_create:
+            on_create(conn)
+        _schemas.add(name)
+
+
+def close():
+    """연결 종료 (종료 시 호출)."""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+            _schemas.clear()
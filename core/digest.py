@@ -0,0 +1,80 @@
+"""
+알림 요약(digest) 스케줄러
+신규 차량 발견이 몰릴 때 토스트/소리/외부 싱크 알림을 창(window) 단위 요약 1건으로 합친다.
+GUI 프레임워크 의존성 없음. 시계는 호출자가 넘김 (폴링 루프에서 add/due 호출).
+
+동작:
+- 우선 알림(is_urgent, 예: 조건설정 필터 일치)은 항상 즉시 단건 알림
+- 그 외: 조용하던 창의 첫 차량은 즉시 단건 알림, 창(window 초)이 열려 있는 동안 들어온 차량은
+  창이 끝날 때 기획전·트림별로 묶은 요약 1건 (몰림이 계속되면 창마다 요약 1건)
+- window 0: 요약 없이 모두 즉시 (이전 동작)
+
+[수정 가이드]
+- 창 길이: config.json alertDigest.window (초, 기본 DEFAULT_WINDOW).
+- 요약 문구: core.formatter.format_digest / format_digest_toast.
+"""
+
+import time
+
+DEFAULT_WINDOW = 300  # 초
+
+# 알림 종류
+ALERT_VEHICLE = "vehicle"  # events: [(vehicle, label, detail_url)] 1건
+ALERT_DIGEST = "digest"  # events: [(vehicle, label, detail_url), ...]
+
+
+class DigestScheduler:
+    """신규 차량 이벤트 → 즉시 알림 / 창 단위 요약. 단일 스레드(폴링 루프) 전용."""
+
+    def __init__(self, window=DEFAULT_WINDOW, is_urgent=None):
+        self.window = window
+        self.is_urgent = is_urgent  # fn(vehicle, label) -> bool (아무 스레드에서 교체 가능)
+        self._pending = []
+        self._window_end = None  # 열린 창의 종료 시각 (None = 조용함)
+
+    def add(self, vehicle, label, detail_url, now=None):
+        """이벤트 추가 → 지금 보낼 알림 목록 [(종류, events), ...]."""
+        now = time.monotonic() if now is None else now
+        event = (vehicle, label, detail_url)
+        out = self.due(now)
+        if self.window <= 0 or self._urgent(vehicle, label):
+            out.append((ALERT_VEHICLE, [event]))
+        elif self._window_end is None:
+            self._window_end = now + self.window  # 첫 차량: 즉시 알리고 창 열기
+            out.append((ALERT_VEHICLE, [event]))
+        else:
+            self._pending.append(event)
+        return out
+
+    def due(self, now=None):
+        """창이 끝났으면 요약 1건 반환. 요약을 보냈으면 창을 이어서 열어 둠."""
+        now = time.monotonic() if now is None else now
+        if self._window_end is None or now < self._window_end:
+            return []
+        if not self._pending:
+            self._window_end = None
+            return []
+        events, self._pending = self._pending, []
+        self._window_end = now + self.window
+        return [(ALERT_DIGEST, events)]
+
+    def flush(self):
+        """남은 이벤트를 요약으로 즉시 반환 (중지 시)."""
+        self._window_end = None
+        if not self._pending:
+            return []
+        events, self._pending = self._pending, []
+        return [(ALERT_DIGEST, events)]
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def _urgent(self, vehicle, label):
+        check = self.is_urgent
+        if check is None:
+            return False
+        try:
+            return bool(check(vehicle, label))
+        except Exception:
+            return False
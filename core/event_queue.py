@@ -0,0 +1,47 @@
+"""
+엔진 → UI 이벤트 큐
+엔진(런타임 루프 스레드)·로깅 리스너가 넣고, Tk 스레드가 프레임 주기로 한 번에 꺼낸다.
+GUI 프레임워크 의존성 없음.
+
+deque.append / popleft 는 GIL 아래에서 원자적이므로 잠금 없이 동작한다
+(생산자 여러 개 + 소비자 1개까지 안전, 소비자는 반드시 하나).
+
+[수정 가이드]
+- 이벤트 종류 추가: EVT_* 상수 추가 + UI 쪽 배치 적용(_apply_engine_events)에 분기 추가.
+- 프레임당 처리 한도: MAX_BATCH (남은 이벤트는 다음 프레임).
+"""
+
+from collections import deque
+
+# 이벤트 종류: (종류, 인자 튜플)
+EVT_VEHICLE = "vehicle"  # (vehicle, label, detail_url, timestamp)
+EVT_REMOVED = "removed"  # (removed_ids, label)
+EVT_STATUS = "status"  # (status, details)
+EVT_ERROR = "error"  # (message,)
+EVT_ALERT = "alert"  # (kind, events) — 요약 스케줄러가 정한 알림 단위 (팝업/소리)
+EVT_CONTROL = "control"  # (action,) — "start" | "stop" | "show", 로컬 API·두 번째 실행 등 외부 제어
+
+MAX_BATCH = 500
+
+
+class EventQueue:
+    """잠금 없는 이벤트 큐 (소비자 1개)."""
+
+    def __init__(self):
+        self._items = deque()
+
+    def push(self, kind, *args):
+        """이벤트 추가 (아무 스레드에서나)."""
+        self._items.append((kind, args))
+
+    def drain(self, limit=MAX_BATCH):
+        """쌓인 이벤트를 최대 limit 개 꺼냄 (소비자 스레드 전용)."""
+        items = self._items
+        batch = []
+        popleft = items.popleft
+        while items and len(batch) < limit:
+            batch.append(popleft())
+        return batch
+
+    def __len__(self):
+        return len(self._items)
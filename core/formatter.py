@@ -6,6 +6,7 @@ API 응답의 차량 객체를 사람이 읽을 수 있는 텍스트로 변환.
 - 메시지 형식 변경 시: format_vehicle_text() 수정.
 - API 응답 필드명 변경 시: get_field() 매핑 수정.
 - 가격 표시 방식 변경 시: format_price() 수정.
+- 요약 알림(digest) 형식 변경 시: format_digest() / format_digest_toast() 수정.
 """
 
 
@@ -107,3 +108,44 @@ def format_toast_message(vehicle):
     ext_color = get_field(vehicle, "extCrNm", "exteriorColorName")
     price = get_field(vehicle, "price", "carPrice", default=0)
     return f"{model} {trim}\n{center} | {ext_color}\n{format_price(price)}"
+
+
+def group_digest(events):
+    """요약용 묶음: [(기획전, [(트림, 대수, 최저가), ...]), ...] (발견 순서 유지).
+
+    Args:
+        events: [(vehicle, label, detail_url), ...]
+    """
+    groups = {}
+    for vehicle, label, _ in events:
+        trim = get_field(vehicle, "trimNm", "trimName")
+        price = get_field(vehicle, "price", "carPrice", default=0)
+        trims = groups.setdefault(label, {})
+        count, low = trims.get(trim, (0, 0))
+        if isinstance(price, (int, float)) and price > 0:
+            low = min(low, price) if low else price
+        trims[trim] = (count + 1, low)
+    return [
+        (label, [(trim, count, low) for trim, (count, low) in trims.items()])
+        for label, trims in groups.items()
+    ]
+
+
+def format_digest(events):
+    """요약 알림 본문 (로그/외부 싱크용). 기획전별 대수 + 트림별 대수·최저가."""
+    lines = [f"신규 차량 {len(events)}대 요약"]
+    for label, trims in group_digest(events):
+        lines.append(f"[{label}] {sum(c for _, c, _ in trims)}대")
+        for trim, count, low in trims:
+            low_text = f" (최저 {format_price(low)})" if low else ""
+            lines.append(f"  - {trim} ×{count}{low_text}")
+    return "\n".join(lines)
+
+
+def format_digest_toast(events):
+    """요약 알림용 짧은 메시지 (토스트/팝업, 기획전당 1줄)."""
+    lines = []
+    for label, trims in group_digest(events):
+        parts = ", ".join(f"{trim} {count}" for trim, count, _ in trims)
+        lines.append(f"[{label}] {parts}")
+    return "\n".join(lines)
@@ -0,0 +1,181 @@
+"""
+단일 실행 보장 + 실행 중인 인스턴스로 요청 전달 (IPC)
+잠금 파일로 첫 인스턴스를 정하고, 첫 인스턴스는 127.0.0.1 임의 포트에서 요청을 받는다.
+두 번째 실행은 의도(창 표시, 폴링 시작)를 소켓으로 넘기고 바로 종료한다.
+GUI 프레임워크 의존성 없음 (무거운 모듈 import 전에 호출).
+
+파일 (APP_DATA_DIR):
+    instance.lock   OS 파일 잠금 (프로세스가 죽으면 OS가 자동 해제 → 오래된 잠금 없음)
+    instance.json   {"pid", "port", "token"} — 두 번째 실행이 접속 정보로 사용
+
+프로토콜: 한 줄 JSON {"token", "actions": ["show", "start"]} → 응답 "ok\\n"
+
+[수정 가이드]
+- 동작 추가: ACTION_* 상수 + main.launch_actions() + 받는 쪽 핸들러(app / headless)에 분기.
+- 첫 인스턴스 준비 전 전달된 요청은 set_handler() 시 한 번에 재생.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import secrets
+import logging
+import threading
+
+from core.config import APP_DATA_DIR, save_json
+
+log = logging.getLogger("CasperFinder")
+
+LOCK_PATH = APP_DATA_DIR / "instance.lock"
+INFO_PATH = APP_DATA_DIR / "instance.json"
+
+ACTION_SHOW = "show"  # 창 표시 (트레이에서 복귀)
+ACTION_START = "start"  # 폴링 시작
+
+CONNECT_TIMEOUT = 0.3  # 초, 요청 1회
+FORWARD_WAIT = 1.0  # 초, 첫 인스턴스가 막 시작해 접속 정보가 아직 없을 때 기다리는 최대 시간
+
+
+def _try_lock(fp):
+    """비차단 배타 잠금 (이미 잡혀 있으면 OSError)."""
+    if sys.platform == "win32":
+        import msvcrt
+
+        fp.seek(0)
+        msvcrt.locking(fp.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+class InstanceLock:
+    """첫 인스턴스가 들고 있는 잠금 + 요청 수신 스레드."""
+
+    def __init__(self, lock_fp):
+        self._lock_fp = lock_fp
+        self._token = secrets.token_hex(16)
+        self._handler = None
+        self._pending = []  # 핸들러 연결 전 받은 요청
+        self._mutex = threading.Lock()
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(4)
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._serve, name="instance-ipc", daemon=True).start()
+        save_json(INFO_PATH, {"pid": os.getpid(), "port": self.port, "token": self._token})
+
+    def set_handler(self, fn):
+        """fn(actions: list[str]) — 수신 스레드에서 호출되므로 UI는 큐로 넘길 것."""
+        with self._mutex:
+            self._handler = fn
+            pending, self._pending = self._pending, []
+        if pending:
+            self._dispatch(fn, pending)
+
+    def release(self):
+        """종료 시: 수신 중지 + 접속 정보 삭제 + 잠금 해제."""
+        try:
+            self._server.close()
+        except OSError:
+            pass
+        try:
+            INFO_PATH.unlink()
+        except OSError:
+            pass
+        try:
+            self._lock_fp.close()  # 닫으면 잠금도 해제
+        except OSError:
+            pass
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return  # release()
+            with conn:
+                try:
+                    conn.settimeout(CONNECT_TIMEOUT)
+                    request = json.loads(conn.makefile("r", encoding="utf-8").readline())
+                    if request.get("token") != self._token:
+                        continue
+                    conn.sendall(b"ok\n")
+                except (OSError, ValueError, AttributeError):
+                    continue
+            actions = [a for a in request.get("actions", []) if isinstance(a, str)]
+            log.info(f"[인스턴스] 다른 실행에서 요청 수신: {actions}")
+            with self._mutex:
+                handler = self._handler
+                if handler is None:
+                    self._pending.extend(actions)
+            if handler is not None:
+                self._dispatch(handler, actions)
+
+    @staticmethod
+    def _dispatch(fn, actions):
+        try:
+            fn(actions)
+        except Exception as e:
+            log.error(f"[인스턴스] 요청 처리 실패: {e}")
+
+
+def _forward(actions):
+    """실행 중인 인스턴스에 요청 전달 → 성공 여부."""
+    payload = None
+    deadline = time.monotonic() + FORWARD_WAIT
+    while True:
+        try:
+            with open(INFO_PATH, encoding="utf-8") as f:
+                info = json.load(f)
+            payload = json.dumps({"token": info["token"], "actions": actions}) + "\n"
+            with socket.create_connection(
+                ("127.0.0.1", info["port"]), timeout=CONNECT_TIMEOUT
+            ) as conn:
+                conn.sendall(payload.encode("utf-8"))
+                if conn.makefile("r", encoding="utf-8").readline().strip() == "ok":
+                    return True
+        except (OSError, ValueError, KeyError):
+            pass  # 첫 인스턴스가 아직 접속 정보를 쓰기 전이거나 종료 중
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+def acquire_instance(actions):
+    """첫 인스턴스면 InstanceLock, 이미 실행 중이면 actions 를 넘기고 None.
+
+    None 을 받은 호출자는 바로 종료하면 된다.
+    """
+    APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    lock_fp = open(LOCK_PATH, "a+")
+    try:
+        _try_lock(lock_fp)
+    except OSError:
+        lock_fp.close()
+        if _forward(actions):
+            log.info(f"[인스턴스] 이미 실행 중 — 요청 전달 후 종료: {actions}")
+        else:
+            log.warning("[인스턴스] 이미 실행 중이지만 응답 없음 — 종료")
+        return None
+    try:
+        return InstanceLock(lock_fp)
+    except OSError as e:
+        # 소켓을 못 열어도 잠금은 유지 (중복 실행 방지가 우선)
+        log.warning(f"[인스턴스] 요청 수신 소켓 실패: {e}")
+        return _LockOnly(lock_fp)
+
+
+class _LockOnly:
+    """IPC 없이 잠금만 (소켓 생성 실패 시)."""
+
+    def __init__(self, lock_fp):
+        self._lock_fp = lock_fp
+
+    def set_handler(self, fn):
+        pass
+
+    def release(self):
+        self._lock_fp.close()
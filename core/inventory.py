@@ -0,0 +1,116 @@
+"""
+현재 재고 인덱스
+엔진이 폴링 결과(기획전별 vehicle_map)를 반영하고, 로컬 API 등이 조회·구독한다.
+GUI 프레임워크 의존성 없음. 갱신과 조회 모두 런타임 루프 스레드에서만 (잠금 없음).
+
+이벤트: ("add" | "remove" | "change", vehicle_id, 항목)
+항목: {"id", "exhbNo", "label", "firstSeen", "vehicle"}
+
+[수정 가이드]
+- 조회 조건 추가: query() 의 필터/SORT_KEYS 수정.
+- 변경 판정: update() 에서 차량 dict 전체 비교 (필드 일부만 보려면 여기서 수정).
+"""
+
+import time
+import logging
+
+from core.formatter import get_field
+
+log = logging.getLogger("CasperFinder")
+
+
+def _price(vehicle):
+    price = get_field(vehicle, "price", "carPrice", default=0)
+    return price if isinstance(price, (int, float)) else 0
+
+
+SORT_KEYS = {
+    "price_low": (lambda item: _price(item["vehicle"]), False),
+    "price_high": (lambda item: _price(item["vehicle"]), True),
+    "prod": (
+        lambda item: str(get_field(item["vehicle"], "productionDate", "prodDt", default="")),
+        True,
+    ),
+    "recent": (lambda item: item["firstSeen"], True),
+}
+
+
+class InventoryIndex:
+    """{vehicle_id: 항목} + 변경 버전 번호 (ETag 용)."""
+
+    def __init__(self):
+        self._items = {}
+        self._by_exhb = {}  # {exhb_no: set(vehicle_id)}
+        self.version = 0
+        self._listeners = []
+
+    def subscribe(self, fn):
+        """fn(kind, vehicle_id, item) — 변경마다 호출 (루프 스레드)."""
+        self._listeners.append(fn)
+
+    def unsubscribe(self, fn):
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def update(self, exhb_no, label, vehicle_map, now=None):
+        """한 기획전의 폴링 결과 반영 → 변경 이벤트 수."""
+        now = now or time.time()
+        events = []
+        current = set(vehicle_map)
+        for vid in self._by_exhb.get(exhb_no, set()) - current:
+            item = self._items.pop(vid, None)
+            if item is not None:
+                events.append(("remove", vid, item))
+        for vid, vehicle in vehicle_map.items():
+            item = self._items.get(vid)
+            if item is None:
+                item = {
+                    "id": vid,
+                    "exhbNo": exhb_no,
+                    "label": label,
+                    "firstSeen": now,
+                    "vehicle": vehicle,
+                }
+                self._items[vid] = item
+                events.append(("add", vid, item))
+            elif item["vehicle"] != vehicle:
+                item["vehicle"] = vehicle
+                events.append(("change", vid, item))
+        self._by_exhb[exhb_no] = current
+
+        if events:
+            self.version += 1
+            for kind, vid, item in events:
+                for fn in list(self._listeners):
+                    try:
+                        fn(kind, vid, item)
+                    except Exception as e:
+                        log.error(f"[재고] 구독자 오류: {e}")
+        return len(events)
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, vehicle_id):
+        return self._items.get(vehicle_id)
+
+    def query(self, label=None, trim=None, ext=None, int_color=None, sort=None):
+        """조건(부분 문자열) 필터 + 정렬 → 항목 목록."""
+        items = []
+        for item in self._items.values():
+            v = item["vehicle"]
+            if label and item["label"] != label:
+                continue
+            if trim and trim not in str(get_field(v, "trimNm", "trimName", default="")):
+                continue
+            if ext and ext not in str(get_field(v, "extCrNm", "exteriorColorName", default="")):
+                continue
+            if int_color and int_color not in str(
+                get_field(v, "intCrNm", "interiorColorName", default="")
+            ):
+                continue
+            items.append(item)
+        if sort in SORT_KEYS:
+            key, reverse = SORT_KEYS[sort]
+            items.sort(key=key, reverse=reverse)
+        return items
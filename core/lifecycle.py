@@ -0,0 +1,255 @@
+"""
+차량 생애주기 추적 모듈
+차량 ID별 최초 발견 / 마지막 확인 / 판매(삭제) 시각과 가격 이력을 SQLite에 기록.
+GUI 프레임워크 의존성 없음. PollingEngine의 diff 결과로 증분 갱신.
+observe / flush 는 블로킹(SQLite) — 엔진은 스레드 풀에서 호출 (기획전별 호출이 겹쳐도 잠금으로 직렬화).
+
+[수정 가이드]
+- 기록할 차량 필드 변경: _RECORD_FIELDS 수정.
+- 집계 기준 추가: _GROUP_COLUMNS 에 컬럼 추가 (인덱스도 함께).
+"""
+
+import json
+import time
+import logging
+import threading
+import statistics
+
+from core import db
+from core.formatter import get_field
+
+log = logging.getLogger("CasperFinder")
+
+# 활성 차량 last_seen 을 DB에 반영하는 최소 간격 (변경 이벤트 시에는 즉시 반영)
+FLUSH_INTERVAL = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vehicles (
+    vehicle_id    TEXT PRIMARY KEY,
+    exhb_no       TEXT NOT NULL,
+    label         TEXT NOT NULL DEFAULT '',
+    trim          TEXT NOT NULL DEFAULT '',
+    ext_color     TEXT NOT NULL DEFAULT '',
+    int_color     TEXT NOT NULL DEFAULT '',
+    price         INTEGER NOT NULL DEFAULT 0,
+    first_seen    REAL NOT NULL,
+    last_seen     REAL NOT NULL,
+    removed_at    REAL,
+    record        TEXT NOT NULL DEFAULT '{}',
+    price_history TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_vehicles_removed_trim ON vehicles(removed_at, trim);
+CREATE INDEX IF NOT EXISTS idx_vehicles_removed_ext ON vehicles(removed_at, ext_color);
+CREATE INDEX IF NOT EXISTS idx_vehicles_removed_int ON vehicles(removed_at, int_color);
+CREATE INDEX IF NOT EXISTS idx_vehicles_exhb ON vehicles(exhb_no, removed_at);
+"""
+
+# 마지막 레코드로 보관할 필드: {저장 키: (API 후보 키, ...)}
+_RECORD_FIELDS = {
+    "model": ("modelNm", "carName"),
+    "trim": ("trimNm", "trimName"),
+    "extColor": ("extCrNm", "exteriorColorName"),
+    "intColor": ("intCrNm", "interiorColorName"),
+    "center": ("poName", "deliveryCenterName"),
+    "prodDate": ("productionDate", "prodDt"),
+    "price": ("price", "carPrice"),
+    "discount": ("discountAmt", "crDscntAmt"),
+    "carCode": ("carCode",),
+}
+
+# median_time_to_sale 집계 기준 → 컬럼
+_GROUP_COLUMNS = {
+    "trim": "trim",
+    "ext_color": "ext_color",
+    "int_color": "int_color",
+    "exhb_no": "exhb_no",
+}
+
+# 신규(또는 재등장) 차량: first_seen 은 유지, 가격이 바뀌었으면 이력 추가
+_UPSERT = """
+INSERT INTO vehicles (vehicle_id, exhb_no, label, trim, ext_color, int_color,
+                      price, first_seen, last_seen, removed_at, record, price_history)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, json_array(json_array(?, ?)))
+ON CONFLICT(vehicle_id) DO UPDATE SET
+    exhb_no = excluded.exhb_no,
+    label = excluded.label,
+    trim = excluded.trim,
+    ext_color = excluded.ext_color,
+    int_color = excluded.int_color,
+    last_seen = excluded.last_seen,
+    removed_at = NULL,
+    record = excluded.record,
+    price_history = CASE WHEN vehicles.price != excluded.price
+        THEN json_insert(vehicles.price_history, '$[#]',
+                         json_array(excluded.last_seen, excluded.price))
+        ELSE vehicles.price_history END,
+    price = excluded.price
+"""
+
+_PRICE_CHANGE = """
+UPDATE vehicles SET
+    price = ?,
+    price_history = json_insert(price_history, '$[#]', json_array(?, ?)),
+    record = ?
+WHERE vehicle_id = ?
+"""
+
+
+def compact_record(vehicle):
+    """차량 객체에서 보관용 핵심 필드만 추출."""
+    return {
+        key: get_field(vehicle, *candidates, default="")
+        for key, candidates in _RECORD_FIELDS.items()
+    }
+
+
+def _price_of(item):
+    """차량 객체 또는 compact_record 에서 가격(정수) 추출."""
+    try:
+        return int(get_field(item, "price", "carPrice", default=0) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class LifecycleTracker:
+    """diff 이벤트 기반 차량 생애주기 기록기.
+
+    활성 차량의 가격/마지막 확인 시각은 메모리에 두고,
+    신규·삭제·가격 변경 시 즉시, 그 외에는 FLUSH_INTERVAL 마다 DB에 반영한다.
+    """
+
+    def __init__(self):
+        self._active = {}  # {vehicle_id: [price, last_seen]}
+        self._last_flush = 0.0
+        self._lock = threading.RLock()  # observe/flush 직렬화 (_active 공유)
+        db.ensure_schema("vehicles", _SCHEMA)
+
+    def observe(self, exhb_no, label, vehicle_map, removed_ids=(), now=None):
+        """한 기획전의 폴링 결과 반영.
+
+        Args:
+            vehicle_map: {vehicle_id: 차량 객체} (현재 목록 전체)
+            removed_ids: 이번 diff 에서 사라진 vehicle_id
+        """
+        with self._lock:
+            self._observe(exhb_no, label, vehicle_map, removed_ids, now or time.time())
+
+    def _observe(self, exhb_no, label, vehicle_map, removed_ids, now):
+        upserts, price_changes = [], []
+
+        for vid, vehicle in vehicle_map.items():
+            state = self._active.get(vid)
+            if state is None:
+                record = compact_record(vehicle)
+                price = _price_of(record)
+                upserts.append(
+                    (
+                        vid,
+                        exhb_no,
+                        label,
+                        record["trim"],
+                        record["extColor"],
+                        record["intColor"],
+                        price,
+                        now,
+                        now,
+                        json.dumps(record, ensure_ascii=False),
+                        now,
+                        price,
+                    )
+                )
+                self._active[vid] = [price, now]
+                continue
+
+            state[1] = now
+            price = _price_of(vehicle)
+            if price and price != state[0]:
+                state[0] = price
+                record = compact_record(vehicle)
+                price_changes.append(
+                    (price, now, price, json.dumps(record, ensure_ascii=False), vid)
+                )
+
+        removals = []
+        for vid in removed_ids:
+            state = self._active.pop(vid, None)
+            last_seen = state[1] if state else None
+            removals.append((now, last_seen, vid, exhb_no))
+
+        if not (upserts or price_changes or removals):
+            if now - self._last_flush >= FLUSH_INTERVAL:
+                self.flush(now)
+            return
+
+        try:
+            with db.transaction() as conn:
+                if upserts:
+                    conn.executemany(_UPSERT, upserts)
+                if price_changes:
+                    conn.executemany(_PRICE_CHANGE, price_changes)
+                if removals:
+                    conn.executemany(
+                        "UPDATE vehicles SET removed_at = ?, "
+                        "last_seen = COALESCE(?, last_seen) "
+                        "WHERE vehicle_id = ? AND exhb_no = ? AND removed_at IS NULL",
+                        removals,
+                    )
+                self._write_last_seen(conn)
+            self._last_flush = now
+        except Exception as e:
+            log.error(f"[생애주기] 기록 실패: {e}")
+
+    def flush(self, now=None):
+        """활성 차량 last_seen 일괄 반영."""
+        with self._lock:
+            try:
+                with db.transaction() as conn:
+                    self._write_last_seen(conn)
+                self._last_flush = now or time.time()
+            except Exception as e:
+                log.error(f"[생애주기] last_seen 반영 실패: {e}")
+
+    def _write_last_seen(self, conn):
+        if self._active:
+            conn.executemany(
+                "UPDATE vehicles SET last_seen = ? WHERE vehicle_id = ?",
+                [(state[1], vid) for vid, state in self._active.items()],
+            )
+
+
+def median_time_to_sale(days=30, group_by="trim"):
+    """최근 N일 내 판매(삭제)된 차량의 그룹별 판매 소요 시간 중앙값.
+
+    Returns:
+        {그룹 값: {"count": int, "median_hours": float}}
+    """
+    column = _GROUP_COLUMNS.get(group_by)
+    if column is None:
+        raise ValueError(f"지원하지 않는 집계 기준: {group_by}")
+    db.ensure_schema("vehicles", _SCHEMA)
+
+    since = time.time() - days * 86400
+    rows = db.query(
+        f"SELECT {column} AS grp, removed_at - first_seen AS dur FROM vehicles "
+        "WHERE removed_at >= ?",
+        (since,),
+    )
+    durations = {}
+    for row in rows:
+        durations.setdefault(row["grp"], []).append(row["dur"])
+    return {
+        grp: {"count": len(vals), "median_hours": statistics.median(vals) / 3600}
+        for grp, vals in durations.items()
+    }
+
+
+def get_vehicle(vehicle_id):
+    """차량 생애주기 레코드 1건 (없으면 None)."""
+    db.ensure_schema("vehicles", _SCHEMA)
+    rows = db.query("SELECT * FROM vehicles WHERE vehicle_id = ?", (vehicle_id,))
+    if not rows:
+        return None
+    item = dict(rows[0])
+    item["record"] = json.loads(item["record"])
+    item["price_history"] = json.loads(item["price_history"])
+    return item
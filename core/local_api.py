@@ -0,0 +1,258 @@
+"""
+로컬 HTTP / WebSocket API (읽기 전용 + 폴링 제어)
+같은 PC의 다른 도구가 현재 재고·히스토리·이벤트를 가져갈 수 있도록 127.0.0.1 에서만 연다.
+GUI 프레임워크 의존성 없음 (공유 런타임 루프에서 aiohttp 서버 실행).
+
+엔드포인트:
+    GET  /status                  모니터링 상태, 폴링 횟수, 재고 대수, 규칙별 일치 횟수
+    GET  /vehicles                현재 재고 (label, trim, ext, int, sort=price_low|price_high|prod|recent)
+                                  ETag 지원 — 변화 없으면 304 (본문 없음)
+    GET  /history                 알림 히스토리 (page, pageSize, label, trim, since)
+    GET  /events  (WebSocket)     {"type": "add"|"remove"|"change", "id", "item"} 실시간 스트림
+    POST /polling/start | /polling/stop
+
+설정 (config.json "localApi"): {"enabled": false, "port": 8765, "token": ""}
+    token 지정 시 모든 요청에 "Authorization: Bearer <token>" (또는 ?token=) 필요.
+
+브라우저 차단: Host 가 127.0.0.1:<port> / localhost:<port> 가 아니거나(DNS 리바인딩)
+Origin 헤더가 있으면(웹 페이지가 보낸 요청) 403. 로컬 도구는 Origin 을 보내지 않는다.
+
+[수정 가이드]
+- 엔드포인트 추가: LocalApiServer._build_app() 에 라우트 추가.
+- 느린 WebSocket 클라이언트 기준: SEND_BUFFER (넘치면 연결 종료).
+"""
+
+import asyncio
+import hmac
+import logging
+import time
+import zlib
+
+from aiohttp import web, WSMsgType
+
+from core.config import load_config
+from core.runtime import get_runtime
+from core.storage import query_history
+
+log = logging.getLogger("CasperFinder")
+
+DEFAULT_PORT = 8765
+HOST = "127.0.0.1"  # 외부 노출 금지
+SEND_BUFFER = 256  # 클라이언트별 미전송 이벤트 한도 — 넘치면 느린 클라이언트로 보고 연결 종료
+MAX_PAGE_SIZE = 500
+
+
+class _EventClient:
+    """WebSocket 클라이언트 1개: 전송 버퍼 + 전송 작업."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.queue = asyncio.Queue(maxsize=SEND_BUFFER)
+
+    def offer(self, event):
+        """이벤트 넣기 (버퍼가 차면 False)."""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def pump(self):
+        try:
+            while True:
+                await self.ws.send_json(await self.queue.get())
+        except (ConnectionError, RuntimeError):
+            pass  # 연결 종료 — 수신 루프(_events)가 정리
+
+
+class LocalApiServer:
+    """engine(PollingEngine) 의 재고 인덱스를 제공하는 로컬 서버."""
+
+    def __init__(self, engine, port=DEFAULT_PORT, token="", controls=None):
+        """
+        Args:
+            engine: PollingEngine (inventory, is_running, poll_count 사용)
+            controls: {"start": fn, "stop": fn} — 폴링 제어 (생략 시 engine.start/stop)
+        """
+        self.engine = engine
+        self.port = port
+        self.token = token
+        self.controls = controls or {"start": engine.start, "stop": engine.stop}
+        self._clients = set()
+        self._runner = None
+        self._epoch = int(time.time())  # 재시작 후 버전 번호가 겹쳐도 ETag 가 달라지도록
+
+    # ── 수명 ──
+
+    async def start(self):
+        app = self._build_app()
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, HOST, self.port)
+        await site.start()
+        if not self.port:  # 0 → 임의 포트 (테스트용)
+            self.port = site._server.sockets[0].getsockname()[1]
+        self.engine.inventory.subscribe(self._on_inventory)
+        log.info(f"[로컬 API] http://{HOST}:{self.port} 시작")
+
+    async def stop(self):
+        self.engine.inventory.unsubscribe(self._on_inventory)
+        clients, self._clients = list(self._clients), set()
+        await asyncio.gather(
+            *(client.ws.close(code=1001) for client in clients), return_exceptions=True
+        )
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _build_app(self):
+        app = web.Application(middlewares=[self._local_only, self._auth])
+        app.router.add_get("/status", self._status)
+        app.router.add_get("/vehicles", self._vehicles)
+        app.router.add_get("/history", self._history)
+        app.router.add_get("/events", self._events)
+        app.router.add_post("/polling/start", self._polling_start)
+        app.router.add_post("/polling/stop", self._polling_stop)
+        return app
+
+    @web.middleware
+    async def _local_only(self, request, handler):
+        """같은 PC의 도구만 허용 — 웹 페이지(리바인딩된 도메인 / 교차 출처)의 요청 거부."""
+        allowed = (f"{HOST}:{self.port}", f"localhost:{self.port}")
+        if request.headers.get("Host", "").lower() not in allowed:
+            raise web.HTTPForbidden(text="허용되지 않은 Host")
+        if "Origin" in request.headers:
+            raise web.HTTPForbidden(text="브라우저 요청 차단")
+        return await handler(request)
+
+    @web.middleware
+    async def _auth(self, request, handler):
+        if self.token:
+            header = request.headers.get("Authorization", "")
+            given = header[7:] if header.startswith("Bearer ") else request.query.get("token")
+            # 상수 시간 비교 (바이트로 비교 → 비ASCII 토큰도 TypeError 없음)
+            if not hmac.compare_digest((given or "").encode(), self.token.encode()):
+                raise web.HTTPUnauthorized()
+        return await handler(request)
+
+    # ── 읽기 ──
+
+    async def _status(self, request):
+        return web.json_response(
+            {
+                "running": self.engine.is_running,
+                "pollCount": self.engine.poll_count,
+                "vehicles": len(self.engine.inventory),
+                "version": self.engine.inventory.version,
+                "rules": self.engine.rules.stats(),
+            }
+        )
+
+    async def _vehicles(self, request):
+        q = request.query
+        # 같은 조건 + 같은 재고 버전이면 본문이 같음 → 조회/직렬화 없이 304
+        version = self.engine.inventory.version
+        etag = f'"{self._epoch:x}-{version}-{zlib.crc32(request.query_string.encode()):x}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        items = self.engine.inventory.query(
+            label=q.get("label"),
+            trim=q.get("trim"),
+            ext=q.get("ext"),
+            int_color=q.get("int"),
+            sort=q.get("sort"),
+        )
+        return web.json_response(
+            {"count": len(items), "items": items}, headers={"ETag": etag}
+        )
+
+    async def _history(self, request):
+        q = request.query
+        try:
+            page = max(int(q.get("page", 1)), 1)
+            page_size = min(max(int(q.get("pageSize", 50)), 1), MAX_PAGE_SIZE)
+            since = float(q["since"]) if "since" in q else None
+        except ValueError:
+            raise web.HTTPBadRequest(text="page/pageSize/since 는 숫자")
+        items, total = await get_runtime().to_thread(
+            lambda: query_history(
+                page, page_size, label=q.get("label"), trim=q.get("trim"), since=since
+            )
+        )
+        return web.json_response({"total": total, "page": page, "items": items})
+
+    # ── 이벤트 스트림 ──
+
+    async def _events(self, request):
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        client = _EventClient(ws)
+        self._clients.add(client)
+        pump = asyncio.get_running_loop().create_task(client.pump())
+        try:
+            async for msg in ws:  # 클라이언트 → 서버 메시지는 무시 (종료 감지용)
+                if msg.type == WSMsgType.ERROR:
+                    break
+        finally:
+            self._clients.discard(client)
+            pump.cancel()
+        return ws
+
+    def _on_inventory(self, kind, vehicle_id, item):
+        # 큐에 쌓인 이벤트가 이후 변경에 영향받지 않도록 얕은 복사본 전달
+        item = dict(item) if item is not None else None
+        event = {"type": kind, "id": vehicle_id, "item": item}
+        for client in list(self._clients):
+            if not client.offer(event):
+                # 느린 클라이언트: 버퍼 초과 → 연결 종료 (다른 클라이언트/폴링에 영향 없음)
+                self._clients.discard(client)
+                log.warning("[로컬 API] 느린 이벤트 클라이언트 연결 종료")
+                asyncio.get_running_loop().create_task(
+                    client.ws.close(code=1008, message=b"send buffer overflow")
+                )
+
+    # ── 제어 ──
+
+    async def _polling_start(self, request):
+        self.controls["start"]()
+        return web.json_response({"ok": True})
+
+    async def _polling_stop(self, request):
+        self.controls["stop"]()
+        return web.json_response({"ok": True})
+
+
+_server = None
+
+
+def start_local_api(engine, controls=None):
+    """config.localApi.enabled 면 서버 시작 (아무 스레드에서나, 결과를 기다리지 않음)."""
+    global _server
+    cfg = load_config().get("localApi", {})
+    if not cfg.get("enabled") or _server is not None:
+        return None
+    _server = LocalApiServer(
+        engine,
+        port=cfg.get("port", DEFAULT_PORT),
+        token=cfg.get("token", ""),
+        controls=controls,
+    )
+
+    def _done(future):
+        if future.exception():
+            log.error(f"[로컬 API] 시작 실패: {future.exception()}")
+
+    get_runtime().submit(_server.start()).add_done_callback(_done)
+    return _server
+
+
+def stop_local_api(timeout=2.0):
+    """서버 종료 (종료 시, 시작된 적 없으면 무시)."""
+    global _server
+    if _server is None:
+        return
+    server, _server = _server, None
+    try:
+        get_runtime().submit(server.stop()).result(timeout)
+    except Exception as e:
+        log.warning(f"[로컬 API] 종료 실패: {e}")
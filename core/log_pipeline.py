@@ -0,0 +1,185 @@
+"""
+로깅 파이프라인 (QueueHandler → 단일 리스너 스레드 → 싱크)
+GUI 프레임워크 의존성 없음.
+
+- 모든 생산자 스레드(UI, 폴링 엔진, aiohttp 등)는 레코드를 큐에 넣기만 한다.
+- 리스너 스레드 하나가 콘솔 / 회전+gzip 압축 파일 / (선택) JSON 파일 / UI 싱크로 분배.
+- 메시지 포맷(%-args 치환)은 싱크가 실제로 출력할 때 리스너 스레드에서 수행.
+
+[수정 가이드]
+- 새 출력 대상 추가: add_sink(handler) (UI 핸들러도 이 방식으로 등록).
+- 파일 크기/보관 개수: LOG_MAX_BYTES, LOG_BACKUP_COUNT.
+- 파일에 남기지 않을 대용량 디버그 로그: CONSOLE_ONLY_PREFIXES (콘솔에만 출력).
+"""
+
+import os
+import gzip
+import json
+import queue
+import atexit
+import shutil
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from core.config import APP_DATA_DIR
+
+LOG_DIR = APP_DATA_DIR / "logs"
+LOG_FILE = LOG_DIR / "casperfinder.log"
+JSON_LOG_FILE = LOG_DIR / "casperfinder.jsonl"
+LOG_MAX_BYTES = 2 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+CONSOLE_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+FILE_FORMAT = "%(asctime)s [%(levelname)s] (%(threadName)s) %(message)s"
+
+# API 요청/응답 전문 — 폴링마다 수십 KB 라 파일 로그에서는 제외 (콘솔 디버깅용)
+CONSOLE_ONLY_PREFIXES = ("[API] BODY:", "[API] PAYLOAD:")
+
+_listener = None
+
+
+class LazyJson:
+    """로그 인자용 JSON 래퍼. 싱크가 메시지를 만들 때만 직렬화된다.
+
+    예: log.info("[API] PAYLOAD: %s", LazyJson(payload))
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return json.dumps(self.obj, ensure_ascii=False)
+
+
+class _EnqueueHandler(QueueHandler):
+    """큐에 레코드를 그대로 넣는 핸들러 (생산자 스레드에서 포맷하지 않음).
+
+    기본 QueueHandler.prepare()는 메시지를 미리 포맷하지만,
+    같은 프로세스 내 큐이므로 포맷은 리스너 스레드로 미룬다.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class _ConsoleOnlyFilter(logging.Filter):
+    """CONSOLE_ONLY_PREFIXES 로 시작하는 레코드를 파일 싱크에서 제외.
+
+    포맷 전 문자열(record.msg)만 보므로 걸러진 레코드는 직렬화되지 않는다.
+    """
+
+    def filter(self, record):
+        msg = record.msg
+        return not (isinstance(msg, str) and msg.startswith(CONSOLE_ONLY_PREFIXES))
+
+
+class _GzipRotatingFileHandler(RotatingFileHandler):
+    """크기 기준 회전 + 회전된 파일 gzip 압축 (casperfinder.log.1.gz ...)."""
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = _gzip_rotator
+
+
+def _gzip_rotator(source, dest):
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 레코드 하나씩 JSON 으로 출력 (구조화 로그)."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(level=logging.INFO, json_log=False):
+    """루트 로거를 큐 파이프라인으로 구성하고 리스너 스레드 시작. 중복 호출 시 무시."""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(CONSOLE_FORMAT, datefmt="%H:%M:%S"))
+    sinks = [console]
+
+    file_error = None
+    try:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        file_handler = _GzipRotatingFileHandler(
+            LOG_FILE,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+        file_handler.addFilter(_ConsoleOnlyFilter())
+        sinks.append(file_handler)
+
+        if json_log:
+            json_handler = _GzipRotatingFileHandler(
+                JSON_LOG_FILE,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding="utf-8",
+            )
+            json_handler.setFormatter(JsonFormatter())
+            json_handler.addFilter(_ConsoleOnlyFilter())
+            sinks.append(json_handler)
+    except OSError as e:
+        file_error = e
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_EnqueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    if file_error:
+        logging.getLogger("CasperFinder").warning(
+            "[로그] 파일 로그 비활성화: %s", file_error
+        )
+    return _listener
+
+
+def add_sink(handler):
+    """리스너에 출력 대상 추가 (UI 핸들러 등). 파이프라인 미구성 시 로거에 직접 연결."""
+    if _listener is None:
+        logging.getLogger().addHandler(handler)
+        return
+    # QueueListener.handle()은 매번 self.handlers 를 순회 → 튜플 교체로 원자적 추가
+    _listener.handlers = _listener.handlers + (handler,)
+
+
+def remove_sink(handler):
+    if _listener is None:
+        logging.getLogger().removeHandler(handler)
+        return
+    _listener.handlers = tuple(h for h in _listener.handlers if h is not handler)
+
+
+def shutdown_logging():
+    """남은 레코드를 모두 내보내고 리스너 종료 (종료 시 호출)."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
@@ -0,0 +1,97 @@
+"""
+설정 마이그레이션 모듈
+config.json 을 버전(configVersion) 단위로 한 번씩만 갱신한다.
+GUI 프레임워크 의존성 없음. core.config 에서 시작 시 1회 호출.
+
+[수정 가이드]
+- 기획전 코드가 바뀌면: TARGET_EXHB_NOS 수정 (기본 설정 core.config.DEFAULT_CONFIG 도 이 값 사용)
+  + MIGRATIONS 끝에 새 버전 추가 (예: (4, "...", set_target_exhb_nos(TARGET_EXHB_NOS))).
+  이미 적용된 버전 번호/순서는 수정하지 말 것 (사용자 config 에는 다시 적용되지 않음).
+- 기획전 타입별 지역 설정 종류: core.regions.EXHB_REGION_KINDS 수정
+  (사용하지 않는 지역 필드는 TYPE_CLEARED_FIELDS 로 자동 계산).
+"""
+
+from core.regions import EXHB_REGION_KINDS, REGION_FIELDS
+
+# 현재 대상 기획전 코드 (특별기획전, 전시차, 리퍼브 순) — 기본 설정과 마이그레이션 공용
+TARGET_EXHB_NOS = ("E20260277", "D0003", "R0003")
+
+# 기획전 타입(코드 첫 글자)별 사용하지 않는 필드
+# R(리퍼브): 보조금 설정 없음 / D(전시차): 배송지 설정 없음
+TYPE_CLEARED_FIELDS = {
+    exhb_type: tuple(
+        field
+        for kind, fields in REGION_FIELDS.items()
+        if kind not in kinds
+        for field in fields
+    )
+    for exhb_type, kinds in EXHB_REGION_KINDS.items()
+}
+
+# defaultPayload: 항상 이 값으로 고정 (poller가 carCode별 개별 호출하므로)
+PAYLOAD_FORCED = {"carCode": "", "sortCode": "10"}
+# defaultPayload: 키가 없을 때만 보충 (사용자 설정 존중)
+PAYLOAD_OPTIONAL = {
+    "subsidyRegion": "",
+    "deliveryAreaCode": "",
+    "deliveryLocalAreaCode": "",
+}
+
+
+def clear_type_fields(config):
+    """기획전 타입에 맞지 않는 필드를 비운다."""
+    for target in config.get("targets", []):
+        fields = TYPE_CLEARED_FIELDS.get(target.get("exhbNo", "")[:1], ())
+        for field in fields:
+            if target.get(field, "") != "":
+                target[field] = ""
+
+
+def set_target_exhb_nos(exhb_nos):
+    """대상 기획전 코드를 순서대로 덮어쓰는 마이그레이션 단계 생성.
+
+    기존 대상의 지역 설정은 유지하고, 바뀐 기획전 타입에 맞지 않는 필드만 비운다.
+    """
+
+    def step(config):
+        targets = config.get("targets", [])
+        for target, exhb_no in zip(targets, exhb_nos):
+            target["exhbNo"] = exhb_no
+        clear_type_fields(config)
+
+    return step
+
+
+def normalize_payload(config):
+    """defaultPayload 고정 키 초기화 + 누락 키 보충."""
+    payload = config.setdefault("api", {}).setdefault("defaultPayload", {})
+    payload.update(PAYLOAD_FORCED)
+    for key, val in PAYLOAD_OPTIONAL.items():
+        payload.setdefault(key, val)
+
+
+# (버전, 설명, 단계 함수) — 버전 오름차순, 적용된 버전은 변경 금지
+MIGRATIONS = (
+    (1, "기획전 코드 동기화", set_target_exhb_nos(TARGET_EXHB_NOS)),
+    (2, "기획전 타입별 불필요 필드 정리", clear_type_fields),
+    (3, "defaultPayload 키 정리", normalize_payload),
+)
+
+CURRENT_VERSION = MIGRATIONS[-1][0]
+
+
+def migrate_config(config):
+    """configVersion 이후의 단계만 순서대로 적용 (config 를 직접 수정).
+
+    Returns:
+        적용된 버전 목록 (비어 있으면 변경 없음)
+    """
+    version = config.get("configVersion", 0)
+    applied = []
+    for step_version, _desc, step in MIGRATIONS:
+        if step_version <= version:
+            continue
+        step(config)
+        config["configVersion"] = step_version
+        applied.append(step_version)
+    return applied
@@ -1,24 +1,47 @@
 """
-폴링 엔진 (순수 threading 기반)
+폴링 엔진 (공유 비동기 런타임 기반)
 GUI 프레임워크 의존성 없음. 콜백으로 UI에 결과 전달.
+폴링 루프는 core.runtime 루프 스레드의 작업 1개, 파일/토스트 등 블로킹 작업은 스레드 풀.
 """
 
 import asyncio
 import logging
 import random
+import statistics
 import threading
 import time
+import webbrowser
 
 import aiohttp
 
-from core.config import load_config
+from core.config import load_config, BASE_DIR
 from core.storage import load_known_vehicles, save_known_vehicles
 from core.api import fetch_exhibition, extract_vehicle_id
 from core.formatter import (
+    get_field,
     format_vehicle_text,
     format_toast_message,
+    format_digest,
+    format_digest_toast,
 )
 from core.notifier import send_toast
+from core.lifecycle import LifecycleTracker
+from core.timeseries import TimeSeriesStore
+from core.inventory import InventoryIndex
+from core.runtime import get_runtime
+from core.sinks import get_dispatcher, vehicle_message, digest_message
+from core.digest import DigestScheduler, ALERT_VEHICLE, DEFAULT_WINDOW
+from core.rules import (
+    RuleSet,
+    load_rule_stats,
+    save_rule_stats,
+    ACTION_TOAST,
+    ACTION_SOUND,
+    ACTION_OPEN,
+    ACTION_WEBHOOK,
+    ACTION_SUPPRESS,
+)
+from core.sound import play_alert
 
 log = logging.getLogger("CasperFinder")
 
@@ -41,6 +64,24 @@ def _is_target_vehicle(vehicle):
     return car_code in _TARGET_CAR_CODES
 
 
+def _inventory_metrics(vehicle_map):
+    """재고 추이 지표: 대수, 최저가, 중앙가, 최대 할인액."""
+    prices, discounts = [], []
+    for v in vehicle_map.values():
+        price = get_field(v, "price", "carPrice", default=0)
+        discount = get_field(v, "discountAmt", "crDscntAmt", default=0)
+        if isinstance(price, (int, float)) and price > 0:
+            prices.append(price)
+        if isinstance(discount, (int, float)):
+            discounts.append(discount)
+    return {
+        "count": len(vehicle_map),
+        "min_price": min(prices) if prices else None,
+        "median_price": statistics.median(prices) if prices else None,
+        "max_discount": max(discounts) if discounts else None,
+    }
+
+
 class PollingEngine:
     """콜백 방식 폴링 엔진."""
 
@@ -48,22 +89,33 @@ class PollingEngine:
         self.known_vehicles = {}
         self.poll_count = 0
         self._stop_flag = False
-        self._thread = None
+        self._future = None  # 런타임 루프의 폴링 작업
+        self._task = None  # 같은 작업의 asyncio.Task (종료 시 루프에서 취소/대기)
+        self._save_lock = threading.Lock()  # known_vehicles 저장 직렬화
+        self._known_snapshot = None  # 저장 대기 중인 최신 스냅샷
+        self.lifecycle = LifecycleTracker()  # 차량별 발견/판매 시각 기록
+        self.timeseries = TimeSeriesStore()  # 기획전별 재고/가격 추이
+        self.notify = None  # 외부 알림 싱크 (웹훅/텔레그램/디스코드), start() 시 연결
+        self.digest = DigestScheduler()  # 몰림 시 알림 요약 (루프 스레드 전용)
+        self.inventory = InventoryIndex()  # 현재 재고 (로컬 API 조회/구독, 루프 스레드 전용)
+        self.rules = RuleSet()  # 사용자 알림 규칙 (config alertRules, start() 시 컴파일)
+        self._sound_settings = {}
 
         # 콜백 (UI에서 설정)
         self.on_log = None  # (msg: str) -> None
         self.on_notification = None  # (vehicle: dict, label: str, url: str) -> None
         self.on_vehicle_removed = None  # (removed_ids: set, label: str) -> None
+        self.on_alert = None  # (kind: "vehicle"|"digest", events: list) -> None
         self.on_poll_count = None  # (count: int) -> None
         self.on_server_status = None  # (status: str, details: dict) -> None
 
     @property
     def is_running(self):
-        return self._thread is not None and self._thread.is_alive()
+        return self._future is not None and not self._future.done()
 
     def start(self):
         if self.is_running:
-            # 이미 스레드가 돌아가고 있다면 중지 플래그만 내리고 복귀
+            # 이미 폴링 작업이 돌고 있다면 중지 플래그만 내리고 복귀
             if self._stop_flag:
                 self._stop_flag = False
                 self._emit_log("[시스템] 모니터링 재개")
@@ -71,23 +123,66 @@ class PollingEngine:
 
         self._stop_flag = False
         self.known_vehicles = load_known_vehicles()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self.notify = get_dispatcher()
+        config = load_config()
+        self.digest.window = config.get("alertDigest", {}).get("window", DEFAULT_WINDOW)
+        self.rules = RuleSet.from_config(config.get("alertRules", []), load_rule_stats())
+        self._sound_settings = config.get("appSettings", {})
+        if self.rules:
+            self._emit_log("[규칙] %d개 적용", len(self.rules))
+        self._future = get_runtime().submit(self._run())
         self._emit_log("[시스템] 모니터링 시작")
 
     def stop(self):
         self._stop_flag = True
+        if self.is_running:
+            # 창이 끝나길 기다리던 요약은 바로 발송 (digest 는 루프 스레드 전용)
+            get_runtime().call_soon(lambda: self._emit_alerts(self.digest.flush()))
+        # 생애주기/시계열/규칙 통계 flush 는 폴링 작업이 끝난 뒤 _run 에서 (기록과 겹치지 않음)
         self._emit_log("[시스템] 모니터링 중지")
 
-    def _run(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    def shutdown(self, timeout=5.0):
+        """앱 종료 시: 중지 + 남은 요약 발송 + 기록 flush 완료까지 대기.
+
+        외부 싱크(close_notify)/런타임(shutdown_runtime)을 닫기 전에 호출 (아무 스레드에서나).
+        """
+        self._stop_flag = True
+        if not self.is_running:
+            return
+        try:
+            get_runtime().submit(self._shutdown()).result(timeout)
+        except Exception as e:
+            log.warning(f"[시스템] 폴링 종료 정리 실패: {e!r}")
+
+    async def _shutdown(self):
+        self._emit_alerts(self.digest.flush())
+        task = self._task
+        if task is not None and not task.done():
+            task.cancel()  # _run 의 finally 에서 기록 flush
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self):
+        self._task = asyncio.current_task()
+        runtime = get_runtime()
+        await runtime.to_thread(self.timeseries.prune)
         try:
-            loop.run_until_complete(self._poll_loop())
+            await self._poll_loop()
         except Exception as e:
-            self._emit_log(f"[에러] 폴링 루프: {e}")
+            self._emit_log("[에러] 폴링 루프: %s", e)
         finally:
-            loop.close()
+            # 중지/종료(취소) 시: 마지막 기록 이후 스레드 풀에서 한 번에 flush
+            await runtime.to_thread(self._flush_records)
+
+    def _flush_records(self):
+        self.lifecycle.flush()
+        self.timeseries.flush()
+        save_rule_stats(self.rules)
+
+    def _record_history(self, exhb_no, label, vehicle_map, removed_ids):
+        """생애주기(SQLite) + 시계열(파일) 기록 — 블로킹, 스레드 풀 전용."""
+        self.lifecycle.observe(exhb_no, label, vehicle_map, removed_ids)
+        if self.timeseries.record(exhb_no, _inventory_metrics(vehicle_map)):
+            self.timeseries.write_pending()
 
     async def _poll_loop(self):
 
@@ -130,6 +225,8 @@ class PollingEngine:
                         status = "장애"
                     self.on_server_status(status, details)
 
+                self._emit_alerts(self.digest.due())
+
                 self.poll_count += 1
                 if self.on_poll_count:
                     self.on_poll_count(self.poll_count)
@@ -174,7 +271,7 @@ class PollingEngine:
         elapsed_ms = int((time.perf_counter() - start) * 1000)
 
         if not any_success:
-            self._emit_log(f"[{label}] 전체 실패 — {last_error}")
+            self._emit_log("[%s] 전체 실패 — %s", label, last_error)
             return False, last_error
 
         # 중복 제거 (vehicleId 기준)
@@ -189,59 +286,129 @@ class PollingEngine:
                 vehicle_map[vid] = v
 
         # 로그: 각 코드별 결과 + 병합 결과
-        codes_summary = " | ".join(code_results)
         self._emit_log(
-            f"[{label}] {codes_summary} → 합계 {len(current_ids)}대 ({elapsed_ms}ms)"
+            "[%s] %s → 합계 %d대 (%dms)",
+            label,
+            " | ".join(code_results),
+            len(current_ids),
+            elapsed_ms,
         )
 
+        removed_ids = set(self.known_vehicles.get(exhb_no, [])) - current_ids
+        self.inventory.update(exhb_no, label, vehicle_map)
         self._diff_vehicles(exhb_no, label, current_ids, vehicle_map, total)
+        # 디스크 기록은 알림 이후 스레드 풀에서 (루프는 인증/싱크/로컬 API 계속 처리)
+        await get_runtime().to_thread(
+            self._record_history, exhb_no, label, vehicle_map, removed_ids
+        )
         return True, elapsed_ms
 
     def _diff_vehicles(self, exhb_no, label, current_ids, vehicle_map, total):
         prev_ids = set(self.known_vehicles.get(exhb_no, []))
+        removed_ids = prev_ids - current_ids
 
         if exhb_no not in self.known_vehicles:
             self.known_vehicles[exhb_no] = list(current_ids)
-            save_known_vehicles(self.known_vehicles)
+            self._save_known()
             self._emit_log(
-                f"[{label}] 초기화 — {len(current_ids)}대 등록 (total: {total})"
+                "[%s] 초기화 — %d대 등록 (total: %s)", label, len(current_ids), total
             )
             return
 
         new_ids = current_ids - prev_ids
-        removed_ids = prev_ids - current_ids
         changed = False
 
         if new_ids:
-            self._emit_log(f"[{label}] 🚗 신규 {len(new_ids)}대 발견!")
+            self._emit_log("[%s] 🚗 신규 %d대 발견!", label, len(new_ids))
             for vid in new_ids:
                 vehicle = vehicle_map.get(vid, {"vehicleId": vid})
                 text, detail_url = format_vehicle_text(vehicle, label)
                 self._emit_log(text)
                 if self.on_notification:
                     self.on_notification(vehicle, label, detail_url)
-                send_toast(
-                    title=f"[{label}] 신규 차량 발견",
-                    message=format_toast_message(vehicle),
-                    action_url=detail_url,
-                )
+                # 규칙 동작은 기본 알림에 더해 실행 ("suppress" 규칙에 일치할 때만 기본 알림 생략)
+                matched = self.rules.evaluate(vehicle, label)
+                if matched:
+                    self._run_rule_actions(matched, vehicle, label, detail_url)
+                if not any(ACTION_SUPPRESS in rule.actions for rule in matched):
+                    self._emit_alerts(self.digest.add(vehicle, label, detail_url))
             changed = True
 
         if removed_ids:
-            self._emit_log(f"[{label}] {len(removed_ids)}대 판매/삭제됨")
+            self._emit_log("[%s] %d대 판매/삭제됨", label, len(removed_ids))
             if self.on_vehicle_removed:
                 self.on_vehicle_removed(removed_ids, label)
             changed = True
 
         if changed:
             self.known_vehicles[exhb_no] = list(current_ids)
-            save_known_vehicles(self.known_vehicles)
+            self._save_known()
         else:
             self._emit_log(
-                f"[{label}] 변경 없음 ({len(current_ids)}대, total: {total})"
+                "[%s] 변경 없음 (%d대, total: %s)", label, len(current_ids), total
             )
 
-    def _emit_log(self, msg):
-        log.info(msg)
+    def _emit_alerts(self, alerts):
+        """즉시/요약 알림 발송: 알림마다 토스트 1회 + 외부 싱크 1건 + UI 콜백."""
+        for kind, events in alerts:
+            if kind == ALERT_VEHICLE:
+                vehicle, label, detail_url = events[0]
+                title = f"[{label}] 신규 차량 발견"
+                message, url = format_toast_message(vehicle), detail_url
+                # 외부 싱크는 큐에 넣기만 함 (전송은 싱크별 워커)
+                self.notify.publish(vehicle_message(vehicle, label, detail_url))
+            else:
+                title = f"신규 차량 {len(events)}대 (요약)"
+                message, url = format_digest_toast(events), None
+                self.notify.publish(digest_message(events))
+                self._emit_log("[알림] %s", format_digest(events))
+            # 토스트 표시는 블로킹 (외부 프로세스) → 스레드 풀
+            get_runtime().run_blocking(send_toast, title, message, url)
+            if self.on_alert:
+                self.on_alert(kind, events)
+
+    def _run_rule_actions(self, rules, vehicle, label, detail_url):
+        """일치한 규칙들의 동작을 합쳐 한 번씩 실행 (같은 차량에 토스트 2회 등 없음)."""
+        names = ", ".join(rule.name for rule in rules)
+        actions = {action for rule in rules for action in rule.actions}
+        self._emit_log("[규칙] %s 일치 → %s", names, ", ".join(sorted(actions)) or "동작 없음")
+        runtime = get_runtime()
+        if ACTION_TOAST in actions:
+            runtime.run_blocking(
+                send_toast, f"[{names}] 조건 일치", format_toast_message(vehicle), detail_url
+            )
+        if ACTION_SOUND in actions and self._sound_settings.get("soundEnabled", True):
+            runtime.run_blocking(
+                play_alert,
+                str(BASE_DIR / "assets" / "alert.mp3"),
+                self._sound_settings.get("soundVolume", 80),
+            )
+        if ACTION_OPEN in actions:
+            runtime.run_blocking(webbrowser.open, detail_url)
+        if ACTION_WEBHOOK in actions:
+            message = vehicle_message(vehicle, label, detail_url)
+            message["title"] = f"[{names}] {message['title']}"
+            message["rules"] = [rule.name for rule in rules]
+            self.notify.publish(message)
+
+    def _save_known(self):
+        """known_vehicles 파일 저장 예약 (스레드 풀). 밀린 저장은 최신 상태 1회로 합침."""
+        snapshot = {k: list(v) for k, v in self.known_vehicles.items()}
+        with self._save_lock:
+            self._known_snapshot = snapshot
+        get_runtime().run_blocking(self._write_known)
+
+    def _write_known(self):
+        with self._save_lock:
+            snapshot, self._known_snapshot = self._known_snapshot, None
+            if snapshot is not None:
+                save_known_vehicles(snapshot)
+
+    def _emit_log(self, msg, *args):
+        """로그 기록. %-스타일 args 는 싱크가 출력할 때 치환된다 (지연 포맷).
+
+        on_log 콜백(선택)은 포맷된 문자열을 즉시 받는다.
+        """
+        log.info(msg, *args)
         if self.on_log:
-            self.on_log(msg)
+            self.on_log(msg % args if args else msg)
@@ -0,0 +1,222 @@
+"""
+지역 코드 인덱스 모듈
+constants/regions.json (배송지 / 보조금 시·도, 시·군·구 코드)을 한 번만 읽어
+이름 ↔ 코드 조회용 인덱스를 만든다. GUI 프레임워크 의존성 없음.
+
+구조:
+- kind: "delivery"(배송지) / "subsidy"(보조금)
+- 시·도: {"name", "code", "siguns": [{"name", "code"}, ...]} (regions.json 원본 객체)
+- 이름 매칭: 정확 → 별칭(정식 명칭 → 약칭) → 부분 문자열 순
+
+[수정 가이드]
+- 시·도 정식 명칭 추가/변경 (예: 특별자치도 전환): PROVINCE_ALIASES 수정.
+- 기획전 타입별 지역 설정 종류: EXHB_REGION_KINDS 수정 (조건설정 탭/마이그레이션 공용).
+- regions.json 갱신 후에는 앱 재시작 필요 (프로세스당 1회 로드).
+"""
+
+import json
+import logging
+
+KINDS = ("delivery", "subsidy")
+
+# 지역 종류별 config 대상(target) 필드
+REGION_FIELDS = {
+    "delivery": ("deliveryAreaCode", "deliveryLocalAreaCode"),
+    "subsidy": ("subsidyRegion",),
+}
+
+# 기획전 타입(코드 첫 글자)별 사용하는 지역 설정
+# E(특별): 배송지 + 보조금 / D(전시차): 보조금만 / R(리퍼브): 배송지만
+EXHB_REGION_KINDS = {
+    "E": ("delivery", "subsidy"),
+    "D": ("subsidy",),
+    "R": ("delivery",),
+}
+
+# 정식 명칭(및 옛 명칭) → regions.json 시·도 약칭
+PROVINCE_ALIASES = {
+    "서울특별시": "서울",
+    "부산광역시": "부산",
+    "대구광역시": "대구",
+    "인천광역시": "인천",
+    "광주광역시": "광주",
+    "대전광역시": "대전",
+    "울산광역시": "울산",
+    "세종특별자치시": "세종",
+    "경기도": "경기",
+    "강원도": "강원",
+    "강원특별자치도": "강원",
+    "충청북도": "충북",
+    "충청남도": "충남",
+    "전라북도": "전북",
+    "전북특별자치도": "전북",
+    "전라남도": "전남",
+    "경상북도": "경북",
+    "경상남도": "경남",
+    "제주도": "제주",
+    "제주특별자치도": "제주",
+}
+
+log = logging.getLogger("CasperFinder")
+
+_index = None
+
+
+def normalize(name):
+    """매칭용 이름 정규화 (앞뒤/중간 공백 제거)."""
+    return "".join((name or "").split())
+
+
+def _by_name(items):
+    """{정규화 이름: 항목} — 중복 이름은 먼저 나온 항목 우선."""
+    table = {}
+    for item in items:
+        table.setdefault(normalize(item["name"]), item)
+    return table
+
+
+def _fuzzy(items, key):
+    """부분 문자열 매칭 (어느 쪽이 포함되든). 없으면 None."""
+    for item in items:
+        name = normalize(item["name"])
+        if key in name or name in key:
+            return item
+    return None
+
+
+class RegionIndex:
+    """regions.json 조회 인덱스. 생성 후 읽기 전용 (스레드 공유 가능)."""
+
+    def __init__(self, data):
+        self._sidos = {}  # {kind: [시·도, ...]} (원본 순서)
+        self._sido_by_name = {}  # {kind: {정규화 이름: 시·도}}
+        self._sido_by_code = {}  # {kind: {코드: 시·도}}
+        self._sigun_by_name = {}  # {id(시·도): {정규화 이름: 시·군·구}}
+        self._sigun_by_code = {}  # {kind: {코드: (시·도, 시·군·구)}}
+        aliases = {normalize(k): v for k, v in PROVINCE_ALIASES.items()}
+
+        for kind in KINDS:
+            sidos = data.get(kind, [])
+            by_name = _by_name(sidos)
+            for alias, short in aliases.items():
+                if short in by_name:
+                    by_name.setdefault(alias, by_name[short])
+
+            sigun_by_code = {}
+            for sido in sidos:
+                for sigun in sido["siguns"]:
+                    sigun_by_code.setdefault(sigun["code"], (sido, sigun))
+
+            self._sidos[kind] = sidos
+            self._sido_by_name[kind] = by_name
+            self._sido_by_code[kind] = {s["code"]: s for s in reversed(sidos)}
+            for sido in sidos:
+                self._sigun_by_name[id(sido)] = _by_name(sido["siguns"])
+            self._sigun_by_code[kind] = sigun_by_code
+
+    # ── 목록 ──
+
+    def sidos(self, kind):
+        """시·도 목록 (원본 순서)."""
+        return self._sidos[kind]
+
+    def sido_names(self, kind):
+        return [s["name"] for s in self._sidos[kind]]
+
+    def sigun_names(self, kind, sido_name):
+        """시·도 이름 → 시·군·구 이름 목록 (시·도를 못 찾으면 빈 목록)."""
+        sido = self.find_sido(kind, sido_name)
+        return [s["name"] for s in sido["siguns"]] if sido else []
+
+    def default(self, kind):
+        """기본 (시·도, 시·군·구) — 목록 첫 항목 ("전국"/"전체"). 비어 있으면 None."""
+        sidos = self._sidos[kind]
+        if not sidos:
+            return None, None
+        sido = sidos[0]
+        return sido, (sido["siguns"][0] if sido["siguns"] else None)
+
+    # ── 이름 → 항목 ──
+
+    def find_sido(self, kind, name):
+        """시·도 이름 매칭: 정확 → 별칭 → 부분 문자열. 없으면 None."""
+        key = normalize(name)
+        sido = self._sido_by_name[kind].get(key)
+        if sido is None:
+            sido = _fuzzy(self._sidos[kind], key)
+        return sido
+
+    def find_sigun(self, sido, name):
+        """시·군·구 이름 매칭: 정확 → 부분 문자열 → 첫 항목 (항목이 없으면 None)."""
+        key = normalize(name)
+        sigun = self._sigun_by_name.get(id(sido), {}).get(key)
+        if sigun is None:
+            sigun = _fuzzy(sido["siguns"], key)
+        if sigun is None and sido["siguns"]:
+            sigun = sido["siguns"][0]
+        return sigun
+
+    def resolve(self, kind, sido_name, sigun_name):
+        """(시·도 이름, 시·군·구 이름) → (시·도, 시·군·구). 시·도를 못 찾으면 (None, None)."""
+        sido = self.find_sido(kind, sido_name)
+        if sido is None:
+            return None, None
+        return sido, self.find_sigun(sido, sigun_name)
+
+    # ── 코드 → 항목 ──
+
+    def sido_by_code(self, kind, code):
+        """시·도 코드 → 시·도 (없으면 None)."""
+        return self._sido_by_code[kind].get(code)
+
+    def sigun_by_code(self, kind, code, sido=None):
+        """시·군·구 코드 → (시·도, 시·군·구). sido 지정 시 그 안에서만 찾음.
+
+        없으면 (None, None).
+        """
+        if sido is not None:
+            sigun = next((s for s in sido["siguns"] if s["code"] == code), None)
+            return (sido, sigun) if sigun else (None, None)
+        return self._sigun_by_code[kind].get(code, (None, None))
+
+
+# ── 대상(target) 설정 필드 ──
+
+
+def region_kinds(exhb_no):
+    """기획전 코드 → 사용하는 지역 종류 튜플 (모르는 타입이면 빈 튜플)."""
+    return EXHB_REGION_KINDS.get((exhb_no or "")[:1], ())
+
+
+def target_fields(kind, sido, sigun):
+    """매칭된 (시·도, 시·군·구) → config 대상에 기록할 필드."""
+    if kind == "delivery":
+        codes = (sido["code"], sigun["code"])
+    else:
+        codes = (sigun["code"],)
+    return dict(zip(REGION_FIELDS[kind], codes))
+
+
+def load_regions_file(path=None):
+    """regions.json 원본 로드 (없거나 손상 시 빈 목록)."""
+    if path is None:
+        # core.config → core.migrations → core.regions 순환 import 방지
+        from core.config import BASE_DIR
+
+        path = BASE_DIR / "constants" / "regions.json"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {kind: [] for kind in KINDS}
+    except (OSError, ValueError) as e:
+        log.warning(f"[지역] regions.json 로드 실패: {e}")
+        return {kind: [] for kind in KINDS}
+
+
+def get_region_index():
+    """공유 RegionIndex (최초 호출 시 1회 로드)."""
+    global _index
+    if _index is None:
+        _index = RegionIndex(load_regions_file())
+    return _index
@@ -0,0 +1,436 @@
+"""
+알림 규칙 엔진
+사용자 규칙(문자열 조건식)을 한 번 파싱해 조건 함수(클로저)로 컴파일하고,
+신규 차량마다 모든 규칙을 한 번에 평가한다. 차량 필드는 처음 참조될 때 1회만 추출 (규칙끼리 공유).
+GUI 프레임워크 의존성 없음.
+
+조건식 예:
+    trim in [인스퍼레이션, 크로스] and price < 35,000,000 and center != 양산
+    (ext ~ "아틀라스 화이트" or ext ~ 블랙) and not option ~ 선루프
+    price <= 3500만 and prod >= 2025-06
+
+문법:
+    식      := 항 (or 항)*          항 := 부정 (and 부정)*
+    부정    := not 부정 | ( 식 ) | 비교
+    비교    := 필드 연산자 값 | 필드 [not] in [값, 값, ...]
+    연산자  := == (=) != < <= > >= ~ (contains)
+    값      := 숫자(35,000,000 / 3500만 / 1.5억) | "따옴표 문자열" | 공백 없는 단어
+
+비교 규칙:
+    숫자 필드(price, discount): 수치 비교, 값이 없는 차량은 항상 불일치
+    문자열 필드: == / ~ 는 부분 일치, != 는 미포함, < > 는 사전순 (prod "2025-06" 비교용)
+    옵션(option): 옵션 이름 중 하나라도 부분 일치
+    in [..]: 목록 중 하나라도 일치 (not in: 모두 불일치)
+
+설정 (config.json "alertRules"):
+    [{"name": "인스퍼 3500 이하", "when": "<조건식>", "actions": ["toast", "sound", "open", "webhook"],
+      "enabled": true}]
+    규칙 동작은 기본 알림(요약/인앱 팝업/알림음)에 더해 실행된다.
+    "suppress" 동작을 넣은 규칙에 일치한 차량만 기본 알림을 생략 (기본값: 생략 안 함).
+
+[수정 가이드]
+- 필드 추가: FIELDS (+ 한글 별칭 FIELD_ALIASES).
+- 동작 추가: ACTIONS + 엔진(core.poller)의 규칙 동작 실행부.
+- 규칙별 일치 횟수: RULE_STATS_PATH (엔진 중지 시 저장).
+"""
+
+import re
+import time
+import logging
+
+from core.config import DATA_DIR, load_json, save_json
+from core.formatter import get_field, get_option_info
+
+log = logging.getLogger("CasperFinder")
+
+RULE_STATS_PATH = DATA_DIR / "rule_stats.json"
+
+# 동작
+ACTION_TOAST = "toast"  # OS 토스트
+ACTION_SOUND = "sound"  # 알림음
+ACTION_OPEN = "open"  # 상세(계약) 페이지 열기
+ACTION_WEBHOOK = "webhook"  # 외부 알림 싱크로 전송
+ACTION_SUPPRESS = "suppress"  # 기본 알림(요약/인앱 팝업/알림음) 생략
+ACTIONS = (ACTION_TOAST, ACTION_SOUND, ACTION_OPEN, ACTION_WEBHOOK, ACTION_SUPPRESS)
+
+# 필드 종류
+NUM, STR, LIST = "num", "str", "list"
+
+
+def _number(value):
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(str(value).replace(",", ""))
+    except ValueError:
+        return None
+
+
+def _options(vehicle, label):
+    return get_option_info(vehicle)[1]
+
+
+# 규칙 필드: {이름: (종류, 추출 함수(vehicle, label))}
+FIELDS = {
+    "model": (STR, lambda v, lbl: str(get_field(v, "modelNm", "carName", default=""))),
+    "trim": (STR, lambda v, lbl: str(get_field(v, "trimNm", "trimName", default=""))),
+    "ext": (STR, lambda v, lbl: str(get_field(v, "extCrNm", "exteriorColorName", default=""))),
+    "int": (STR, lambda v, lbl: str(get_field(v, "intCrNm", "interiorColorName", default=""))),
+    "center": (STR, lambda v, lbl: str(get_field(v, "poName", "deliveryCenterName", default=""))),
+    "prod": (STR, lambda v, lbl: str(get_field(v, "productionDate", "prodDt", default=""))),
+    "exhibition": (STR, lambda v, lbl: lbl or ""),
+    "price": (NUM, lambda v, lbl: _number(get_field(v, "price", "carPrice", default=None))),
+    "discount": (
+        NUM,
+        lambda v, lbl: _number(get_field(v, "discountAmt", "crDscntAmt", default=None)),
+    ),
+    "option": (LIST, _options),
+}
+
+FIELD_ALIASES = {
+    "모델": "model",
+    "트림": "trim",
+    "외장": "ext",
+    "외장색상": "ext",
+    "내장": "int",
+    "내장색상": "int",
+    "출고센터": "center",
+    "센터": "center",
+    "생산일": "prod",
+    "기획전": "exhibition",
+    "label": "exhibition",
+    "가격": "price",
+    "할인": "discount",
+    "옵션": "option",
+}
+
+
+class RuleError(ValueError):
+    """조건식 오류 (위치 포함)."""
+
+
+# ── 토큰화 ──
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<str>"[^"]*"|'[^']*')
+       |(?P<num>(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?P<unit>만|억)?)(?=[\s\]\),]|$)
+       |(?P<op><=|>=|!=|==|=|<|>|~)
+       |(?P<punct>[\[\](),])
+       |(?P<word>[^\s\[\](),<>=!~"']+)
+    )""",
+    re.VERBOSE,
+)
+_UNITS = {None: 1, "만": 10_000, "억": 100_000_000}
+_KEYWORDS = {"and", "or", "not", "in", "contains"}
+
+
+def _tokenize(text):
+    tokens, pos = [], 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = _TOKEN.match(text, pos)
+        if not m or m.end() == pos:
+            raise RuleError(f"{pos + 1}번째 글자 해석 불가: {text[pos:pos + 10]!r}")
+        if m.group("str") is not None:
+            tokens.append(("value", m.group("str")[1:-1], m.start("str")))
+        elif m.group("num") is not None:
+            raw = m.group("num")
+            number = float(raw.rstrip("만억").replace(",", "")) * _UNITS[m.group("unit")]
+            tokens.append(("value", number, m.start("num")))
+        elif m.group("op") is not None:
+            op = m.group("op")
+            tokens.append(("op", "==" if op == "=" else op, m.start("op")))
+        elif m.group("punct") is not None:
+            tokens.append((m.group("punct"), m.group("punct"), m.start("punct")))
+        else:
+            word = m.group("word")
+            keyword = word.lower()
+            if keyword == "contains":
+                tokens.append(("op", "~", m.start("word")))
+            elif keyword in _KEYWORDS:
+                tokens.append((keyword, keyword, m.start("word")))
+            else:
+                tokens.append(("value", word, m.start("word")))
+        pos = m.end()
+    return tokens
+
+
+# ── 파싱 + 컴파일 (재귀 하강, 결과는 fn(values) -> bool) ──
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.i = 0
+        self.fields = set()
+
+    def _peek(self):
+        return self.tokens[self.i] if self.i < len(self.tokens) else (None, None, len(self.text))
+
+    def _next(self, expected=None):
+        tok = self._peek()
+        if expected is not None and tok[0] != expected:
+            need = "값" if expected == "value" else f"'{expected}'"
+            raise RuleError(f"{tok[2] + 1}번째 글자: {need} 필요")
+        self.i += 1
+        return tok
+
+    def parse(self):
+        if not self.tokens:
+            raise RuleError("빈 조건식")
+        fn = self._or()
+        if self.i < len(self.tokens):
+            raise RuleError(f"{self._peek()[2] + 1}번째 글자: 해석할 수 없는 뒷부분")
+        return fn
+
+    def _or(self):
+        parts = [self._and()]
+        while self._peek()[0] == "or":
+            self._next()
+            parts.append(self._and())
+        return _fold(parts, _or2)
+
+    def _and(self):
+        parts = [self._not()]
+        while self._peek()[0] == "and":
+            self._next()
+            parts.append(self._not())
+        return _fold(parts, _and2)
+
+    def _not(self):
+        kind = self._peek()[0]
+        if kind == "not":
+            self._next()
+            inner = self._not()
+            return lambda f: not inner(f)
+        if kind == "(":
+            self._next()
+            inner = self._or()
+            self._next(")")
+            return inner
+        return self._compare()
+
+    def _compare(self):
+        _, name, pos = self._next("value")
+        field = FIELD_ALIASES.get(name, name)
+        if not isinstance(field, str) or field not in FIELDS:
+            raise RuleError(f"{pos + 1}번째 글자: 알 수 없는 필드 {name!r}")
+        self.fields.add(field)
+        ftype = FIELDS[field][0]
+
+        kind, op, pos = self._peek()
+        if kind == "not":
+            self._next()
+            self._next("in")
+            return _negate(_compile_in(field, ftype, self._list()))
+        if kind == "in":
+            self._next()
+            return _compile_in(field, ftype, self._list())
+        if kind != "op":
+            raise RuleError(f"{pos + 1}번째 글자: 비교 연산자 필요")
+        self._next()
+        _, value, vpos = self._next("value")
+        return _compile_op(field, ftype, op, value, vpos)
+
+    def _list(self):
+        """[값, ...] → [(값, 위치), ...]"""
+        self._next("[")
+        values = []
+        while True:
+            _, value, pos = self._next("value")
+            values.append((value, pos))
+            if self._peek()[0] == ",":
+                self._next()
+                continue
+            self._next("]")
+            return values
+
+
+def _and2(a, b):
+    return lambda f: a(f) and b(f)
+
+
+def _or2(a, b):
+    return lambda f: a(f) or b(f)
+
+
+def _fold(parts, combine):
+    """[a, b, c] → combine(combine(a, b), c) — 제너레이터 없이 단락 평가하는 클로저 체인."""
+    fn = parts[0]
+    for part in parts[1:]:
+        fn = combine(fn, part)
+    return fn
+
+
+def _negate(fn):
+    return lambda f: not fn(f)
+
+
+def _compile_op(field, ftype, op, value, pos):
+    if ftype == NUM:
+        number = _number(value)
+        if number is None:
+            raise RuleError(f"{pos + 1}번째 글자: {field} 는 숫자와 비교")
+        if op == "~":
+            raise RuleError(f"{pos + 1}번째 글자: 숫자 필드에 ~ 사용 불가")
+        cmp = _NUM_OPS[op]
+        return lambda f: f[field] is not None and cmp(f[field], number)
+
+    value = _text(value)
+    if ftype == LIST:
+        if op in ("==", "~"):
+            return lambda f: any(value in o for o in f[field])
+        if op == "!=":
+            return lambda f: not any(value in o for o in f[field])
+        raise RuleError(f"{pos + 1}번째 글자: option 은 ==, !=, ~, in 만 사용")
+
+    if op in ("==", "~"):
+        return lambda f: value in f[field]
+    if op == "!=":
+        return lambda f: value not in f[field]
+    cmp = _NUM_OPS[op]
+    return lambda f: f[field] != "" and cmp(f[field], value)
+
+
+def _compile_in(field, ftype, items):
+    if ftype == NUM:
+        numbers = set()
+        for value, pos in items:
+            number = _number(value)
+            if number is None:
+                raise RuleError(f"{pos + 1}번째 글자: {field} 목록에는 숫자만 사용")
+            numbers.add(number)
+        return lambda f: f[field] in numbers
+    values = tuple(_text(value) for value, _ in items)
+    if ftype == LIST:
+        return lambda f: any(v in o for o in f[field] for v in values)
+    if len(values) == 1:
+        (value,) = values
+        return lambda f: value in f[field]
+    return lambda f: any(v in f[field] for v in values)
+
+
+def _text(value):
+    """숫자로 읽힌 값을 문자열 비교용으로 되돌림 (3500 → "3500")."""
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    return value
+
+
+_NUM_OPS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def quote(value):
+    """문자열 값 → 조건식에 넣을 따옴표 문자열 (조건식 문법에는 이스케이프가 없음).
+
+    " 가 들어 있으면 ' 로 감싸고, 두 가지가 모두 들어 있으면 RuleError.
+    """
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    raise RuleError(f"따옴표(\" 와 ')가 모두 들어간 값은 사용할 수 없음: {value!r}")
+
+
+def compile_rule(text):
+    """조건식 → (조건 함수 fn(values) -> bool, 사용 필드 집합). 오류 시 RuleError."""
+    parser = _Parser(text)
+    return parser.parse(), frozenset(parser.fields)
+
+
+class VehicleFields(dict):
+    """조건 함수 입력: 필드를 처음 참조할 때 추출해 보관 (평가가 일찍 끝나면 나머지는 추출 안 함)."""
+
+    __slots__ = ("vehicle", "label")
+
+    def __init__(self, vehicle, label):  # dict.__init__ 생략 (빈 dict 로 시작)
+        self.vehicle = vehicle
+        self.label = label
+
+    def __missing__(self, name):
+        value = self[name] = FIELDS[name][1](self.vehicle, self.label)
+        return value
+
+
+class Rule:
+    """컴파일된 규칙 1개 + 일치 횟수."""
+
+    def __init__(self, name, when, actions=(), hits=0, last_hit=None):
+        self.name = name
+        self.when = when
+        self.predicate, self.fields = compile_rule(when)
+        self.actions = tuple(a for a in actions if a in ACTIONS)
+        self.hits = hits
+        self.last_hit = last_hit
+
+
+class RuleSet:
+    """규칙 목록. evaluate() 는 차량 1대에 대해 모든 규칙을 한 번에 평가."""
+
+    def __init__(self, rules=()):
+        self.rules = list(rules)
+
+    @classmethod
+    def from_config(cls, entries, stats=None):
+        """config alertRules → RuleSet. 잘못된 규칙은 로그 후 제외 (폴링은 계속)."""
+        stats = stats or {}
+        rules = []
+        for i, entry in enumerate(entries or []):
+            if not isinstance(entry, dict) or not entry.get("enabled", True):
+                continue
+            name = entry.get("name") or f"규칙 {i + 1}"
+            try:
+                saved = stats.get(name, {})
+                rules.append(
+                    Rule(
+                        name,
+                        entry.get("when", ""),
+                        entry.get("actions", []),
+                        hits=saved.get("hits", 0),
+                        last_hit=saved.get("lastHit"),
+                    )
+                )
+            except RuleError as e:
+                log.error(f"[규칙] '{name}' 조건식 오류 — 제외: {e}")
+        return cls(rules)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def evaluate(self, vehicle, label, now=None):
+        """일치한 규칙 목록 (일치 횟수 증가)."""
+        if not self.rules:
+            return []
+        values = VehicleFields(vehicle, label)
+        matched = [r for r in self.rules if r.predicate(values)]
+        if matched:
+            now = now or time.time()
+            for rule in matched:
+                rule.hits += 1
+                rule.last_hit = now
+        return matched
+
+    def stats(self):
+        return {r.name: {"hits": r.hits, "lastHit": r.last_hit} for r in self.rules}
+
+
+def load_rule_stats():
+    return load_json(RULE_STATS_PATH)
+
+
+def save_rule_stats(rule_set):
+    """규칙별 일치 횟수 저장 (설정에서 빠진 규칙의 기록도 유지)."""
+    if not rule_set.rules:
+        return
+    stats = load_rule_stats()
+    stats.update(rule_set.stats())
+    save_json(RULE_STATS_PATH, stats)
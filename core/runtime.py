@@ -0,0 +1,155 @@
+"""
+비동기 런타임 서비스
+앱 전체가 공유하는 이벤트 루프 스레드 1개 + 블로킹 작업용 스레드 풀 1개.
+GUI 프레임워크 의존성 없음 (Tk 전달은 widget.after 덕 타이핑).
+
+사용:
+    from core.runtime import get_runtime
+    rt = get_runtime()
+    rt.submit(coro)                                   # 코루틴 → 루프 스레드
+    rt.run_blocking(fn, *args)                        # 블로킹 함수 → 스레드 풀
+    rt.submit(coro, on_done=cb, widget=tk_widget)     # 결과를 Tk 스레드에서 cb(result, error)
+    await rt.to_thread(fn, *args)                     # 루프 안에서 블로킹 작업 위임
+
+[수정 가이드]
+- 풀 크기: WORKER_COUNT (파일 I/O, 토스트, 사운드, 업데이트 다운로드 등 공용).
+- 종료 순서: shutdown() — 루프 작업 취소 → 루프 정지 → 스레드 풀 정리.
+- 상주 스레드가 필요한 라이브러리(pystray 트레이 등)는 풀에 넣지 말 것 (풀 슬롯 점유).
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger("CasperFinder")
+
+WORKER_COUNT = 4
+SHUTDOWN_TIMEOUT = 3.0
+
+_runtime = None
+_runtime_lock = threading.Lock()
+
+
+class Runtime:
+    """이벤트 루프 스레드 + 블로킹 작업 스레드 풀."""
+
+    def __init__(self, workers=WORKER_COUNT):
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="casper-worker"
+        )
+        self.loop.set_default_executor(self.executor)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._drive, name="casper-loop", daemon=True
+        )
+        self._thread.start()
+
+    def _drive(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    @property
+    def in_loop_thread(self):
+        return threading.current_thread() is self._thread
+
+    # ── 스케줄링 ──
+
+    def submit(self, coro, on_done=None, widget=None):
+        """코루틴을 루프 스레드에서 실행 → concurrent.futures.Future.
+
+        on_done(result, error): 완료 콜백. widget 지정 시 widget.after 로 Tk 스레드에서 호출.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if on_done:
+            future.add_done_callback(self._completion(on_done, widget))
+        return future
+
+    def run_blocking(self, fn, *args, on_done=None, widget=None):
+        """블로킹 함수를 스레드 풀에서 실행 → concurrent.futures.Future."""
+        future = self.executor.submit(self._guarded, fn, *args)
+        if on_done:
+            future.add_done_callback(self._completion(on_done, widget))
+        return future
+
+    async def to_thread(self, fn, *args):
+        """(루프 안에서) 블로킹 함수를 스레드 풀에 위임하고 결과 대기."""
+        return await self.loop.run_in_executor(self.executor, fn, *args)
+
+    def call_soon(self, fn, *args):
+        """루프 스레드에서 일반 함수 실행 (스레드 안전)."""
+        self.loop.call_soon_threadsafe(fn, *args)
+
+    @staticmethod
+    def _guarded(fn, *args):
+        try:
+            return fn(*args)
+        except Exception:
+            log.exception("[런타임] 작업 실패: %s", getattr(fn, "__name__", fn))
+            raise
+
+    @staticmethod
+    def _completion(on_done, widget):
+        def done(future):
+            if future.cancelled():
+                return
+            error = future.exception()
+            result = None if error else future.result()
+            if widget is None:
+                on_done(result, error)
+                return
+            try:
+                widget.after(0, on_done, result, error)
+            except RuntimeError:
+                pass  # Tk 종료 후 도착한 결과
+
+        return done
+
+    # ── 종료 ──
+
+    def shutdown(self, timeout=SHUTDOWN_TIMEOUT):
+        """남은 코루틴 취소 → 루프 정지 → 스레드 풀 정리 (1회)."""
+        if self._closed:
+            return
+        self._closed = True
+
+        async def _cancel_all():
+            tasks = [
+                t for t in asyncio.all_tasks() if t is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.loop.shutdown_asyncgens()
+
+        if self._thread.is_alive() and not self.in_loop_thread:
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_all(), self.loop).result(
+                    timeout
+                )
+            except Exception as e:
+                log.warning(f"[런타임] 작업 정리 시간 초과: {e}")
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_runtime():
+    """공유 Runtime (최초 호출 시 루프 스레드 시작)."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = Runtime()
+        return _runtime
+
+
+def shutdown_runtime():
+    """공유 Runtime 종료 (시작된 적 없으면 무시)."""
+    with _runtime_lock:
+        runtime = _runtime
+    if runtime is not None:
+        runtime.shutdown()
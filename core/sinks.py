@@ -0,0 +1,534 @@
+"""
+외부 알림 싱크 모듈 (웹훅 / 텔레그램 / 디스코드)
+엔진이 발견한 신규 차량을 휴대폰 등 외부로 전달한다. GUI 프레임워크 의존성 없음.
+
+구조:
+- NotifyDispatcher: 엔진 이벤트 → 싱크별 asyncio.Queue 에 넣기만 함 (폴링 루프를 기다리게 하지 않음)
+- 싱크마다 워커 작업 1개 (공유 런타임 루프): 모아 보내기(batch) → 전송 간격 제한 → 실패 시 백오프 재시도
+- 재시도까지 실패한 메시지 / 종료 시 남은 메시지 → SQLite notify_queue 테이블 (재시작 후 재전송)
+
+설정 (config.json "notifySinks"):
+    [{"type": "telegram", "botToken": "...", "chatId": "..."},
+     {"type": "discord", "url": "https://discord.com/api/webhooks/..."},
+     {"type": "webhook", "url": "http://...", "headers": {...}}]
+    공통 선택 키: name, enabled(기본 true), batchSize, minInterval(초)
+
+[수정 가이드]
+- 싱크 추가: Sink 상속 (build_requests) 후 SINK_TYPES 에 등록.
+  요청마다 담은 메시지 수를 함께 반환 (일부 요청만 실패하면 나머지 메시지만 디스크 큐로).
+- 메시지 형식: vehicle_message() / digest_message() (텍스트는 core.formatter — 텔레그램 봇과 동일).
+- 디스크 큐 크기/보관 기간: QUEUE_LIMIT / QUEUE_MAX_AGE.
+"""
+
+import json
+import time
+import asyncio
+import logging
+
+import aiohttp
+
+from core import db
+from core.config import load_config
+from core.formatter import format_vehicle_text, format_digest
+from core.runtime import get_runtime
+
+log = logging.getLogger("CasperFinder")
+
+MAX_PENDING = 200  # 싱크별 메모리 큐 한도 (넘치면 디스크 큐로)
+BATCH_WINDOW = 0.3  # 초 — 첫 메시지 이후 같이 보낼 메시지를 기다리는 시간
+MAX_ATTEMPTS = 4  # 메모리에서의 전송 시도 횟수 (이후 디스크 큐)
+BACKOFF_BASE = 1.0  # 초 — 재시도 대기 1, 2, 4 ... (최대 BACKOFF_MAX)
+BACKOFF_MAX = 30.0
+RETRY_INTERVAL = 60  # 초 — 한가할 때 디스크 큐 재전송 주기
+QUEUE_LIMIT = 500  # 싱크별 디스크 큐 최대 건수 (오래된 것부터 버림)
+QUEUE_MAX_AGE = 24 * 3600  # 초 — 이보다 오래된 알림은 재전송하지 않음
+REQUEST_TIMEOUT = 10  # 초
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notify_queue (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    sink     TEXT NOT NULL,
+    payload  TEXT NOT NULL,
+    created  REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_notify_queue_sink ON notify_queue(sink, id);
+"""
+
+
+class PermanentError(Exception):
+    """재시도해도 성공할 수 없는 오류 (잘못된 토큰/URL 등) — 메시지 폐기."""
+
+
+def vehicle_message(vehicle, label, detail_url):
+    """신규 차량 → 싱크 공용 메시지 dict."""
+    text, _ = format_vehicle_text(vehicle, label)
+    return {
+        "kind": "vehicle",
+        "title": f"[{label}] 신규 차량 발견",
+        "text": text,
+        "url": detail_url,
+        "label": label,
+        "ts": time.time(),
+    }
+
+
+def digest_message(events):
+    """요약 알림(digest) → 싱크 공용 메시지 dict. events: [(vehicle, label, detail_url), ...]"""
+    return {
+        "kind": "digest",
+        "title": f"신규 차량 {len(events)}대 (요약)",
+        "text": format_digest(events),
+        "url": "",
+        "count": len(events),
+        "ts": time.time(),
+    }
+
+
+def _chunks(texts, limit):
+    """메시지 텍스트들을 limit 글자 이하 덩어리로 합침 → (덩어리, 합친 메시지 수)."""
+    chunk, count = "", 0
+    for text in texts:
+        text = text[:limit]
+        if chunk and len(chunk) + 2 + len(text) > limit:
+            yield chunk, count
+            chunk, count = "", 0
+        chunk = f"{chunk}\n\n{text}" if chunk else text
+        count += 1
+    if chunk:
+        yield chunk, count
+
+
+# ── 싱크 ──
+
+
+class Sink:
+    """외부 전송 대상. build_requests 만 구현하면 워커/재시도/큐는 공용."""
+
+    type = "base"
+    default_batch = 10
+    default_interval = 0.2  # 초 — 요청 사이 최소 간격
+
+    def __init__(self, cfg, name):
+        self.name = name
+        self.batch_size = int(cfg.get("batchSize", self.default_batch))
+        self.min_interval = float(cfg.get("minInterval", self.default_interval))
+
+    def build_requests(self, messages):
+        """메시지 묶음 → [(url, json_body, headers, 메시지 수), ...]
+
+        요청은 messages 순서대로 앞에서부터 "메시지 수" 만큼씩 담는다.
+        """
+        raise NotImplementedError
+
+
+class WebhookSink(Sink):
+    """일반 웹훅: 묶음 전체를 JSON 한 번으로 POST."""
+
+    type = "webhook"
+
+    def __init__(self, cfg, name):
+        super().__init__(cfg, name)
+        self.url = cfg["url"]
+        self.headers = cfg.get("headers", {})
+
+    def build_requests(self, messages):
+        return [(self.url, {"messages": messages}, self.headers, len(messages))]
+
+
+class TelegramSink(Sink):
+    """텔레그램 봇 sendMessage (채팅당 초당 1건 권장, 4096자 제한)."""
+
+    type = "telegram"
+    default_interval = 1.0
+    TEXT_LIMIT = 4096
+
+    def __init__(self, cfg, name):
+        super().__init__(cfg, name)
+        api_base = cfg.get("apiBase", "https://api.telegram.org").rstrip("/")
+        self.url = f"{api_base}/bot{cfg['botToken']}/sendMessage"
+        self.chat_id = cfg["chatId"]
+
+    def build_requests(self, messages):
+        texts = [f"{m['text']}\n{m['url']}" if m.get("url") else m["text"] for m in messages]
+        return [
+            (
+                self.url,
+                {"chat_id": self.chat_id, "text": text, "disable_web_page_preview": True},
+                {},
+                count,
+            )
+            for text, count in _chunks(texts, self.TEXT_LIMIT)
+        ]
+
+
+class DiscordSink(Sink):
+    """디스코드 웹훅 (2000자 제한, 웹훅당 2초에 5건)."""
+
+    type = "discord"
+    default_interval = 0.5
+    TEXT_LIMIT = 2000
+
+    def __init__(self, cfg, name):
+        super().__init__(cfg, name)
+        self.url = cfg["url"]
+
+    def build_requests(self, messages):
+        texts = [f"**{m['title']}**\n{m['text']}" for m in messages]
+        return [
+            (self.url, {"content": text}, {}, count)
+            for text, count in _chunks(texts, self.TEXT_LIMIT)
+        ]
+
+
+SINK_TYPES = {
+    "webhook": WebhookSink,
+    "telegram": TelegramSink,
+    "discord": DiscordSink,
+}
+
+
+def create_sinks(configs):
+    """notifySinks 설정 → [Sink, ...] (잘못된 항목은 로그 후 건너뜀)."""
+    sinks = []
+    for i, cfg in enumerate(configs or []):
+        if not cfg.get("enabled", True):
+            continue
+        kind = cfg.get("type", "")
+        name = cfg.get("name") or f"{kind}-{i}"
+        try:
+            sinks.append(SINK_TYPES[kind](cfg, name))
+        except KeyError as e:
+            log.error(f"[알림 싱크] '{name}' 설정 오류: {e} 없음")
+    return sinks
+
+
+# ── 디스크 큐 (SQLite) ──
+
+
+def _ensure_schema():
+    db.ensure_schema("notify_queue", _SCHEMA)
+
+
+def queue_put(sink_name, messages, attempts=0):
+    """전송 실패 메시지를 디스크 큐에 저장 (싱크별 QUEUE_LIMIT 초과분은 오래된 것부터 삭제)."""
+    _ensure_schema()
+    now = time.time()
+    with db.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO notify_queue(sink, payload, created, attempts) VALUES (?, ?, ?, ?)",
+            [
+                (sink_name, json.dumps(m, ensure_ascii=False), m.get("ts", now), attempts)
+                for m in messages
+            ],
+        )
+        conn.execute(
+            "DELETE FROM notify_queue WHERE sink = ? AND id NOT IN "
+            "(SELECT id FROM notify_queue WHERE sink = ? ORDER BY id DESC LIMIT ?)",
+            (sink_name, sink_name, QUEUE_LIMIT),
+        )
+
+
+def queue_take(sink_name, limit):
+    """디스크 큐에서 오래된 순으로 최대 limit 건 → [(id, message), ...] (만료분은 삭제)."""
+    _ensure_schema()
+    with db.transaction() as conn:
+        conn.execute(
+            "DELETE FROM notify_queue WHERE created < ?",
+            (time.time() - QUEUE_MAX_AGE,),
+        )
+    rows = db.query(
+        "SELECT id, payload FROM notify_queue WHERE sink = ? ORDER BY id LIMIT ?",
+        (sink_name, limit),
+    )
+    return [(row["id"], json.loads(row["payload"])) for row in rows]
+
+
+def queue_done(ids, failed=False):
+    """디스크 큐 항목 처리 결과: 성공 → 삭제, 실패 → 시도 횟수 증가."""
+    if not ids:
+        return
+    marks = ",".join("?" * len(ids))
+    with db.transaction() as conn:
+        if failed:
+            conn.execute(
+                f"UPDATE notify_queue SET attempts = attempts + 1 WHERE id IN ({marks})",
+                ids,
+            )
+        else:
+            conn.execute(f"DELETE FROM notify_queue WHERE id IN ({marks})", ids)
+
+
+def queue_size(sink_name=None):
+    _ensure_schema()
+    if sink_name is None:
+        return db.query("SELECT COUNT(*) AS n FROM notify_queue")[0]["n"]
+    sql = "SELECT COUNT(*) AS n FROM notify_queue WHERE sink = ?"
+    return db.query(sql, (sink_name,))[0]["n"]
+
+
+# ── 전송 워커 ──
+
+
+class _SinkWorker:
+    """싱크 1개의 전송 작업 (루프 스레드 전용)."""
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.session = None  # 공유 ClientSession (NotifyDispatcher 가 루프에서 설정)
+        self.queue = asyncio.Queue()
+        self.inflight = None  # 전송 중인 묶음 (종료 시 디스크 보관 대상)
+        self.backlog = []  # 디스크 큐 저장에 실패한 미전송분 (다음 주기에 먼저 전송)
+        self.closing = False
+        self._last_send = 0.0
+        self.sent = 0  # 전송 성공 메시지 수 (상태 확인용)
+
+    async def run(self):
+        runtime = get_runtime()
+        while not self.closing:
+            if self.backlog:
+                batch, self.backlog = self.backlog, []
+            else:
+                batch = await self._next_batch(runtime)
+                if not batch:
+                    continue
+
+            self.inflight = batch
+            unsent = await self._deliver(batch)
+            if unsent and not await self._persist(runtime, unsent):
+                self.backlog = unsent
+            self.inflight = None
+
+    async def _next_batch(self, runtime):
+        """첫 메시지 + BATCH_WINDOW 안에 들어온 메시지. 한가하면 디스크 큐 재전송 후 []."""
+        try:
+            first = await asyncio.wait_for(self.queue.get(), RETRY_INTERVAL)
+        except asyncio.TimeoutError:
+            try:
+                await self._retry_persisted(runtime)
+            except Exception as e:
+                log.error(f"[알림 싱크] {self.sink.name}: 디스크 큐 재전송 실패: {e}")
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + BATCH_WINDOW
+        while len(batch) < self.sink.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _persist(self, runtime, messages):
+        """미전송분 디스크 큐 저장 → 성공 여부 (실패해도 워커는 계속)."""
+        try:
+            await runtime.to_thread(queue_put, self.sink.name, messages, MAX_ATTEMPTS)
+        except Exception as e:
+            log.error(
+                f"[알림 싱크] {self.sink.name}: 디스크 큐 저장 실패 ({len(messages)}건, "
+                f"다음 주기에 재전송): {e}"
+            )
+            return False
+        log.warning(
+            "[알림 싱크] %s: %d건 전송 실패 → 디스크 큐 보관",
+            self.sink.name,
+            len(messages),
+        )
+        return True
+
+    async def _retry_persisted(self, runtime):
+        """한가할 때 디스크 큐의 메시지 재전송."""
+        items = await runtime.to_thread(queue_take, self.sink.name, self.sink.batch_size)
+        if not items:
+            return
+        unsent = await self._deliver([message for _, message in items], attempts=1)
+        ids = [item_id for item_id, _ in items]
+        done_ids, failed_ids = ids[: len(ids) - len(unsent)], ids[len(ids) - len(unsent) :]
+        await runtime.to_thread(queue_done, done_ids)  # 미전송분은 항상 묶음의 뒤쪽
+        await runtime.to_thread(queue_done, failed_ids, True)
+        if done_ids:
+            log.info("[알림 싱크] %s: 보관된 %d건 재전송 완료", self.sink.name, len(done_ids))
+
+    async def _deliver(self, messages, attempts=MAX_ATTEMPTS):
+        """묶음 전송 (요청별 백오프 재시도) → 미전송 메시지 목록 (모두 처리되면 []).
+
+        전송 성공/영구 오류(폐기)로 끝난 요청의 메시지는 빠지고, 재시도를 소진한
+        요청부터 뒤의 메시지만 남는다. 전송 중인 묶음(inflight)도 같이 줄여서
+        종료 시 이미 보낸 메시지를 다시 보관하지 않는다.
+        """
+        unsent = list(messages)
+        if self.inflight is messages:
+            self.inflight = unsent
+        try:
+            requests = self.sink.build_requests(messages)
+        except Exception as e:
+            log.error(f"[알림 싱크] {self.sink.name}: 메시지 생성 실패 → 폐기: {e}")
+            return []
+
+        for url, body, headers, count in requests:
+            for attempt in range(1, attempts + 1):
+                try:
+                    await self._post(url, body, headers)
+                    self.sent += count
+                    break
+                except PermanentError as e:
+                    log.error(f"[알림 싱크] {self.sink.name}: 전송 불가 → 폐기: {e}")
+                    break
+                except Exception as e:
+                    if attempt == attempts:
+                        log.debug("[알림 싱크] %s: 재시도 소진: %s", self.sink.name, e)
+                        return unsent
+                    delay = getattr(e, "retry_after", None) or min(
+                        BACKOFF_BASE * 2 ** (attempt - 1), BACKOFF_MAX
+                    )
+                    log.debug(
+                        "[알림 싱크] %s: 전송 실패 (%d회) %.1f초 후 재시도: %s",
+                        self.sink.name,
+                        attempt,
+                        delay,
+                        e,
+                    )
+                    await asyncio.sleep(delay)
+            del unsent[:count]
+        return unsent
+
+    async def _post(self, url, body, headers):
+        # 요청 간 최소 간격 (싱크별 전송 속도 제한)
+        wait = self._last_send + self.sink.min_interval - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._last_send = time.monotonic()
+
+        async with self.session.post(url, json=body, headers=headers) as resp:
+            if resp.status < 300:
+                await resp.read()
+                return
+            text = (await resp.text())[:200]
+            if resp.status == 429 or resp.status >= 500 or resp.status == 408:
+                error = ConnectionError(f"HTTP {resp.status}: {text}")
+                error.retry_after = _retry_after(resp, text)
+                raise error
+            raise PermanentError(f"HTTP {resp.status}: {text}")
+
+
+def _retry_after(resp, text):
+    """429 응답의 대기 시간(초): Retry-After 헤더 또는 JSON retry_after (텔레그램/디스코드)."""
+    header = resp.headers.get("Retry-After")
+    if header:
+        try:
+            return min(float(header), BACKOFF_MAX)
+        except ValueError:
+            pass
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    value = data.get("retry_after") or data.get("parameters", {}).get("retry_after")
+    return min(float(value), BACKOFF_MAX) if value else None
+
+
+class NotifyDispatcher:
+    """엔진 이벤트 → 싱크 워커 분배. publish 는 어느 스레드에서나 즉시 반환."""
+
+    def __init__(self, sinks):
+        self.sinks = sinks
+        self._workers = []
+        self._tasks = []
+        self._session = None
+        self._started = False
+
+    def start(self):
+        """워커 시작 (1회, 싱크가 없으면 아무것도 하지 않음). 아무 스레드에서나 호출 가능."""
+        if self._started or not self.sinks:
+            return
+        self._started = True
+        # 큐는 바로 만들어 두고 (publish 즉시 가능), 세션/작업은 루프 스레드에서 생성
+        self._workers = [_SinkWorker(sink) for sink in self.sinks]
+        get_runtime().call_soon(self._spawn)
+        log.info(f"[알림 싱크] 시작: {', '.join(s.name for s in self.sinks)}")
+
+    def _spawn(self):
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        self._session = aiohttp.ClientSession(timeout=timeout)
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            worker.session = self._session
+            self._tasks.append(loop.create_task(worker.run()))
+
+    def publish(self, message):
+        """메시지를 모든 싱크 큐에 넣음 (전송을 기다리지 않음)."""
+        if not self._workers:
+            return
+        runtime = get_runtime()
+        if runtime.in_loop_thread:
+            self._enqueue(message)
+        else:
+            runtime.call_soon(self._enqueue, message)
+
+    def _enqueue(self, message):
+        for worker in self._workers:
+            if worker.queue.qsize() >= MAX_PENDING:
+                # 싱크가 밀림 → 디스크 큐로 (폴링 루프를 막지 않도록 스레드 풀)
+                get_runtime().run_blocking(queue_put, worker.sink.name, [message])
+            else:
+                worker.queue.put_nowait(message)
+
+    async def _close(self):
+        for worker in self._workers:
+            worker.closing = True
+        pending_tasks = self._tasks
+        for _ in range(2):  # wait_for 경합으로 취소가 무시되는 경우 한 번 더
+            for task in pending_tasks:
+                task.cancel()
+            if not pending_tasks:
+                break
+            _, pending_tasks = await asyncio.wait(pending_tasks, timeout=0.5)
+        runtime = get_runtime()
+        for worker in self._workers:
+            pending = list(worker.inflight or []) + worker.backlog
+            while not worker.queue.empty():
+                pending.append(worker.queue.get_nowait())
+            if not pending:
+                continue
+            try:
+                await runtime.to_thread(queue_put, worker.sink.name, pending)
+            except Exception as e:
+                log.error(f"[알림 싱크] {worker.sink.name}: 미전송 {len(pending)}건 보관 실패: {e}")
+                continue
+            log.info(
+                f"[알림 싱크] {worker.sink.name}: 미전송 {len(pending)}건 보관 (다음 실행 시 전송)"
+            )
+        if self._session:
+            await self._session.close()
+
+    def close(self, timeout=3.0):
+        """워커 중지 + 미전송 메시지 디스크 보관 (종료 시)."""
+        if not self._started:
+            return
+        self._started = False
+        try:
+            get_runtime().submit(self._close()).result(timeout)
+        except Exception as e:
+            log.warning(f"[알림 싱크] 종료 정리 실패: {e!r}")
+        self._workers, self._tasks = [], []
+
+
+_dispatcher = None
+
+
+def get_dispatcher():
+    """공유 NotifyDispatcher (최초 호출 시 config.notifySinks 로 생성 + 시작)."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = NotifyDispatcher(create_sinks(load_config().get("notifySinks")))
+        _dispatcher.start()
+    return _dispatcher
+
+
+def close_notify():
+    """싱크 워커 종료 (종료 시, 시작된 적 없으면 무시)."""
+    if _dispatcher is not None:
+        _dispatcher.close()
@@ -1,78 +1,287 @@
 """
 소리 알림 모듈
-Windows MCI API를 사용하여 MP3 재생 및 볼륨 제어.
+알림음을 한 번만 읽어(미리 열어) 두고, 상주 재생 워커 1개가 재생한다.
+재생 백엔드는 교체 가능: Windows MCI(winmm) / Linux 명령행 플레이어 / 무음(null).
 외부 라이브러리 의존성 없음.
+
+사용:
+    play_alert(path, volume)       # 기존 호출 그대로 (워커에 요청만 넣고 즉시 반환)
+    get_sound_service().preload(path)  # 시작 시 미리 열어 첫 알림 지연 제거
+
+[수정 가이드]
+- 백엔드 추가: SoundBackend 상속 (load/play/close) 후 BACKENDS 에 등록.
+- 백엔드 선택: appSettings.soundBackend ("auto" | "winmm" | "linux" | "null").
+- 재생 중 들어온 알림은 합쳐짐 (연속 발견 시 소리는 한 번).
 """
 
 import os
+import sys
+import time
+import shutil
 import logging
 import threading
-import ctypes
+import subprocess
 
 log = logging.getLogger("CasperFinder")
 
-# Windows MCI API
-winmm = ctypes.windll.winmm
+PLAY_TIMEOUT = 10  # 초 — 한 번 재생의 최대 길이
 
 
-def _mci_send(command: str) -> str:
-    """MCI 명령을 실행하고 결과를 반환."""
-    buf = ctypes.create_unicode_buffer(256)
-    err = winmm.mciSendStringW(command, buf, 255, 0)
-    if err:
-        err_buf = ctypes.create_unicode_buffer(256)
-        winmm.mciGetErrorStringW(err, err_buf, 255)
-        raise RuntimeError(f"MCI 오류: {err_buf.value}")
-    return buf.value
+class SoundBackend:
+    """재생 백엔드 인터페이스. 모든 메서드는 재생 워커 스레드에서만 호출된다."""
 
+    name = "base"
 
-def play_alert(file_path: str, volume: int = 80):
-    """MP3 파일을 지정된 볼륨(0~100)으로 재생.
+    def load(self, path):
+        """파일을 열어 재생 준비 (1회)."""
 
-    Args:
-        file_path: MP3 파일 절대 경로
-        volume: 볼륨 0~100 (기본 80)
-    """
-    if not os.path.exists(file_path):
-        log.warning(f"[소리] 파일 없음: {file_path}")
-        return
+    def play(self, volume):
+        """볼륨(0~100)으로 처음부터 재생, 끝날 때까지 대기."""
 
-    def _play():
-        try:
-            alias = "cfalert"
-            # 기존 재생 정리
+    def close(self):
+        """열어 둔 자원 해제."""
+
+
+class NullBackend(SoundBackend):
+    """무음 백엔드 (테스트/헤드리스). 재생 요청만 기록."""
+
+    name = "null"
+
+    def __init__(self):
+        self.played = []  # [volume, ...]
+
+    def play(self, volume):
+        self.played.append(volume)
+
+
+class WinMMBackend(SoundBackend):
+    """Windows MCI 백엔드. 장치를 한 번 열어 두고 처음부터 다시 재생."""
+
+    name = "winmm"
+    ALIAS = "cfalert"
+
+    def __init__(self):
+        import ctypes
+
+        self._ctypes = ctypes
+        self._winmm = ctypes.windll.winmm
+        self._opened = False
+        self._volume = None
+
+    def _send(self, command):
+        """MCI 명령을 실행하고 결과를 반환."""
+        ctypes = self._ctypes
+        buf = ctypes.create_unicode_buffer(256)
+        err = self._winmm.mciSendStringW(command, buf, 255, 0)
+        if err:
+            err_buf = ctypes.create_unicode_buffer(256)
+            self._winmm.mciGetErrorStringW(err, err_buf, 255)
+            raise RuntimeError(f"MCI 오류: {err_buf.value}")
+        return buf.value
+
+    def load(self, path):
+        self.close()
+        self._send(f'open "{path}" type mpegvideo alias {self.ALIAS}')
+        self._opened = True
+        self._volume = None
+
+    def play(self, volume):
+        if not self._opened:
+            return
+        mci_vol = max(0, min(1000, int(volume * 10)))  # MCI: 0~1000
+        if mci_vol != self._volume:
+            self._send(f"setaudio {self.ALIAS} volume to {mci_vol}")
+            self._volume = mci_vol
+        # wait: 재생 완료까지 이 스레드에서 대기 (상태 폴링 없음)
+        self._send(f"play {self.ALIAS} from 0 wait")
+
+    def close(self):
+        if self._opened:
             try:
-                _mci_send(f"close {alias}")
+                self._send(f"close {self.ALIAS}")
             except RuntimeError:
                 pass
+            self._opened = False
+
+
+class CommandBackend(SoundBackend):
+    """Linux 등: 메모리에 올린 파일을 명령행 플레이어 표준입력으로 전달."""
+
+    name = "linux"
+
+    # (실행 파일, 볼륨(0~100) → 인자 목록) — 표준입력("-")에서 MP3 재생
+    PLAYERS = (
+        ("mpg123", lambda v: ["-q", "-f", str(int(32768 * v / 100)), "-"]),
+        (
+            "ffplay",
+            lambda v: ["-nodisp", "-autoexit", "-loglevel", "quiet"]
+            + ["-volume", str(int(v)), "-"],
+        ),
+        ("mpv", lambda v: ["--no-video", "--really-quiet", f"--volume={int(v)}", "-"]),
+    )
+
+    def __init__(self):
+        self._data = None
+        self._player = None
+        for exe, args in self.PLAYERS:
+            path = shutil.which(exe)
+            if path:
+                self._player = (path, args)
+                break
+        if self._player is None:
+            raise RuntimeError("재생 프로그램 없음 (mpg123/ffplay/mpv)")
+
+    def load(self, path):
+        with open(path, "rb") as f:
+            self._data = f.read()
 
-            _mci_send(f'open "{file_path}" type mpegvideo alias {alias}')
+    def play(self, volume):
+        if not self._data:
+            return
+        exe, args = self._player
+        subprocess.run(
+            [exe, *args(volume)],
+            input=self._data,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=PLAY_TIMEOUT,
+            check=False,
+        )
 
-            # 볼륨 설정 (MCI: 0~1000)
-            mci_vol = max(0, min(1000, int(volume * 10)))
-            _mci_send(f"setaudio {alias} volume to {mci_vol}")
 
-            _mci_send(f"play {alias}")
+BACKENDS = {
+    "winmm": WinMMBackend,
+    "linux": CommandBackend,
+    "null": NullBackend,
+}
 
-            # 재생 완료 대기 (최대 10초)
-            import time
 
-            for _ in range(100):
+def create_backend(name="auto"):
+    """이름 → 백엔드. "auto" 는 플랫폼에 맞게 고르고, 실패하면 무음."""
+    if name == "auto":
+        name = "winmm" if sys.platform == "win32" else "linux"
+    try:
+        return BACKENDS[name]()
+    except Exception as e:
+        log.warning(f"[소리] '{name}' 백엔드 사용 불가 → 무음: {e}")
+        return NullBackend()
+
+
+class SoundService:
+    """상주 재생 워커 1개. 요청은 합쳐지고(coalesce) 호출자는 기다리지 않는다."""
+
+    def __init__(self, backend="auto"):
+        self._backend_name = backend if isinstance(backend, str) else None
+        self.backend = backend if not isinstance(backend, str) else None
+        self._cond = threading.Condition()
+        self._path = None  # 요청된 파일
+        self._loaded_path = None  # 백엔드에 열린 파일 (워커 전용)
+        self._request = None  # (volume, 요청 시각) — 대기 중 재생 1건
+        self._playing = False
+        self._closed = False
+        self.last_latency_ms = None
+        self._thread = threading.Thread(
+            target=self._worker, name="casper-sound", daemon=True
+        )
+        self._thread.start()
+
+    # ── 호출자 (아무 스레드) ──
+
+    def preload(self, path):
+        """파일을 워커에서 미리 열어 둠 (재생 없음)."""
+        with self._cond:
+            self._path = path
+            self._cond.notify()
+
+    def play(self, path, volume=80):
+        """재생 요청. 재생 중이거나 이미 대기 중이면 합쳐서 무시 (False)."""
+        with self._cond:
+            self._path = path
+            if self._playing or self._request is not None:
+                return False
+            self._request = (volume, time.perf_counter())
+            self._cond.notify()
+            return True
+
+    def close(self, timeout=2.0):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    # ── 재생 워커 ──
+
+    def _worker(self):
+        if self.backend is None:
+            self.backend = create_backend(self._backend_name or "auto")
+        try:
+            while True:
+                with self._cond:
+                    while not self._closed and self._request is None and (
+                        self._path == self._loaded_path
+                    ):
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                    path, request = self._path, self._request
+                    self._request = None
+                    self._playing = request is not None
+
                 try:
-                    status = _mci_send(f"status {alias} mode")
-                    if status != "playing":
-                        break
-                except RuntimeError:
-                    break
-                time.sleep(0.1)
+                    if path != self._loaded_path:
+                        self._loaded_path = path
+                        self.backend.load(path)
+                    if request is not None:
+                        volume, requested_at = request
+                        elapsed = time.perf_counter() - requested_at
+                        self.last_latency_ms = elapsed * 1000
+                        log.debug("[소리] 재생 시작 지연 %.1fms", self.last_latency_ms)
+                        self.backend.play(volume)
+                except Exception as e:
+                    log.error(f"[소리] 재생 실패: {e}")
+                finally:
+                    with self._cond:
+                        self._playing = False
+        finally:
+            self.backend.close()
 
-            try:
-                _mci_send(f"close {alias}")
-            except RuntimeError:
-                pass
 
-        except Exception as e:
-            log.error(f"[소리] 재생 실패: {e}")
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_sound_service(backend=None):
+    """공유 SoundService (최초 호출 시 워커 시작).
+
+    backend: 최초 생성 시에만 사용 (이름 또는 SoundBackend 인스턴스, 기본 appSettings.soundBackend).
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            if backend is None:
+                from core.config import load_config
+
+                backend = load_config().get("appSettings", {}).get("soundBackend", "auto")
+            _service = SoundService(backend)
+        return _service
+
+
+def play_alert(file_path: str, volume: int = 80):
+    """MP3 파일을 지정된 볼륨(0~100)으로 재생 (즉시 반환).
+
+    Args:
+        file_path: MP3 파일 절대 경로
+        volume: 볼륨 0~100 (기본 80)
+    """
+    if not os.path.exists(file_path):
+        log.warning(f"[소리] 파일 없음: {file_path}")
+        return
+    get_sound_service().play(file_path, volume)
+
 
-    # 메인 스레드 차단 방지
-    threading.Thread(target=_play, daemon=True).start()
+def close_sound():
+    """재생 워커 종료 + 장치 닫기 (종료 시, 시작된 적 없으면 무시)."""
+    with _service_lock:
+        service = _service
+    if service is not None:
+        service.close()
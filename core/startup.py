@@ -0,0 +1,60 @@
+"""
+시작 시간 측정 모듈 (startup timeline)
+main.py 진입부터 첫 화면 표시까지 단계별 소요 시간을 기록해 로그로 남긴다.
+표준 라이브러리만 사용 (가장 먼저 import 되어야 하므로 다른 모듈 의존 없음).
+
+사용:
+    from core import startup
+    startup.mark("엔진 생성")          # 직전 표시 이후 구간 기록
+    with startup.timed("조건설정 탭"):  # 지연 로드 구간 (화면 표시 이후엔 즉시 로그)
+        ...
+    startup.report()                  # 첫 화면 표시 시 1회 출력
+"""
+
+import time
+import logging
+from contextlib import contextmanager
+
+log = logging.getLogger("CasperFinder")
+
+_T0 = time.perf_counter()
+_last = _T0
+_marks = []  # [(이름, 구간 ms, 누적 ms)]
+_reported = False
+
+
+def _ms(seconds):
+    return int(seconds * 1000)
+
+
+def mark(name):
+    """직전 표시 이후 구간을 name 으로 기록."""
+    global _last
+    now = time.perf_counter()
+    _marks.append((name, _ms(now - _last), _ms(now - _T0)))
+    _last = now
+
+
+@contextmanager
+def timed(name):
+    """블록 소요 시간 기록. report() 이후에는 바로 로그로 출력."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = _ms(time.perf_counter() - start)
+        if _reported:
+            log.info("[시작] 지연 로드: %s %dms", name, elapsed)
+        else:
+            _marks.append((name, elapsed, _ms(time.perf_counter() - _T0)))
+
+
+def report():
+    """시작 타임라인을 로그로 출력 (1회)."""
+    global _reported
+    if _reported:
+        return
+    _reported = True
+    mark("첫 화면 표시")
+    lines = [f"  {total:>6}ms  (+{step:>5}ms)  {name}" for name, step, total in _marks]
+    log.info("[시작] 시작 타임라인\n%s", "\n".join(lines))
@@ -1,13 +1,16 @@
 """
 데이터 저장 모듈
-known_vehicles.json, history.json 관리.
+known_vehicles.json, 알림 히스토리(SQLite) 관리.
 
 [수정 가이드]
 - 저장 형식 변경 시: 이 파일만 수정.
-- DB로 전환 시: 함수 시그니처 유지하고 내부 구현만 교체.
+- 히스토리 컬럼 추가: _HISTORY_SCHEMA + _HISTORY_FIELDS 같이 수정.
 """
 
 import os
+import time
+import logging
+from core import db
 from core.config import (
     KNOWN_VEHICLES_PATH,
     HISTORY_PATH,
@@ -15,6 +18,34 @@ from core.config import (
     save_json,
 )
 
+log = logging.getLogger("CasperFinder")
+
+_HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id     INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts     REAL NOT NULL,
+    time   TEXT NOT NULL DEFAULT '',
+    label  TEXT NOT NULL DEFAULT '',
+    model  TEXT NOT NULL DEFAULT '',
+    trim   TEXT NOT NULL DEFAULT '',
+    center TEXT NOT NULL DEFAULT '',
+    price  TEXT NOT NULL DEFAULT '',
+    url    TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_history_ts ON history(ts);
+CREATE INDEX IF NOT EXISTS idx_history_label ON history(label, ts);
+CREATE INDEX IF NOT EXISTS idx_history_trim ON history(trim, ts);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_LEGACY_IMPORTED = "legacyHistoryImported"  # meta 키 — history.json 이전 완료 시각
+
+# 히스토리 항목 dict 키 (= 컬럼, id 제외)
+_HISTORY_FIELDS = ("ts", "time", "label", "model", "trim", "center", "price", "url")
+
 
 def load_known_vehicles():
     """기존에 확인된 vehicleId 목록 로드."""
@@ -32,13 +63,121 @@ def reset_known_vehicles():
         os.remove(KNOWN_VEHICLES_PATH)
 
 
-def load_history():
-    """알림 히스토리 로드."""
-    return load_json(HISTORY_PATH, [])
+# ── 알림 히스토리 (SQLite) ──
+
+_INSERT_HISTORY = (
+    f"INSERT INTO history ({', '.join(_HISTORY_FIELDS)}) "
+    f"VALUES ({', '.join('?' for _ in _HISTORY_FIELDS)})"
+)
+
+
+def _history_row(item):
+    ts = item.get("ts") or time.time()
+    return tuple(
+        ts if key == "ts" else str(item.get(key, "") or "") for key in _HISTORY_FIELDS
+    )
+
+
+def _import_legacy_history(conn):
+    """기존 history.json 을 1회 가져온 뒤 .bak 으로 이름 변경.
+
+    이전 완료 표시(meta)는 가져온 행과 같은 트랜잭션에 기록 → 이름 변경이 실패해도
+    다음 실행에서 다시 가져오지 않고 이름 변경만 재시도.
+    """
+    if not HISTORY_PATH.exists():
+        return
+    done = conn.execute("SELECT 1 FROM meta WHERE key = ?", (_LEGACY_IMPORTED,))
+    if done.fetchone() is None:
+        legacy = load_json(HISTORY_PATH, [])
+        # 시각은 HH:MM:SS 만 남아 있으므로 파일 수정 시각 기준, 순서는 id로 보존
+        ts = HISTORY_PATH.stat().st_mtime
+        rows = [
+            _history_row(dict(item, ts=item.get("ts", ts)))
+            for item in legacy
+            if isinstance(item, dict)
+        ]
+        with conn:
+            conn.executemany(_INSERT_HISTORY, rows)
+            conn.execute(
+                "INSERT INTO meta(key, value) VALUES (?, ?)",
+                (_LEGACY_IMPORTED, str(time.time())),
+            )
+        log.info(f"[히스토리] history.json → DB 이전 완료 ({len(rows)}건)")
+    try:
+        os.replace(HISTORY_PATH, HISTORY_PATH.with_suffix(".json.bak"))
+    except OSError as e:
+        log.warning(f"[히스토리] history.json 백업 이름 변경 실패: {e}")
+
+
+def _ensure_history():
+    db.ensure_schema("history", _HISTORY_SCHEMA, on_create=_import_legacy_history)
+
+
+def append_history(items):
+    """히스토리 항목 여러 건을 한 트랜잭션으로 추가."""
+    if not items:
+        return
+    _ensure_history()
+    with db.transaction() as conn:
+        conn.executemany(_INSERT_HISTORY, [_history_row(i) for i in items])
+
+
+def load_history(limit=200):
+    """최근 알림 히스토리 로드 (오래된 것 → 최신 순). limit=None 이면 전체."""
+    _ensure_history()
+    sql = f"SELECT {', '.join(_HISTORY_FIELDS)} FROM history ORDER BY ts DESC, id DESC"
+    params = ()
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = (limit,)
+    return [dict(row) for row in reversed(db.query(sql, params))]
 
 
 def save_history(data):
-    """알림 히스토리 저장. 최대 200건 유지."""
-    if len(data) > 200:
-        data = data[-200:]
-    save_json(HISTORY_PATH, data)
+    """알림 히스토리 전체 교체 (하위 호환용). 일반 저장은 append_history 사용."""
+    _ensure_history()
+    with db.transaction() as conn:
+        conn.execute("DELETE FROM history")
+        conn.executemany(_INSERT_HISTORY, [_history_row(i) for i in data])
+
+
+def query_history(page=1, page_size=50, label=None, trim=None, since=None):
+    """히스토리 페이지 조회 (최신순).
+
+    Returns:
+        (items: list[dict], total: int)
+    """
+    _ensure_history()
+    where, params = [], []
+    if label:
+        where.append("label = ?")
+        params.append(label)
+    if trim:
+        where.append("trim = ?")
+        params.append(trim)
+    if since is not None:
+        where.append("ts >= ?")
+        params.append(since)
+    clause = f" WHERE {' AND '.join(where)}" if where else ""
+
+    total = db.query(f"SELECT COUNT(*) FROM history{clause}", params)[0][0]
+    offset = max(page - 1, 0) * page_size
+    rows = db.query(
+        f"SELECT id, {', '.join(_HISTORY_FIELDS)} FROM history{clause} "
+        "ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?",
+        params + [page_size, offset],
+    )
+    return [dict(row) for row in rows], total
+
+
+def prune_history(retention_days):
+    """보관 기간이 지난 히스토리 삭제. retention_days <= 0 이면 무제한 보관."""
+    if not retention_days or retention_days <= 0:
+        return 0
+    _ensure_history()
+    cutoff = time.time() - retention_days * 86400
+    with db.transaction() as conn:
+        deleted = conn.execute("DELETE FROM history WHERE ts < ?", (cutoff,)).rowcount
+    if deleted:
+        log.info(f"[히스토리] 보관 기간({retention_days}일) 경과 {deleted}건 삭제")
+    return deleted
@@ -0,0 +1,315 @@
+"""
+시계열 저장 모듈 (열 지향, 다운샘플링)
+기획전별 재고 수 / 최저가 / 중앙가 / 할인액 추이를 주 단위 차트로 그리기 위한 저장소.
+GUI 프레임워크 의존성 없음.
+
+구조:
+- 계층(tier): raw(변경 시점) → 1m(1분 버킷) → 1h(1시간 버킷)
+- 파일: DATA_DIR/timeseries/<시리즈>/<tier>-<세그먼트 번호>.<열 이름>
+  열마다 float64(little-endian) 배열을 이어 붙인 파일 (array.tofile).
+- 쓰기: 값이 직전 기록과 같으면 기록하지 않음 (계단형 — 빈 구간은 "변화 없음").
+  record() 는 메모리에만 쌓고(호출 스레드 차단 없음), 파일 추가는 write_pending() / flush()
+  (엔진은 스레드 풀에서 호출). 같은 타임스탬프 행은 새로 붙이지 않고 마지막 행을 덮어씀
+  (부분 버킷 flush 후 같은 버킷이 이어져도 행 1개).
+- 읽기: mmap + memoryview.cast("d") 로 복사 없이 열을 보고 bisect 로 범위 탐색.
+- 보관: 세그먼트 단위 삭제 (raw 7일, 1m 90일, 1h 무제한).
+
+[수정 가이드]
+- 지표 추가: METRICS + AGGREGATORS 에 같이 추가 (기존 파일은 해당 열 없음 → 빈 값).
+- 차트 구간별 계층 선택 기준: _pick_tier().
+"""
+
+import os
+import re
+import sys
+import mmap
+import time
+import bisect
+import logging
+import threading
+from array import array
+
+from core.config import DATA_DIR
+
+TIMESERIES_DIR = DATA_DIR / "timeseries"
+
+METRICS = ("count", "min_price", "median_price", "max_discount")
+
+# 다운샘플링 버킷 집계 방식 (버킷 안의 관측값 → 대표값)
+AGGREGATORS = {
+    "count": "last",
+    "min_price": "min",
+    "median_price": "last",
+    "max_discount": "max",
+}
+
+# tier: (버킷 길이 초, 세그먼트 길이 초, 보관 기간 초 | None)
+TIERS = {
+    "raw": (0, 86400, 7 * 86400),
+    "1m": (60, 30 * 86400, 90 * 86400),
+    "1h": (3600, 365 * 86400, None),
+}
+
+log = logging.getLogger("CasperFinder")
+
+_SAFE_NAME = re.compile(r"[^0-9A-Za-z_-]")
+
+
+def _aggregate(how, current, value):
+    if current is None:
+        return value
+    if how == "min":
+        return min(current, value)
+    if how == "max":
+        return max(current, value)
+    return value  # last
+
+
+def _read_column(path):
+    """열 파일 → float64 시퀀스 (mmap 뷰). 없거나 비어 있으면 빈 array."""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return array("d")
+    size -= size % 8  # 기록 도중 잘린 꼬리 무시
+    if size == 0:
+        return array("d")
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+    view = memoryview(mm).cast("d")
+    if sys.byteorder != "little":
+        # 빅엔디언 환경: 복사 후 바이트 순서 변환
+        values = array("d", view)
+        values.byteswap()
+        view.release()
+        mm.close()
+        return values
+    return view
+
+
+def _last_value(path):
+    """열 파일의 마지막 값 (없으면 None)."""
+    try:
+        with open(path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            size -= size % 8
+            if size == 0:
+                return None
+            f.seek(size - 8)
+            col = array("d")
+            col.frombytes(f.read(8))
+    except OSError:
+        return None
+    if sys.byteorder != "little":
+        col.byteswap()
+    return col[0]
+
+
+class TimeSeriesStore:
+    """시리즈(기획전)별 열 지향 시계열 저장소. 여러 스레드에서 사용 가능."""
+
+    def __init__(self, root=TIMESERIES_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 파일 쓰기 직렬화 (행 순서 보장)
+        self._pending = []  # 파일에 아직 안 쓴 행 [(series, tier, ts, row)]
+        self._tail = {}  # {(series, tier): 파일의 마지막 행 ts} — 같은 ts 는 덮어쓰기
+        self._last = {}  # {(series, tier): 마지막 기록 값 튜플}
+        self._buckets = {}  # {(series, tier): [버킷 시작, {metric: 값}]}
+        self._latest = {}  # {series: (ts, {metric: 값})} — 차트 마지막 점
+
+    # ── 쓰기 ──
+
+    def record(self, series, values, ts=None):
+        """관측값 1건 기록 (매 폴링 호출, 메모리만). values: {metric: 숫자}
+
+        Returns:
+            bool: 파일에 쓸 행이 쌓였는지 (True 면 write_pending() 호출)
+        """
+        ts = ts or time.time()
+        values = {m: float(values[m]) for m in METRICS if values.get(m) is not None}
+        with self._lock:
+            self._latest[series] = (ts, values)
+            self._append_if_changed(series, "raw", ts, values)
+            for tier, (bucket_len, _, _) in TIERS.items():
+                if bucket_len:
+                    self._add_to_bucket(series, tier, bucket_len, ts, values)
+            return bool(self._pending)
+
+    def _add_to_bucket(self, series, tier, bucket_len, ts, values):
+        start = ts - ts % bucket_len
+        key = (series, tier)
+        bucket = self._buckets.get(key)
+        if bucket and bucket[0] != start:
+            self._append_if_changed(series, tier, bucket[0], bucket[1])
+            bucket = None
+        if bucket is None:
+            bucket = self._buckets[key] = [start, {}]
+        agg = bucket[1]
+        for metric, value in values.items():
+            agg[metric] = _aggregate(AGGREGATORS[metric], agg.get(metric), value)
+
+    def _append_if_changed(self, series, tier, ts, values):
+        key = (series, tier)
+        compare = tuple(values.get(m) for m in METRICS)  # 누락 값은 None 으로 비교
+        if self._last.get(key) == compare:
+            return
+        self._last[key] = compare
+        row = tuple(float("nan") if v is None else v for v in compare)
+        self._pending.append((series, tier, ts, row))
+
+    def write_pending(self):
+        """쌓인 행을 파일에 추가 (블로킹 — 스레드 풀에서)."""
+        with self._write_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+            for series, tier, ts, row in rows:
+                self._write_row(series, tier, ts, row)
+
+    def flush(self):
+        """열려 있는 버킷까지 모두 기록 (중지/종료 시, 블로킹).
+
+        버킷은 유지 — 같은 버킷이 이어지면 닫힐 때 같은 ts 행을 덮어씀.
+        """
+        with self._lock:
+            for (series, tier), (start, agg) in self._buckets.items():
+                self._append_if_changed(series, tier, start, agg)
+        self.write_pending()
+
+    def _write_row(self, series, tier, ts, row):
+        seg_dir = self._series_dir(series)
+        prefix = self._segment_prefix(tier, ts)
+        key = (series, tier)
+        try:
+            seg_dir.mkdir(parents=True, exist_ok=True)
+            if key not in self._tail:
+                self._tail[key] = _last_value(seg_dir / f"{prefix}.ts")
+            # 같은 버킷 시각이면 마지막 행 덮어쓰기 (부분 버킷 flush 후 재개, 재시작 포함)
+            replace = self._tail[key] == ts
+            # 열마다 한 값씩 (도중 실패 시 읽기는 가장 짧은 열 길이에 맞춤)
+            for column, value in (("ts", ts),) + tuple(zip(METRICS, row)):
+                col = array("d", [value])
+                if sys.byteorder != "little":
+                    col.byteswap()
+                with open(seg_dir / f"{prefix}.{column}", "r+b" if replace else "ab") as f:
+                    if replace:
+                        f.seek(-8, os.SEEK_END)
+                    col.tofile(f)
+            self._tail[key] = ts
+        except OSError as e:
+            self._tail.pop(key, None)  # 다음 쓰기 때 파일에서 다시 확인
+            log.warning(f"[시계열] 기록 실패 ({series}/{tier}): {e}")
+
+    def prune(self, now=None):
+        """보관 기간이 지난 세그먼트 파일 삭제."""
+        now = now or time.time()
+        if not self.root.exists():
+            return
+        for series_dir in self.root.iterdir():
+            for path in series_dir.glob("*-*.*"):
+                tier, _, rest = path.name.partition("-")
+                if tier not in TIERS or TIERS[tier][2] is None:
+                    continue
+                _, seg_len, retention = TIERS[tier]
+                try:
+                    seg_no = int(rest.split(".", 1)[0])
+                except ValueError:
+                    continue
+                if (seg_no + 1) * seg_len < now - retention:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+    # ── 읽기 ──
+
+    def query(self, series, start, end=None, metrics=METRICS, tier=None):
+        """범위 조회. 구간 길이에 맞는 계층을 자동 선택.
+
+        시작 시점 직전 값 1개를 포함하고(계단형 차트 기준점),
+        마지막 관측값을 끝점으로 덧붙인다.
+
+        Returns:
+            {"tier": str, "ts": [...], metric: [...], ...}
+        """
+        end = end or time.time()
+        tier = tier or self._pick_tier(end - start)
+        _, seg_len, _ = TIERS[tier]
+        result = {"tier": tier, "ts": []}
+        result.update({m: [] for m in metrics})
+
+        seg_dir = self._series_dir(series)
+        first_seg = int(start // seg_len)
+        segments = sorted(
+            seg
+            for seg in self._segments(seg_dir, tier)
+            if first_seg - 1 <= seg <= int(end // seg_len)
+        )
+
+        anchor = None  # 시작 직전 마지막 점 (세그먼트 경계 포함)
+        for seg in segments:
+            prefix = f"{tier}-{seg}"
+            ts_col = _read_column(seg_dir / f"{prefix}.ts")
+            cols = {m: _read_column(seg_dir / f"{prefix}.{m}") for m in metrics}
+            n = min([len(ts_col)] + [len(c) for c in cols.values()])
+            lo = bisect.bisect_left(ts_col, start, 0, n)
+            hi = bisect.bisect_right(ts_col, end, 0, n)
+            if lo > 0:
+                anchor = (ts_col[lo - 1], {m: cols[m][lo - 1] for m in metrics})
+            if lo < hi:
+                if anchor and not result["ts"]:
+                    self._append_point(result, metrics, start, anchor[1])
+                result["ts"].extend(ts_col[lo:hi])
+                for m in metrics:
+                    result[m].extend(cols[m][lo:hi])
+            for col in (ts_col, *cols.values()):
+                if isinstance(col, memoryview):
+                    col.release()
+
+        if anchor and not result["ts"]:
+            self._append_point(result, metrics, start, anchor[1])
+
+        with self._lock:
+            latest = self._latest.get(series)
+        if latest and start <= latest[0] <= end:
+            if not result["ts"] or latest[0] > result["ts"][-1]:
+                nan = float("nan")
+                self._append_point(
+                    result, metrics, latest[0], {m: latest[1].get(m, nan) for m in metrics}
+                )
+        return result
+
+    @staticmethod
+    def _append_point(result, metrics, ts, values):
+        result["ts"].append(ts)
+        for m in metrics:
+            result[m].append(values[m])
+
+    @staticmethod
+    def _pick_tier(span):
+        if span <= 6 * 3600:
+            return "raw"
+        if span <= 7 * 86400:
+            return "1m"
+        return "1h"
+
+    # ── 경로 ──
+
+    def _series_dir(self, series):
+        return self.root / _SAFE_NAME.sub("_", str(series))
+
+    @staticmethod
+    def _segment_prefix(tier, ts):
+        return f"{tier}-{int(ts // TIERS[tier][1])}"
+
+    @staticmethod
+    def _segments(seg_dir, tier):
+        if not seg_dir.exists():
+            return []
+        segs = set()
+        for path in seg_dir.glob(f"{tier}-*.ts"):
+            try:
+                segs.add(int(path.stem.split("-", 1)[1]))
+            except ValueError:
+                continue
+        return segs
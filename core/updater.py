@@ -1,16 +1,33 @@
 """
 GitHub Releases 기반 업데이트 확인 및 다운로드 모듈.
 https://github.com/jominki354/CasperFinder/releases 에서 최신 릴리스를 확인합니다.
+
+- 확인: 릴리스 정보를 DATA_DIR/update_cache.json 에 보관. CHECK_TTL 안에서는 네트워크 호출 없음,
+  만료 후에는 ETag(If-None-Match)로 조건부 요청 (304 → 캐시 재사용, API 한도 미소모).
+- 다운로드: UPDATES_DIR/<태그>/ 의 .part 파일로 청크 스트리밍 (메모리 일정), 끊기면 Range 요청으로 이어받기.
+- 검증: 릴리스에 게시된 SHA-256 (에셋 digest 또는 <파일명>.sha256 에셋)과 일치해야 설치 진행.
+- 스테이징: 새 버전 발견 시 stage_update() 로 미리 받아 둠 (속도 제한). 사용자가 업데이트를
+  누르면 진행 중인 작업에 합류(제한 해제)하거나, 이미 받은 파일을 재검증 후 바로 설치.
+
+[수정 가이드]
+- 캐시 유효 시간: CHECK_TTL. 강제 확인(설정 탭 버튼)은 check_update(..., force=True).
+- 해시 게시 방식 추가: _published_sha256() 수정.
+- 백그라운드 속도 제한: BACKGROUND_RATE_LIMIT. 오래된 스테이징 정리: cleanup_staged().
 """
 
 import os
-import tempfile
+import time
+import hashlib
+import shutil
 import threading
 import logging
 import subprocess
+import urllib.error
 import urllib.request
 import json
 from core.version import APP_VERSION
+from core.runtime import get_runtime
+from core.config import APP_DATA_DIR, DATA_DIR, load_json, save_json
 
 log = logging.getLogger("CasperFinder")
 
@@ -18,6 +35,19 @@ GITHUB_REPO = "jominki354/CasperFinder"
 GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 RELEASES_PAGE_URL = f"https://github.com/{GITHUB_REPO}/releases"
 
+UPDATE_CACHE_PATH = DATA_DIR / "update_cache.json"
+CHECK_TTL = 6 * 3600  # 초 — 이 시간 안의 재확인은 캐시 사용
+
+CHUNK_SIZE = 64 * 1024  # 64KB
+DOWNLOAD_RETRIES = 3  # 끊김 시 이어받기 재시도 횟수
+PROGRESS_INTERVAL = 0.1  # 초 — 진행률 콜백 최소 간격
+
+UPDATES_DIR = APP_DATA_DIR / "updates"  # 버전별 스테이징 폴더 (updates/<태그>/)
+STAGED_MANIFEST = "staged.json"  # {url, file, sha256, size}
+BACKGROUND_RATE_LIMIT = 512 * 1024  # 초당 바이트 — 백그라운드 다운로드 속도 제한
+
+_USER_AGENT = "CasperFinder-Updater"
+
 
 def _parse_version(tag: str) -> tuple:
     """태그 문자열에서 버전 튜플 추출.
@@ -34,41 +64,69 @@ def _parse_version(tag: str) -> tuple:
     return tuple(result)
 
 
-def check_update(callback):
+def _fetch_release(force=False, now=None):
+    """최신 릴리스 JSON (캐시 → ETag 조건부 요청 → 전체 요청 순).
+
+    Returns:
+        릴리스 dict (304 면 캐시된 dict).
+
+    Raises:
+        urllib.error.HTTPError: 릴리스 없음(404) 포함 — check_update() 가 처리.
+    """
+    now = now or time.time()
+    cache = load_json(UPDATE_CACHE_PATH, {})
+    cached = cache.get("release")
+    if cached and not force and now - cache.get("fetchedAt", 0) < CHECK_TTL:
+        log.info("[업데이트] 캐시된 릴리스 정보 사용")
+        return cached
+
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": _USER_AGENT,
+    }
+    if cached and cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    req = urllib.request.Request(GITHUB_API_URL, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            data = json.loads(resp.read().decode("utf-8"))
+            etag = resp.headers.get("ETag", "")
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not cached:
+            raise
+        log.info("[업데이트] 릴리스 변경 없음 (304)")
+        data, etag = cached, cache.get("etag", "")
+
+    save_json(UPDATE_CACHE_PATH, {"etag": etag, "fetchedAt": now, "release": data})
+    return data
+
+
+def _pick_download_url(data):
+    """다운로드 URL: 릴리스에 첨부된 .exe 에셋 우선."""
+    assets = data.get("assets", [])
+    for asset in assets:
+        if asset.get("name", "").lower().endswith(".exe"):
+            return asset.get("browser_download_url", "")
+    if assets:
+        return assets[0].get("browser_download_url", RELEASES_PAGE_URL)
+    return data.get("html_url", RELEASES_PAGE_URL)
+
+
+def check_update(callback, force=False):
     """비동기로 GitHub Releases API를 호출하여 최신 버전을 확인합니다.
 
     Args:
         callback: (has_update: bool, latest_version: str, download_url: str, error: str|None) -> None
+        force: True 면 캐시 유효 시간을 무시하고 서버에 확인 (ETag 조건부 요청)
     """
 
     def _worker():
         try:
-            req = urllib.request.Request(
-                GITHUB_API_URL,
-                headers={
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "CasperFinder-Updater",
-                },
-            )
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-
+            data = _fetch_release(force=force)
             latest_tag = data.get("tag_name", "")
             latest_ver = _parse_version(latest_tag)
             current_ver = _parse_version(APP_VERSION)
-
-            # 다운로드 URL: 릴리스에 첨부된 .exe 에셋 우선
-            assets = data.get("assets", [])
-            download_url = ""
-            for asset in assets:
-                name = asset.get("name", "")
-                if name.lower().endswith(".exe"):
-                    download_url = asset.get("browser_download_url", "")
-                    break
-            if not download_url and assets:
-                download_url = assets[0].get("browser_download_url", RELEASES_PAGE_URL)
-            if not download_url:
-                download_url = data.get("html_url", RELEASES_PAGE_URL)
+            download_url = _pick_download_url(data)
 
             has_update = latest_ver > current_ver
             log.info(
@@ -87,57 +145,311 @@ def check_update(callback):
             log.error(f"[업데이트] 확인 실패: {e}")
             callback(False, "", "", f"확인 실패: {type(e).__name__}")
 
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
+    get_runtime().run_blocking(_worker)
 
 
-def download_update(url, on_progress, on_complete, on_error):
-    """설치파일을 다운로드합니다.
+# ── 다운로드 / 스테이징 ──
 
-    Args:
-        url: 다운로드 URL
-        on_progress: (downloaded_bytes: int, total_bytes: int, percent: float) -> None
-        on_complete: (file_path: str) -> None
-        on_error: (error_msg: str) -> None
+
+def _release_asset(url):
+    """캐시된 릴리스에서 url 에 해당하는 (릴리스, 에셋). 없으면 (릴리스, None)."""
+    release = load_json(UPDATE_CACHE_PATH, {}).get("release") or {}
+    assets = release.get("assets", [])
+    asset = next((a for a in assets if a.get("browser_download_url") == url), None)
+    return release, asset
+
+
+def _published_sha256(url):
+    """캐시된 릴리스 정보에서 다운로드 에셋의 SHA-256 (소문자 hex). 없으면 None.
+
+    1) 에셋 digest 필드 ("sha256:<hex>")
+    2) 같은 릴리스의 "<파일명>.sha256" 에셋 (sha256sum 형식 첫 토큰)
     """
+    release, asset = _release_asset(url)
+    if asset is None:
+        return None
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest.split(":", 1)[1].lower()
 
-    def _worker():
-        try:
-            req = urllib.request.Request(
-                url, headers={"User-Agent": "CasperFinder-Updater"}
-            )
-            resp = urllib.request.urlopen(req, timeout=60)
-
-            total = int(resp.headers.get("Content-Length", 0))
-            filename = url.split("/")[-1]
-            if not filename.endswith(".exe"):
-                filename = "CasperFinder-Setup.exe"
-
-            # temp 폴더에 저장
-            save_path = os.path.join(tempfile.gettempdir(), filename)
-
-            downloaded = 0
-            chunk_size = 64 * 1024  # 64KB
-
-            with open(save_path, "wb") as f:
-                while True:
-                    chunk = resp.read(chunk_size)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
+    sums_name = f"{asset.get('name', '')}.sha256".lower()
+    assets = release.get("assets", [])
+    sums = next((a for a in assets if a.get("name", "").lower() == sums_name), None)
+    if sums is None:
+        return None
+    req = urllib.request.Request(
+        sums["browser_download_url"], headers={"User-Agent": _USER_AGENT}
+    )
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        text = resp.read(4096).decode("utf-8", "replace").strip()
+    return text.split()[0].lower() if text else None
+
+
+def _file_sha256(path):
+    """파일 SHA-256 (청크 단위, 메모리 일정)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _download_to(url, part_path, on_progress, rate_limit=None):
+    """part_path 에 이어서 받기 (Range). 완료 시 전체 크기 반환.
+
+    rate_limit: () -> 초당 바이트 | None. 청크마다 다시 읽음 (도중에 제한 해제 가능).
+    """
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    headers = {"User-Agent": _USER_AGENT}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        resp = urllib.request.urlopen(req, timeout=60)
+    except urllib.error.HTTPError as e:
+        if e.code == 416 and offset:  # 이미 끝까지 받음
+            return offset
+        raise
+
+    with resp:
+        if offset and resp.status != 206:
+            offset = 0  # 서버가 Range 미지원 → 처음부터
+        length = int(resp.headers.get("Content-Length", 0) or 0)
+        total = offset + length if length else 0
+        if offset:
+            log.info(f"[업데이트] 이어받기: {offset} bytes 부터")
+
+        downloaded = offset
+        started = time.monotonic()
+        last_report = 0.0
+        with open(part_path, "ab" if offset else "wb") as f:
+            while True:
+                chunk = resp.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                downloaded += len(chunk)
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
                     percent = (downloaded / total * 100) if total > 0 else 0
                     on_progress(downloaded, total, percent)
 
-            log.info(f"[업데이트] 다운로드 완료: {save_path} ({downloaded} bytes)")
-            on_complete(save_path)
+                limit = rate_limit() if rate_limit else None
+                if limit:
+                    ahead = (downloaded - offset) / limit - (now - started)
+                    if ahead > 0:
+                        time.sleep(min(ahead, 1.0))
+
+        if total and downloaded < total:
+            raise ConnectionError(f"연결 끊김 ({downloaded}/{total} bytes)")
+        on_progress(downloaded, total or downloaded, 100.0)
+        return downloaded
+
 
+def _stage_dir(version):
+    return UPDATES_DIR / (version or "latest")
+
+
+def staged_update(version):
+    """version 설치파일이 스테이징되어 있으면 경로 (해시는 설치 직전에 다시 검증)."""
+    manifest = load_json(_stage_dir(version) / STAGED_MANIFEST, {})
+    path = _stage_dir(version) / manifest.get("file", "")
+    if manifest.get("sha256") and path.is_file():
+        if path.stat().st_size == manifest.get("size"):
+            return str(path)
+    return None
+
+
+def cleanup_staged(keep=None):
+    """스테이징 폴더 정리: 현재 버전 이하(설치 완료/구버전)와 keep 이외 버전 삭제.
+
+    진행 중인 스테이징 작업의 폴더는 건드리지 않음.
+    """
+    if not UPDATES_DIR.is_dir():
+        return
+    current = _parse_version(APP_VERSION)
+    with _jobs_lock:
+        active = {job.version for job in _jobs.values()}
+    for entry in UPDATES_DIR.iterdir():
+        if entry.name in active or not entry.is_dir():
+            continue
+        stale = _parse_version(entry.name) <= current or (keep and entry.name != keep)
+        if stale:
+            shutil.rmtree(entry, ignore_errors=True)
+            log.info(f"[업데이트] 오래된 스테이징 삭제: {entry.name}")
+
+
+class _StageJob:
+    """설치파일 1개의 다운로드 → 검증 → 스테이징 작업.
+
+    백그라운드(속도 제한)로 시작해도 사용자가 다운로드를 누르면 전속력으로 전환되고,
+    같은 작업의 진행률/완료를 함께 받는다 (중복 다운로드 없음).
+    """
+
+    def __init__(self, url, version, sha256=None):
+        self.url = url
+        self.version = version
+        self.sha256 = sha256
+        self.rate_limit = BACKGROUND_RATE_LIMIT
+        self._lock = threading.Lock()
+        self._listeners = []  # [(on_progress, on_complete, on_error)]
+        self._result = None  # ("ok", path) | ("error", msg)
+
+    def attach(self, on_progress, on_complete, on_error, foreground=True):
+        """결과 수신자 추가. 이미 끝난 작업이면 바로 전달."""
+        with self._lock:
+            if foreground:
+                self.rate_limit = None
+            result = self._result
+            if result is None:
+                self._listeners.append((on_progress, on_complete, on_error))
+                return
+        kind, value = result
+        (on_complete if kind == "ok" else on_error)(value)
+
+    def _progress(self, downloaded, total, percent):
+        with self._lock:
+            listeners = list(self._listeners)
+        for on_progress, _, _ in listeners:
+            on_progress(downloaded, total, percent)
+
+    def _finish(self, kind, value):
+        with self._lock:
+            self._result = (kind, value)
+            listeners, self._listeners = self._listeners, []
+        for _, on_complete, on_error in listeners:
+            (on_complete if kind == "ok" else on_error)(value)
+
+    def run(self):
+        try:
+            path = self._stage()
+            self._finish("ok", path)
         except Exception as e:
             log.error(f"[업데이트] 다운로드 실패: {e}")
-            on_error(f"다운로드 실패: {type(e).__name__}: {e}")
+            self._finish("error", f"다운로드 실패: {type(e).__name__}: {e}")
+        finally:
+            with _jobs_lock:
+                if _jobs.get(self.url) is self:
+                    del _jobs[self.url]
+
+    def _stage(self):
+        stage_dir = _stage_dir(self.version)
+        manifest = load_json(stage_dir / STAGED_MANIFEST, {})
+        expected = (
+            self.sha256
+            or (manifest.get("sha256") if manifest.get("url") == self.url else None)
+            or _published_sha256(self.url)
+            or ""
+        ).lower()
+        if not expected:
+            raise ValueError("릴리스에 SHA-256 이 게시되지 않음")
+
+        filename = self.url.split("/")[-1]
+        if not filename.endswith(".exe"):
+            filename = "CasperFinder-Setup.exe"
+        save_path = stage_dir / filename
+        part_path = stage_dir / f"{filename}.part"
+
+        # 이미 스테이징됨 → 해시만 다시 확인 (네트워크 없음)
+        if save_path.is_file():
+            if _file_sha256(save_path) == expected:
+                log.info(f"[업데이트] 스테이징된 설치파일 사용: {save_path}")
+                return str(save_path)
+            save_path.unlink()
+
+        stage_dir.mkdir(parents=True, exist_ok=True)
+        for attempt in range(1, DOWNLOAD_RETRIES + 1):
+            try:
+                size = _download_to(
+                    self.url, part_path, self._progress, lambda: self.rate_limit
+                )
+                break
+            except (OSError, ConnectionError) as e:
+                # 4xx(403/404 등)는 다시 요청해도 같은 결과 → 바로 실패 (전송 오류/5xx 만 재시도)
+                if isinstance(e, urllib.error.HTTPError) and 400 <= e.code < 500:
+                    raise
+                if attempt == DOWNLOAD_RETRIES:
+                    raise
+                log.warning(f"[업데이트] 다운로드 중단 ({attempt}회): {e} → 이어받기")
+                time.sleep(min(2**attempt, 10))
+
+        actual = _file_sha256(part_path)
+        if actual != expected:
+            os.remove(part_path)  # 손상/변조 파일은 이어받기 대상에서 제외
+            raise ValueError(f"SHA-256 불일치 (기대 {expected[:12]}…, 실제 {actual[:12]}…)")
+        os.replace(part_path, save_path)
+        save_json(
+            stage_dir / STAGED_MANIFEST,
+            {"url": self.url, "file": filename, "sha256": expected, "size": size},
+        )
+        log.info(f"[업데이트] 스테이징 완료: {save_path} ({size} bytes, SHA-256 확인)")
+        return str(save_path)
+
+
+_jobs = {}  # {url: _StageJob} — 진행 중인 작업
+_jobs_lock = threading.Lock()
+
+
+def _version_for(url):
+    """url 의 릴리스 태그 (캐시된 릴리스 기준, 모르면 None)."""
+    release, asset = _release_asset(url)
+    return release.get("tag_name") if asset else None
+
 
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
+def _start_job(url, version, sha256, foreground, callbacks=None):
+    """url 작업을 찾거나 새로 시작하고 수신자를 붙임."""
+    with _jobs_lock:
+        job = _jobs.get(url)
+        created = job is None
+        if created:
+            job = _StageJob(url, version or _version_for(url), sha256)
+            if foreground:
+                job.rate_limit = None
+            _jobs[url] = job
+    if callbacks:
+        job.attach(*callbacks, foreground=foreground)
+    if created:
+        if not foreground:
+            log.info(f"[업데이트] 백그라운드 다운로드 시작: {job.version}")
+        get_runtime().run_blocking(job.run)
+    return job
+
+
+def stage_update(url, version, on_staged=None, on_error=None):
+    """새 버전 설치파일을 백그라운드(속도 제한)로 받아 검증 후 UPDATES_DIR 에 보관.
+
+    Args:
+        on_staged: (file_path: str) -> None — 스테이징 완료 (이미 있었으면 바로 호출)
+        on_error: (error_msg: str) -> None
+    """
+    cleanup_staged(keep=version)
+    callbacks = (
+        lambda *args: None,
+        on_staged or (lambda path: None),
+        on_error or (lambda msg: None),
+    )
+    _start_job(url, version, None, foreground=False, callbacks=callbacks)
+
+
+def download_update(
+    url, on_progress, on_complete, on_error, sha256=None, version=None
+):
+    """설치파일을 다운로드합니다 (이어받기 + SHA-256 검증).
+
+    백그라운드 스테이징이 진행 중이면 속도 제한을 풀고 그 작업에 합류,
+    이미 스테이징되어 있으면 해시만 다시 확인하고 바로 완료합니다.
+
+    Args:
+        url: 다운로드 URL
+        on_progress: (downloaded_bytes: int, total_bytes: int, percent: float) -> None
+        on_complete: (file_path: str) -> None — 해시 검증을 통과한 파일만 전달
+        on_error: (error_msg: str) -> None
+        sha256: 기대 해시 (생략 시 릴리스에 게시된 값 사용, 게시된 값이 없으면 실패)
+        version: 릴리스 태그 (생략 시 캐시된 릴리스에서 조회)
+    """
+    callbacks = (on_progress, on_complete, on_error)
+    _start_job(url, version, sha256, foreground=True, callbacks=callbacks)
 
 
 def run_installer_and_exit(installer_path):
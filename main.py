@@ -1,47 +1,111 @@
 """
 CasperFinder — 캐스퍼 기획전 신규 차량 알리미
 진입점. 스플래시 스크린 후 메인 앱 실행.
+`--headless`: GUI 없이 폴링 + 외부 알림 싱크(config.json notifySinks)만 실행.
+`--start`: 시작 시 폴링 시작 (이미 실행 중이면 그 인스턴스에 전달).
+이미 실행 중이면 요청(창 표시 / 폴링 시작)만 넘기고 바로 종료 (core/instance.py).
 """
 
+from core import startup  # 시작 타임라인 기준 시각 (가장 먼저)
+
 import sys
-import ctypes
+import time
 import logging
-import customtkinter as ctk
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%H:%M:%S",
-)
+from core.instance import acquire_instance, ACTION_SHOW, ACTION_START
+
+startup.mark("기본 모듈 import")
+
+
+# ── 중복 실행 방지 (이미 실행 중이면 요청만 넘기고 종료) ──
+def launch_actions(argv):
+    """이번 실행의 의도 → 실행 중인 인스턴스에 넘길 동작 목록.
+
+    GUI 실행은 창 표시(+ `--start` 면 폴링 시작), `--headless` 는 폴링 시작.
+    """
+    if "--headless" in argv:
+        return [ACTION_START]
+    actions = [ACTION_SHOW]
+    if "--start" in argv:
+        actions.append(ACTION_START)
+    return actions
+
+
+def setup_primary_logging():
+    """첫 인스턴스만: 설정 로드 + 파일 로그 파이프라인 구성.
 
+    요청만 넘기고 끝나는 실행은 설정/로그 파일을 건드리지 않는다
+    (경고는 logging 기본 stderr 출력).
+    """
+    from core.config import load_config
+    from core.log_pipeline import setup_logging
 
-# ── 중복 실행 방지 ──
-def check_single_instance():
-    mutex_name = "Global\\CasperFinder_SingleInstance_Mutex"
-    kernel32 = ctypes.windll.kernel32
-    mutex = kernel32.CreateMutexW(None, False, mutex_name)
-    if kernel32.GetLastError() == 183:
-        ctypes.windll.user32.MessageBoxW(
-            0, "애플리케이션이 이미 실행 중입니다.", "CasperFinder", 0x40 | 0x0
-        )
-        return None
-    return mutex
+    setup_logging(
+        level=logging.INFO,
+        json_log=load_config().get("appSettings", {}).get("jsonLog", False),
+    )
+
+
+def run_headless(instance):
+    """GUI 없이 폴링 + 외부 알림 싱크만 실행 (Ctrl+C 로 종료)."""
+    from core.poller import PollingEngine
+    from core.sinks import close_notify
+    from core.local_api import start_local_api, stop_local_api
+    from core.runtime import shutdown_runtime
+    from core.config import flush_config
+
+    log = logging.getLogger("CasperFinder")
+    engine = PollingEngine()
+    engine.start()
+    if not engine.notify.sinks:
+        log.warning("[시스템] notifySinks 설정 없음 — 로그로만 알림")
+    # 로컬 API 가 켜져 있으면 폴링이 API 로 중지돼도 종료하지 않음 (다시 시작 가능)
+    api = start_local_api(engine)
+    # 두 번째 실행의 "폴링 시작" 요청 (창 표시는 해당 없음)
+    instance.set_handler(lambda actions: ACTION_START in actions and engine.start())
+    try:
+        while engine.is_running or api is not None:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.shutdown()
+        stop_local_api()
+        close_notify()
+        flush_config()
+        shutdown_runtime()
+        instance.release()
 
 
 if __name__ == "__main__":
-    _mutex_handle = check_single_instance()
-    if _mutex_handle is None:
+    actions = launch_actions(sys.argv)
+    instance = acquire_instance(actions)
+    if instance is None:
         sys.exit(0)
+    startup.mark("단일 실행 확인")
+    setup_primary_logging()
+    startup.mark("로깅/설정 준비")
 
+    if "--headless" in sys.argv:
+        run_headless(instance)
+        sys.exit(0)
+
+    import customtkinter as ctk
     from ui.app import CasperFinderApp
 
+    startup.mark("ui.app import")
+
     # 테마 설정
     ctk.set_appearance_mode("light")
     ctk.set_default_color_theme("blue")
 
     app = CasperFinderApp()
+    instance.set_handler(app.on_instance_actions)
+    if ACTION_START in actions:  # --start: 자동 검색 설정과 무관하게 시작
+        app.on_instance_actions([ACTION_START])
 
     # 이미지 기반 스플래시가 필요한 경우 app._show_splash(path) 같은 형태로 구현하거나
     # PyInstaller --splash 사용을 권장하지만, 실시간 구동을 위해 간단히 구현 가능
 
     app.mainloop()
+    instance.release()
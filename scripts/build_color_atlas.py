@@ -0,0 +1,84 @@
+"""컬러칩 아틀라스 빌드 스크립트.
+
+assets/colors/{exterior,interior}/*.png 를 표시 크기(CHIP_SIZE × SCALE)로
+미리 축소하여 한 장의 atlas.png 로 합치고, 색상명 인덱스(atlas.json)를 생성한다.
+앱은 시작 시 아틀라스를 한 번만 열어 칩을 잘라 쓴다 (런타임 유사 일치 없음).
+
+사용법 (프로젝트 루트에서, 배포 빌드 전 실행):
+    python scripts/build_color_atlas.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.colors import (  # noqa: E402
+    ATLAS_INDEX_PATH,
+    ATLAS_PNG_PATH,
+    ATLAS_VERSION,
+    CHIP_SIZE,
+    CHIP_TYPES,
+    COLORS_DIR,
+    build_name_index,
+)
+from ui.filter_logic import FILTER_DEFAULTS  # noqa: E402
+
+# 고해상도(DPI 배율) 화면에서도 선명하도록 2배 밀도로 저장
+SCALE = 2
+COLUMNS = 8
+
+
+def collect_chips():
+    """[(chip_type, stem, path), ...] — 파일명 순 정렬 (빌드 결과 재현성)."""
+    chips = []
+    for chip_type in CHIP_TYPES:
+        for path in sorted((COLORS_DIR / chip_type).glob("*.png")):
+            chips.append((chip_type, path.stem, path))
+    return chips
+
+
+def build_atlas():
+    chips = collect_chips()
+    if not chips:
+        print(f"[오류] 컬러칩 이미지가 없습니다: {COLORS_DIR}")
+        return False
+
+    cell_w, cell_h = CHIP_SIZE[0] * SCALE, CHIP_SIZE[1] * SCALE
+    rows = (len(chips) + COLUMNS - 1) // COLUMNS
+    atlas = Image.new("RGBA", (cell_w * COLUMNS, cell_h * rows), (0, 0, 0, 0))
+
+    rects = {}
+    stems_by_type = {t: [] for t in CHIP_TYPES}
+    for i, (chip_type, stem, path) in enumerate(chips):
+        x, y = (i % COLUMNS) * cell_w, (i // COLUMNS) * cell_h
+        with Image.open(path) as src:
+            chip = src.convert("RGBA").resize((cell_w, cell_h), Image.LANCZOS)
+        atlas.paste(chip, (x, y))
+        rects[f"{chip_type}/{stem}"] = [x, y, cell_w, cell_h]
+        stems_by_type[chip_type].append(stem)
+
+    extra = {"exterior": FILTER_DEFAULTS["ext"], "interior": FILTER_DEFAULTS["int"]}
+    index = {
+        "version": ATLAS_VERSION,
+        "chipSize": list(CHIP_SIZE),
+        "scale": SCALE,
+        "chips": rects,
+        "names": build_name_index(stems_by_type, extra),
+    }
+
+    atlas.save(ATLAS_PNG_PATH, optimize=True)
+    with open(ATLAS_INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+
+    aliases = sum(len(v) for v in index["names"].values())
+    print(f"아틀라스 생성 완료: {ATLAS_PNG_PATH} ({atlas.size[0]}x{atlas.size[1]})")
+    print(f"  칩 {len(rects)}개, 이름 인덱스 {aliases}개 → {ATLAS_INDEX_PATH}")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if build_atlas() else 1)
@@ -1,34 +1,29 @@
 """
-config.py 동기화 로직 테스트:
+config 마이그레이션 테스트 (core/migrations.py):
+- 구버전 config(configVersion 없음)의 기획전 코드가 최신으로 덮어써지는지
 - R0003의 subsidyRegion이 비어있는지
 - D0003의 deliveryAreaCode가 비어있는지
+- 한 번 적용된 뒤 다시 실행하면 아무것도 바뀌지 않는지
 """
 
-import json
-from core.config import load_config, CONFIG_PATH
+import copy
+from core.migrations import migrate_config, CURRENT_VERSION
 
-# 테스트: 일부러 R0003에 4311을 박아넣고 load_config로 정리되는지 확인
-print(f"Config path: {CONFIG_PATH}")
-print(f"Config exists: {CONFIG_PATH.exists()}")
+# 테스트: 구 기획전 코드 + R에 4311, D에 배송지를 박아넣은 구버전 config
+legacy = {
+    "targets": [
+        {"exhbNo": "E20250101", "label": "특별기획전", "subsidyRegion": "1100"},
+        {"exhbNo": "D0002", "label": "전시차", "deliveryAreaCode": "T"},
+        {"exhbNo": "R0002", "label": "리퍼브", "subsidyRegion": "4311"},
+    ],
+    "api": {"defaultPayload": {"carCode": "AX05", "subsidyRegion": "1100"}},
+}
 
-# 기존에 4311이 있는 config.json을 시뮬레이션
-if CONFIG_PATH.exists():
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    # 강제로 4311 삽입 (테스트용)
-    for t in raw.get("targets", []):
-        if t.get("exhbNo", "").startswith("R"):
-            t["subsidyRegion"] = "4311"
-            print(f"[TEST] R0003에 4311 강제 삽입")
-
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(raw, f, ensure_ascii=False, indent=2)
-
-# load_config 호출 → 동기화 로직 실행
-config = load_config()
+config = copy.deepcopy(legacy)
+applied = migrate_config(config)
 
 # 결과 확인
+print(f"적용된 버전: {applied} (현재 버전: {CURRENT_VERSION})")
 print("\n=== 결과 ===")
 for t in config.get("targets", []):
     exhb = t.get("exhbNo", "")
@@ -40,12 +35,29 @@ for t in config.get("targets", []):
         f"  [{label}] exhb={exhb} subsidyRegion={subsidy!r} "
         f"delivery={delivery!r}/{delivery_local!r}"
     )
-
-# 최종 확인: R0003의 subsidyRegion이 비어있으면 성공
-r_target = next((t for t in config["targets"] if t["exhbNo"].startswith("R")), None)
-if r_target and r_target.get("subsidyRegion", "") == "":
-    print("\n✅ 테스트 성공: R0003의 subsidyRegion이 정상적으로 비워졌습니다!")
+print(f"  defaultPayload={config['api']['defaultPayload']}")
+
+checks = {
+    "기획전 코드 갱신": [t["exhbNo"] for t in config["targets"]]
+    == ["E20260277", "D0003", "R0003"],
+    "E 보조금 설정 유지": config["targets"][0]["subsidyRegion"] == "1100",
+    "R0003 subsidyRegion 비움": config["targets"][2]["subsidyRegion"] == "",
+    "D0003 deliveryAreaCode 비움": config["targets"][1]["deliveryAreaCode"] == "",
+    "payload carCode 초기화": config["api"]["defaultPayload"]["carCode"] == "",
+    "payload 사용자 값 유지": config["api"]["defaultPayload"]["subsidyRegion"] == "1100",
+    "configVersion 기록": config.get("configVersion") == CURRENT_VERSION,
+}
+
+# 두 번째 실행: 이미 최신 버전 → 변경 없음 (사용자가 바꾼 값도 건드리지 않음)
+config["targets"][0]["exhbNo"] = "E_USER"
+again = copy.deepcopy(config)
+checks["재실행 시 변경 없음"] = migrate_config(again) == [] and again == config
+
+print()
+for name, ok in checks.items():
+    print(f"  {'✅' if ok else '❌'} {name}")
+
+if all(checks.values()):
+    print("\n✅ 테스트 성공: 마이그레이션이 정상적으로 1회만 적용되었습니다!")
 else:
-    print(
-        f"\n❌ 테스트 실패: R0003의 subsidyRegion = {r_target.get('subsidyRegion')!r}"
-    )
+    print("\n❌ 테스트 실패")
@@ -1,5 +1,4 @@
-import json
-from pathlib import Path
+from core.regions import RegionIndex, target_fields
 
 # Mock regions data
 regions_data = {
@@ -23,52 +22,31 @@ regions_data = {
     ],
 }
 
+regions = RegionIndex(regions_data)
 
-def mock_save_logic(target, s_name, sg_name, mode="delivery"):
-    s_name = s_name.strip()
-    sg_name = sg_name.strip()
 
-    # 1. 시도 찾기
-    s_obj = next((r for r in regions_data[mode] if r["name"].strip() == s_name), None)
-    if not s_obj:
-        # 유사어 매칭 (제주특별자치도 -> 제주 등)
-        s_obj = next(
-            (
-                r
-                for r in regions_data[mode]
-                if s_name in r["name"] or r["name"] in s_name
-            ),
-            None,
-        )
-
-    if s_obj:
-        # 2. 시군구 찾기
-        sg_obj = next(
-            (s for s in s_obj["siguns"] if s["name"].strip() == sg_name), None
-        )
-        if not sg_obj:
-            # 시군구 매칭 실패 시, 키워드 포함 여부로 한 번 더 찾기
-            sg_obj = next(
-                (
-                    s
-                    for s in s_obj["siguns"]
-                    if sg_name in s["name"] or s["name"] in sg_name
-                ),
-                s_obj["siguns"][0],
-            )
-
-        if sg_obj:
-            if mode == "delivery":
-                target["deliveryAreaCode"] = s_obj["code"]
-                target["deliveryLocalAreaCode"] = sg_obj["code"]
-            else:
-                target["subsidyRegion"] = sg_obj["code"]
-            return True
-    return False
+def save_logic(target, s_name, sg_name, mode="delivery"):
+    """조건설정 탭 do_save_all 과 같은 매칭 경로 (core.regions)."""
+    sido, sigun = regions.resolve(mode, s_name, sg_name)
+    if sigun is None:
+        return False
+    target.update(target_fields(mode, sido, sigun))
+    return True
 
 
 # 테스트 실행
 target = {}
 # 사용자가 "제주", "제주시"를 선택했다고 가정 (배송지 모드에서)
-success = mock_save_logic(target, "제주", "제주시", mode="delivery")
+success = save_logic(target, "제주", "제주시", mode="delivery")
+print(f"Result: {success}, Target: {target}")
+
+# 정식 명칭 → 약칭 별칭 매칭 (보조금 모드)
+target = {}
+success = save_logic(target, " 제주특별자치도 ", "서귀포", mode="subsidy")
 print(f"Result: {success}, Target: {target}")
+assert target == {"subsidyRegion": "5002"}
+
+# 코드 → 이름 역조회
+sido, sigun = regions.sigun_by_code("subsidy", "5001")
+print(f"Lookup 5001: {sido['name']} / {sigun['name']}")
+assert (sido["name"], sigun["name"]) == ("제주", "제주시")
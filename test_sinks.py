@@ -0,0 +1,161 @@
+"""
+외부 알림 싱크 테스트 (core/sinks.py) — 로컬 수신 서버 사용, 실제 웹훅/봇 접속 없음:
+- 429 + Retry-After → 그만큼 기다렸다가 재전송
+- 영구 오류(4xx) → 재시도 없이 폐기 (디스크 큐에도 넣지 않음)
+- 묶음 중 일부 요청만 실패 → 못 보낸 메시지만 디스크 큐에 보관
+- 전송 중 close() → 미전송 메시지 디스크 큐 보관
+- 디스크 큐 저장 실패 → 워커는 계속 동작, 다음 주기에 다시 전송/보관
+"""
+
+import json
+import time
+import tempfile
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core import db
+import core.sinks as sinks
+from core.runtime import shutdown_runtime
+
+received = {}  # {path: [(시각, body), ...]}
+
+
+class Receiver(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        calls = received.setdefault(self.path, [])
+        calls.append((time.monotonic(), body))
+
+        if self.path == "/flaky" and len(calls) == 1:
+            self._reply(429, {"ok": False}, {"Retry-After": "0.5"})
+        elif self.path == "/bad":
+            self._reply(400, {"ok": False, "description": "chat not found"})
+        elif self.path == "/down" or (self.path == "/partial" and len(calls) > 1):
+            self._reply(503, {"ok": False})
+        elif self.path == "/slow":
+            time.sleep(5)
+            self._reply(200, {"ok": True})
+        else:
+            self._reply(200, {"ok": True})
+
+    def _reply(self, status, data, headers=None):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Receiver)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base = f"http://127.0.0.1:{server.server_address[1]}"
+
+# 디스크 큐 DB 를 임시 파일로 (사용자 데이터 건드리지 않음), 재시도 대기 단축
+db.DB_PATH = Path(tempfile.mkdtemp(prefix="casper_sinks_")) / "test.db"
+sinks.BACKOFF_BASE = 0.01
+
+
+def message(i, size=20):
+    return {"title": f"알림 {i}", "text": f"{i}" * size, "url": "", "ts": time.time()}
+
+
+def dispatcher(name, path, kind="webhook", **cfg):
+    cfg = {"type": kind, "name": name, "url": f"{base}{path}", "minInterval": 0, **cfg}
+    d = sinks.NotifyDispatcher(sinks.create_sinks([cfg]))
+    d.start()
+    return d
+
+
+def wait_until(cond, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.02)
+    return cond()
+
+
+def persisted(name):
+    return [m["title"] for _, m in sinks.queue_take(name, 100)]
+
+
+checks = {}
+
+# ── 1. 429 + Retry-After ──
+d = dispatcher("flaky", "/flaky")
+d.publish(message(1))
+checks["429 후 재전송 성공"] = wait_until(lambda: d._workers[0].sent == 1)
+calls = received.get("/flaky", [])
+checks["Retry-After 만큼 대기"] = len(calls) == 2 and calls[1][0] - calls[0][0] >= 0.5
+d.close()
+
+# ── 2. 영구 오류 → 폐기 ──
+d = dispatcher("bad", "/bad")
+d.publish(message(2))
+wait_until(lambda: received.get("/bad"))
+time.sleep(0.3)
+checks["4xx 는 재시도 없음"] = len(received.get("/bad", [])) == 1
+checks["4xx 는 디스크 큐에 넣지 않음"] = sinks.queue_size("bad") == 0
+d.close()
+
+# ── 3. 일부 요청만 실패 → 미전송분만 보관 ──
+# 디스코드 2000자 제한 → 메시지 3건이 요청 3개로 나뉨. 첫 요청만 성공, 이후 503
+d = dispatcher("partial", "/partial", kind="discord", batchSize=3)
+for i in (1, 2, 3):
+    d.publish(message(i, size=1500))
+checks["실패분 디스크 보관"] = wait_until(lambda: sinks.queue_size("partial") == 2)
+checks["보낸 메시지는 보관하지 않음"] = persisted("partial") == ["알림 2", "알림 3"]
+checks["전송 성공 수"] = d._workers[0].sent == 1
+d.close()
+
+# ── 4. 전송 중 close() → 디스크 큐 보관 ──
+d = dispatcher("slow", "/slow")
+d.publish(message(1))
+d.publish(message(2))
+wait_until(lambda: received.get("/slow"))
+d.publish(message(3))  # 전송 중인 묶음 뒤에 대기
+time.sleep(0.1)
+d.close()
+checks["종료 시 미전송 보관"] = persisted("slow") == ["알림 1", "알림 2", "알림 3"]
+
+# ── 5. 디스크 큐 저장 실패 → 워커 유지 + 다음 주기에 재시도 ──
+real_queue_put = sinks.queue_put
+failures = []
+
+
+def flaky_queue_put(*args, **kwargs):
+    if not failures:
+        failures.append(args)
+        raise OSError("database is locked")
+    return real_queue_put(*args, **kwargs)
+
+
+sinks.queue_put = flaky_queue_put
+d = dispatcher("down", "/down")
+d.publish(message(1))
+checks["저장 실패 후 다시 보관"] = wait_until(lambda: sinks.queue_size("down") == 1, 15)
+checks["워커 작업 유지"] = not d._tasks[0].done()
+checks["재전송은 같은 메시지"] = len(received.get("/down", [])) == 2 * sinks.MAX_ATTEMPTS
+d.close()
+sinks.queue_put = real_queue_put
+
+shutdown_runtime()
+server.shutdown()
+
+print()
+for name, ok in checks.items():
+    print(f"  {'✅' if ok else '❌'} {name}")
+
+if all(checks.values()):
+    print("\n✅ 테스트 성공: 재시도 / 폐기 / 부분 실패 / 종료 보관 / 저장 실패 복구 정상")
+else:
+    print("\n❌ 테스트 실패")
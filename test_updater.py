@@ -0,0 +1,162 @@
+"""
+업데이트 확인/다운로드 테스트 (core/updater.py) — 로컬 테스트 서버 사용, 실제 GitHub 접속 없음:
+- 릴리스 확인: ETag 조건부 요청 → 304 면 캐시된 릴리스 재사용
+- 다운로드 중 연결이 끊기면 Range 요청으로 이어받기
+- SHA-256 불일치 파일은 거부하고 .part 삭제
+- 서버가 Range 를 무시(200)하면 처음부터 다시 받기 (_download_to)
+- 4xx(404 등)는 재시도 없이 바로 실패
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import core.updater as updater
+
+PAYLOAD = os.urandom(300 * 1024)  # 설치파일 대용 (여러 청크)
+SHA256 = hashlib.sha256(PAYLOAD).hexdigest()
+RELEASE = {"tag_name": "v9.9.9", "assets": []}
+ETAG = '"release-1"'
+
+requests_seen = []  # [(path, If-None-Match, Range)]
+dropped = set()  # 한 번 끊어 본 경로
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        requests_seen.append(
+            (self.path, self.headers.get("If-None-Match"), self.headers.get("Range"))
+        )
+        if self.path == "/release":
+            if self.headers.get("If-None-Match") == ETAG:
+                self.send_response(304)
+                self.send_header("ETag", ETAG)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = json.dumps(RELEASE).encode()
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        # /drop: 첫 요청은 절반만 보내고 끊음, 이후 Range 지원
+        # /norange: Range 를 무시하고 항상 200 전체
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.path != "/norange":
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}"
+            )
+        else:
+            self.send_response(200)
+        body = PAYLOAD[start:]
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Connection", "close")
+        self.end_headers()
+        if self.path == "/drop" and self.path not in dropped:
+            dropped.add(self.path)
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base = f"http://127.0.0.1:{server.server_address[1]}"
+
+# 캐시/스테이징 폴더를 임시 폴더로 (사용자 데이터 건드리지 않음)
+tmp = Path(tempfile.mkdtemp(prefix="casper_updater_"))
+updater.GITHUB_API_URL = f"{base}/release"
+updater.UPDATE_CACHE_PATH = tmp / "update_cache.json"
+updater.UPDATES_DIR = tmp / "updates"
+
+checks = {}
+
+# ── 1. ETag 304 → 캐시 재사용 ──
+first = updater._fetch_release(force=True)
+second = updater._fetch_release(force=True)
+release_requests = [r for r in requests_seen if r[0] == "/release"]
+checks["첫 확인은 전체 응답"] = first == RELEASE and release_requests[0][1] is None
+checks["재확인은 If-None-Match 전송"] = release_requests[1][1] == ETAG
+checks["304 면 캐시된 릴리스 반환"] = second == RELEASE
+checks["TTL 안에서는 요청 없음"] = (
+    updater._fetch_release() == RELEASE and len(requests_seen) == 2
+)
+
+
+def stage(path, sha256):
+    """_StageJob 을 현재 스레드에서 실행 → ("ok", 파일경로) | ("error", 메시지)."""
+    result = []
+    job = updater._StageJob(f"{base}{path}", path.strip("/"), sha256)
+    job.rate_limit = None
+    job.attach(
+        lambda *args: None,
+        lambda file_path: result.append(("ok", file_path)),
+        lambda msg: result.append(("error", msg)),
+    )
+    job.run()
+    return result[0]
+
+
+# ── 2. 끊기면 Range 이어받기 ──
+requests_seen.clear()
+kind, value = stage("/drop", SHA256)
+ranges = [r[2] for r in requests_seen if r[0] == "/drop"]
+checks["끊긴 뒤 완료"] = kind == "ok" and Path(value).read_bytes() == PAYLOAD
+checks["두 번째 요청은 Range"] = (
+    len(ranges) == 2 and ranges[0] is None and ranges[1] == f"bytes={len(PAYLOAD) // 2}-"
+)
+
+# ── 3. SHA-256 불일치 → 거부 + .part 삭제 ──
+kind, value = stage("/bad", "0" * 64)
+checks["해시 불일치 거부"] = kind == "error" and "SHA-256" in value
+checks["불일치 .part 삭제"] = not any((updater.UPDATES_DIR / "bad").glob("*.part"))
+
+# ── 4. Range 미지원 서버(200) → 처음부터 다시 ──
+part = tmp / "norange.part"
+part.write_bytes(PAYLOAD[:1000] + b"corrupt")  # 이어받기 대상처럼 보이는 조각
+requests_seen.clear()
+size = updater._download_to(f"{base}/norange", part, lambda *args: None)
+checks["Range 헤더 전송"] = requests_seen[0][2] == f"bytes={1000 + 7}-"
+checks["200 이면 덮어쓰기"] = size == len(PAYLOAD) and part.read_bytes() == PAYLOAD
+
+# ── 5. 4xx → 재시도 없음 ──
+requests_seen.clear()
+started = time.monotonic()
+kind, value = stage("/missing", SHA256)
+checks["404 는 한 번만 요청"] = kind == "error" and len(requests_seen) == 1
+checks["404 는 재시도 대기 없음"] = time.monotonic() - started < 1.0
+
+server.shutdown()
+
+print()
+for name, ok in checks.items():
+    print(f"  {'✅' if ok else '❌'} {name}")
+
+if all(checks.values()):
+    print("\n✅ 테스트 성공: ETag 재사용 / 이어받기 / 해시 검증 / Range 미지원 / 4xx 처리 정상")
+else:
+    print("\n❌ 테스트 실패")
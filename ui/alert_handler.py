@@ -1,6 +1,7 @@
 """알림 큐, 히스토리 저장, 배지 업데이트, 자동 계약 (Mixin).
 
 app.py에서 분리된 AlertHandlerMixin — 알림 디바운스, 히스토리 저장, 배지, 포커스.
+엔진 콜백은 이벤트 큐에 넣기만 하고, Tk 스레드가 프레임 주기(DISPATCH_MS)로 묶어서 적용.
 """
 
 import os
@@ -9,11 +10,26 @@ import webbrowser
 from datetime import datetime
 
 from ui.components.notifier import show_notification
-from ui.filter_logic import sort_vehicles, passes_filter
-from core.formatter import format_vehicle_summary, format_price
-from core.storage import load_history, save_history
+from ui.filter_logic import sort_vehicles, filter_predicate
+from core.formatter import format_vehicle_summary, format_price, format_digest_toast
+from core.storage import append_history
+from core.runtime import get_runtime
 from core.config import BASE_DIR
 from core.sound import play_alert
+from core.event_queue import (
+    EVT_VEHICLE,
+    EVT_REMOVED,
+    EVT_STATUS,
+    EVT_ERROR,
+    EVT_ALERT,
+    EVT_CONTROL,
+)
+from core.digest import ALERT_VEHICLE
+from ui.theme import Colors
+
+# 엔진 이벤트 적용 주기 (ms) — 이벤트가 몰려도 프레임당 배치 1회
+DISPATCH_MS = 50
+HIDDEN_DISPATCH_MS = 500  # 트레이(백그라운드) 모드: 모델/배지만 갱신하므로 느슨하게
 
 
 class AlertHandlerMixin:
@@ -75,65 +91,147 @@ class AlertHandlerMixin:
         except Exception:
             pass
 
+    # ── 엔진 이벤트 (생산자: 아무 스레드 → 큐) ──
+
     def _on_notification(self, vehicle, label, detail_url):
-        self.notification_count += 1
-        timestamp = datetime.now()
-        car_id = vehicle.get("carId", vehicle.get("vehicleId"))
-        self.vehicles_found.append((vehicle, label, detail_url, timestamp))
-        self._pending_alerts.append((vehicle, label, car_id))
+        self.engine_events.push(EVT_VEHICLE, vehicle, label, detail_url, datetime.now())
+
+    def _on_vehicle_removed(self, removed_ids, label):
+        self.engine_events.push(EVT_REMOVED, removed_ids, label)
+
+    def _on_alert(self, kind, events):
+        # 팝업/소리는 엔진의 요약 스케줄러가 정한 알림 단위로만 (차량마다 아님)
+        self.engine_events.push(EVT_ALERT, kind, events)
+
+    def _is_priority_vehicle(self, vehicle, label):
+        """요약하지 않고 바로 알릴 차량: 설정된 필터에 일치 (루프 스레드에서 호출, 읽기만)."""
+        match = filter_predicate(self.filters)
+        return match is not None and match(vehicle, label)
+
+    # ── 엔진 이벤트 배치 적용 (Tk 스레드, 프레임 주기) ──
+
+    def _drain_engine_events(self):
+        """쌓인 엔진 이벤트를 한 번에 적용하고 다음 프레임 예약."""
+        events = self.engine_events.drain()
+        if events:
+            self._apply_engine_events(events)
+        delay = HIDDEN_DISPATCH_MS if self._hidden else DISPATCH_MS
+        self._dispatch_job = self.after(delay, self._drain_engine_events)
+
+    def _apply_engine_events(self, events):
+        """이벤트 묶음 → 모델 갱신 후 카드 배치/배지/상태를 프레임당 1회만 갱신.
+
+        백그라운드 모드에서는 모델·배지·알림만 갱신하고 화면 갱신은 복귀 시로 미룸.
+        """
+        added = 0
+        alerts = 0
+        removed_by_label = {}
+        status = error = control = None
+        show = False
+
+        for kind, args in events:
+            if kind == EVT_VEHICLE:
+                self._add_found_vehicle(*args)
+                added += 1
+            elif kind == EVT_REMOVED:
+                removed_ids, label = args
+                count = self._remove_found_vehicles(removed_ids)
+                if count:
+                    removed_by_label[label] = removed_by_label.get(label, 0) + count
+            elif kind == EVT_ALERT:
+                self._pending_alerts.append(args)
+                alerts += 1
+            elif kind == EVT_STATUS:
+                status = args
+            elif kind == EVT_ERROR:
+                error = args[0]
+            elif kind == EVT_CONTROL:
+                if args[0] == "show":
+                    show = True
+                else:
+                    control = args[0]  # 시작/중지는 마지막 요청만 적용
+
+        if show:
+            self._do_show()
+        if control == "start" and not self.engine.is_running:
+            self._start_polling()
+        elif control == "stop" and self.engine.is_running:
+            self._stop_polling()
+        if alerts:
+            self._schedule_alert()
+        if status is not None:
+            status_text, details = status
+            if details:
+                self.server_details = details
+            self._deferred_status = status_text
+        if error is not None:
+            self._deferred_error = error
+
+        if added or removed_by_label:
+            if removed_by_label:
+                self.notification_count = len(self.vehicles_found)
+            self._schedule_repack()  # 백그라운드면 복귀 시로 미룸
+            self._update_badge(flash=added > 0)
+            for label, count in removed_by_label.items():
+                show_notification(
+                    f"[{label}] {count}대가 판매/삭제되었습니다",
+                    title="판매 완료",
+                )
 
-        def _add():
-            if self.empty_label and self.empty_label.winfo_exists():
+        if self._hidden:
+            return
+        if added or removed_by_label:
+            if added and self.empty_label and self.empty_label.winfo_exists():
                 self.empty_label.destroy()
                 self.empty_label = None
-            # 위젯만 생성해두고 배치는 repack에 맡김 (페이징 유지)
-            self._ensure_card_widget(vehicle, label, detail_url)
-            self._schedule_history_save(timestamp, label, vehicle)
-            if self.total_count_label and self.total_count_label.winfo_exists():
-                self.total_count_label.configure(
-                    text=f"총 {len(self.vehicles_found)}대를 찾았습니다"
-                )
-            self._schedule_repack()
+            if removed_by_label and not self.vehicles_found:
+                from ui.pages.alert_page import show_empty_msg
 
-        self.after(0, _add)
+                show_empty_msg(self)
+            self._update_total_count()
+        self._apply_deferred_status()
+
+    def _update_total_count(self):
+        if self.total_count_label and self.total_count_label.winfo_exists():
+            self.total_count_label.configure(
+                text=f"총 {len(self.vehicles_found)}대를 찾았습니다"
+            )
+
+    def _apply_deferred_status(self):
+        """마지막 서버 상태/에러를 상단바에 반영 (프레임당 또는 복귀 시 1회)."""
+        if self._deferred_status is not None:
+            self._update_server_status_ui(self._deferred_status)
+            self._deferred_status = None
+        if self._deferred_error is not None:
+            self._update_status(f"⚠ {self._deferred_error[:50]}", Colors.ERROR)
+            self._deferred_error = None
+
+    def _add_found_vehicle(self, vehicle, label, detail_url, timestamp):
+        """신규 차량 1대를 모델에 반영 (카드 위젯은 생성만, 배치는 repack)."""
+        self.notification_count += 1
         self._new_vehicle_count += 1
-        self._update_badge(flash=True)
-        self._schedule_alert()
+        car_id = vehicle.get("carId", vehicle.get("vehicleId"))
+        self.vehicles_found.append((vehicle, label, detail_url, timestamp))
+        if not self._hidden:  # 백그라운드 중에는 카드 생성 생략 (복귀 시 보이는 페이지만)
+            self._ensure_card_widget(vehicle, label, detail_url)
+        self._schedule_history_save(timestamp, label, vehicle)
         self._check_auto_contract(vehicle, label, detail_url)
 
-    def _on_vehicle_removed(self, removed_ids, label):
+    def _remove_found_vehicles(self, removed_ids):
+        """판매/삭제 차량을 모델과 카드 풀에서 제거 → 제거된 대수."""
         before_count = len(self.vehicles_found)
         self.vehicles_found = [
             (v, lbl, url, ts)
             for v, lbl, url, ts in self.vehicles_found
             if v.get("carId", v.get("vehicleId")) not in removed_ids
         ]
-        after_count = len(self.vehicles_found)
-        removed_count = before_count - after_count
-
-        if removed_count > 0:
-
-            def _update():
-                for rid in removed_ids:
-                    widget = self.vehicle_widget_map.pop(rid, None)
-                    if widget and widget.winfo_exists():
-                        widget.destroy()
-                self.notification_count = len(self.vehicles_found)
-                if not self.vehicles_found:
-                    from ui.pages.alert_page import show_empty_msg
-
-                    show_empty_msg(self)
-                if self.total_count_label and self.total_count_label.winfo_exists():
-                    self.total_count_label.configure(
-                        text=f"총 {len(self.vehicles_found)}대를 찾았습니다"
-                    )
-                show_notification(
-                    f"[{label}] {removed_count}대가 판매/삭제되었습니다",
-                    title="판매 완료",
-                )
-
-            self.after(0, _update)
-            self.after(50, self._update_badge)
+        removed_count = before_count - len(self.vehicles_found)
+        if removed_count:
+            for rid in removed_ids:
+                widget = self.vehicle_widget_map.pop(rid, None)
+                if widget and widget.winfo_exists():
+                    widget.destroy()
+        return removed_count
 
     def _schedule_alert(self):
         if self._alert_job:
@@ -146,9 +244,11 @@ class AlertHandlerMixin:
             return
         pending = self._pending_alerts
         self._pending_alerts = []
+        events = [event for _, alert_events in pending for event in alert_events]
 
-        if len(pending) == 1:
-            vehicle, label, car_id = pending[0]
+        if len(pending) == 1 and pending[0][0] == ALERT_VEHICLE:
+            vehicle, label, _ = events[0]
+            car_id = vehicle.get("carId", vehicle.get("vehicleId"))
             price_str = format_price(vehicle.get("price", 0))
             show_notification(
                 f"{vehicle.get('modelNm', '')} {vehicle.get('trimNm', '')}\n가격: {price_str}",
@@ -157,7 +257,8 @@ class AlertHandlerMixin:
             )
         else:
             show_notification(
-                f"{len(pending)}대의 새로운 차량이 발견되었습니다!",
+                f"{len(events)}대의 새로운 차량이 발견되었습니다!\n"
+                f"{format_digest_toast(events)}",
                 title="🎉 신규 차량",
                 command=lambda: self._switch_tab(0),
             )
@@ -169,17 +270,11 @@ class AlertHandlerMixin:
             )
 
     def _check_auto_contract(self, vehicle, label, detail_url):
+        """자동 계약: 검색 탭 필터를 규칙으로 컴파일해 판정 (필터가 바뀔 때만 컴파일)."""
         if not self.auto_contract_var or not self.auto_contract_var.get():
             return
-        f = self.filters
-        if (
-            f["trim"] == ["트림"]
-            and f["ext"] == "외장색상"
-            and f["int"] == "내장색상"
-            and f["opt"] == ["옵션"]
-        ):
-            return
-        if passes_filter((vehicle, label, detail_url, None), self.filters):
+        match = filter_predicate(self.filters)
+        if match is not None and match(vehicle, label):
             webbrowser.open(detail_url)
 
     def focus_on_vehicle(self, car_id):
@@ -212,17 +307,34 @@ class AlertHandlerMixin:
     def _schedule_history_save(self, timestamp, label, vehicle):
         summary = format_vehicle_summary(vehicle)
         self._pending_history.append(
-            {"time": timestamp.strftime("%H:%M:%S"), "label": label, **summary}
+            {
+                "ts": timestamp.timestamp(),
+                "time": timestamp.strftime("%H:%M:%S"),
+                "label": label,
+                **summary,
+            }
         )
-        if self._history_job:
-            self.after_cancel(self._history_job)
-        self._history_job = self.after(500, self._flush_history)
+        # 첫 항목 기준 0.5초 뒤 일괄 저장 (연속 발견 중에도 저장이 계속 밀리지 않음)
+        if self._history_job is None:
+            self._history_job = self.after(500, self._flush_history)
 
-    def _flush_history(self):
+    def _flush_history(self, wait=False):
+        """대기 중인 히스토리를 한 트랜잭션으로 추가 (스레드 풀, wait=True 면 종료 시 직접)."""
+        self._history_job = None
         if not self._pending_history:
             return
-        history = load_history()
-        history.extend(self._pending_history)
-        save_history(history)
-        self._pending_history.clear()
-        self._history_job = None
+        pending, self._pending_history = self._pending_history, []
+        if wait:
+            try:
+                append_history(pending)
+            except Exception as e:
+                self.logger.error(f"[히스토리] 저장 실패: {e}")
+            return
+
+        def on_done(_, error):
+            # Tk 스레드: 실패분은 다음 저장에 다시 포함
+            if error:
+                self._pending_history = pending + self._pending_history
+                self.logger.error(f"[히스토리] 저장 실패: {error}")
+
+        get_runtime().run_blocking(append_history, pending, on_done=on_done, widget=self)
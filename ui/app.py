@@ -7,29 +7,29 @@ Mixin 구조:
 """
 
 import os
+import sys
 import logging
-import asyncio
-import threading
+import importlib
 from datetime import datetime
 import customtkinter as ctk
-from PIL import Image
 
+from core import startup
 from core.poller import PollingEngine
-from core.config import load_config, save_config, BASE_DIR
+from core.config import load_config, update_config, flush_config, BASE_DIR
+from core.storage import prune_history
+from core.sound import get_sound_service, close_sound
+from core.log_pipeline import add_sink
+from core.runtime import get_runtime, shutdown_runtime
+from core.sinks import close_notify
+from core.event_queue import EventQueue, EVT_STATUS, EVT_ERROR, EVT_CONTROL
 from ui.theme import Colors
 from ui.tray import TrayManager
-from ui.pages.alert_page import build_alert_tab, show_empty_msg
-from ui.pages.filter_page import build_filter_tab
-from ui.pages.login_page import build_login_page
-from ui.pages.automation_page import build_automation_page
-from ui.pages.settings_page import build_settings_tab
-from core.auth import casper_auth
 
 from ui.filter_logic import update_filter, get_filter_values
 from ui.components.dialogs import CenteredConfirmDialog
-from ui.components.update_dialog import UpdateDialog
-from ui.components.log_window import LogWindow
+from ui.log_buffer import LogBuffer
 from ui.utils import set_window_icon
+from ui.image_service import get_image_service
 
 # Mixin 모듈
 from ui.top_bar import TopBarMixin
@@ -38,25 +38,50 @@ from ui.alert_handler import AlertHandlerMixin
 
 
 class UILogHandler(logging.Handler):
-    """로깅 메시지를 앱의 _on_log 콜백으로 전달하는 핸들러."""
+    """로깅 메시지를 앱의 _on_log 콜백으로 전달하는 핸들러.
+
+    로깅 파이프라인의 리스너 스레드에서 호출된다 (callback은 스레드 안전해야 함).
+    """
 
     def __init__(self, callback):
         super().__init__()
         self.callback = callback
+        self.addFilter(logging.Filter("CasperFinder"))
 
     def emit(self, record):
         msg = self.format(record)
         self.callback(msg)
 
 
+# 탭 인덱스 → (모듈, 빌더 함수, 인자 순서) — 첫 전환 시 import (시작 시간 단축)
+_PAGE_BUILDERS = {
+    0: ("ui.pages.alert_page", "build_alert_tab", "app_first"),
+    1: ("ui.pages.filter_page", "build_filter_tab", "app_first"),
+    2: ("ui.pages.login_page", "build_login_page", "frame_first"),
+    3: ("ui.pages.automation_page", "build_automation_page", "frame_first"),
+    4: ("ui.pages.settings_page", "build_settings_tab", "app_first"),
+}
+
+
 class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk):
     def __init__(self):
         super().__init__()
 
-        # ── 로깅 핸들러 등록 ──
+        # ── 엔진/로그 → UI 이벤트 큐 ──
+        # 콜백은 큐에 넣기만 함 → Tk 스레드가 프레임 주기로 일괄 적용
+        self.engine_events = EventQueue()
+        self._dispatch_job = None
+        self._deferred_status = None  # 다음 화면 갱신 때 반영할 서버 상태/에러
+        self._deferred_error = None
+
+        # ── 백그라운드(트레이) 모드: 모델/배지만 갱신, 화면 작업은 복귀 시 1회 ──
+        self._hidden = False
+        self._needs_repack = False
+
+        # ── 로깅 핸들러 등록 (파이프라인 리스너의 UI 싱크) ──
         self.logger = logging.getLogger("CasperFinder")
         self.log_handler = UILogHandler(self._on_log)
-        self.logger.addHandler(self.log_handler)
+        add_sink(self.log_handler)
 
         self.title("CasperFinder")
         self.geometry("1280x720")
@@ -70,13 +95,24 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
         # ── 아이콘 설정 ──
         set_window_icon(self, is_main=True)
 
+        # ── 스플래시 (나머지 초기화 동안 표시, 준비되면 즉시 닫음) ──
+        self.splash = None
+        self._show_splash()
+        startup.mark("메인 윈도우 + 스플래시")
+
+        # ── 컬러칩 인덱스 (assets/colors 1회 스캔) ──
+        get_image_service()
+
         # ── 엔진 ──
+        # 엔진 로그는 로깅 파이프라인(UILogHandler)으로 들어오므로 on_log 미연결
         self.engine = PollingEngine()
-        self.engine.on_log = self._on_log
         self.engine.on_notification = self._on_notification
         self.engine.on_vehicle_removed = self._on_vehicle_removed
+        self.engine.on_alert = self._on_alert
+        self.engine.digest.is_urgent = self._is_priority_vehicle
         self.engine.on_poll_count = self._on_poll_count
         self.engine.on_server_status = self._on_server_status
+        startup.mark("컬러칩 인덱스 + 엔진 생성")
 
         # ── 상태 변수 (위젯 사전 선언 포함) ──
         self.notification_count = 0
@@ -115,6 +151,21 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
         self._pending_history = []
         self._history_job = None
         self._sound_config = load_config().get("appSettings", {})
+        # 보관 기간 정리(DELETE)는 스레드 풀에서 (시작 화면 차단 없음)
+        def on_pruned(_, error):
+            if error:
+                self.logger.error(f"[히스토리] 보관 기간 정리 실패: {error}")
+
+        get_runtime().run_blocking(
+            prune_history,
+            self._sound_config.get("historyRetentionDays", 90),
+            on_done=on_pruned,
+        )
+
+        # 알림음 미리 열기 (상주 재생 워커에서 — 첫 알림 지연 제거)
+        get_sound_service(self._sound_config.get("soundBackend", "auto")).preload(
+            os.path.join(str(BASE_DIR), "assets", "alert.mp3")
+        )
 
         # 위젯 사전 선언 (hasattr 제거용)
         self.status_label = None
@@ -129,10 +180,11 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
         self.empty_label = None
         self.card_scroll = None
         self.auto_contract_var = None
-        self.log_window = LogWindow(self)
-        self.log_window.withdraw()  # 처음엔 숨김
+        # 디버그 콘솔: 로그는 버퍼에만 쌓고 창은 처음 열 때 생성
+        self.log_buffer = LogBuffer()
+        self.log_window = None
 
-        # ── 트레이 ──
+        # ── 트레이 (아이콘 준비를 기다리지 않음) ──
         self.tray = TrayManager(on_show=self._show_window, on_quit=self._quit_app)
         self.tray.start()
         self.protocol("WM_DELETE_WINDOW", self._hide_to_tray)
@@ -142,28 +194,23 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
-        # ── 비동기 루프 드라이버 (백그라운드 스레드) ──
-        self.loop = asyncio.new_event_loop()
+        # ── 공유 비동기 런타임 (엔진/인증/UI 작업 공용 루프 + 스레드 풀) ──
+        self.runtime = get_runtime()
 
-        def drive_loop():
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_forever()
+        async def check_login():
+            # 인증 모듈/쿠키 로드는 루프 스레드에서 (UI 스레드 차단 없음)
+            from core.auth import casper_auth
 
-        self.loop_thread = threading.Thread(target=drive_loop, daemon=True)
-        self.loop_thread.start()
+            casper_auth.on_change = self._on_auth_change
+            # 저장된 세션 확인 → 로그인 상태면 만료 전 자동 갱신(keep-alive) 시작
+            await casper_auth.start()
 
-        def start_check():
-            asyncio.run_coroutine_threadsafe(
-                casper_auth.check_login_status(), self.loop
-            )
-
-        self.after(500, start_check)
+        self.after(500, lambda: self.runtime.submit(check_login()))
+        startup.mark("트레이 + 비동기 루프")
 
         self._build_nav()
         self._build_content()
-
-        # ── 스플래시 ──
-        self._show_splash()
+        startup.mark("내비게이션 + 상단바")
 
         # ── 시작 설정 및 마지막 상태 ──
         config = load_config()
@@ -179,19 +226,41 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
         last_tab = last_state.get("lastTab", 0)
         self._switch_tab(last_tab)
 
+        # ── 준비 완료 즉시 표시 (고정 대기 없음) ──
         app_settings = config.get("appSettings", {})
-        if app_settings.get("startMinimized", False):
-            self.after(10, self._hide_to_tray)
-        else:
-            self.after(2000, self.deiconify)
-
-        # ── 업데이트 확인 ──
-        # 스플래시(2초) 종료 후 창이 뜨고 나서 약 3초 뒤에 확인
-        self.after(5000, self._check_update_on_start)
+        self._start_minimized = app_settings.get("startMinimized", False)
+        self.after_idle(self._on_startup_ready)
 
+        self._drain_engine_events()
         if app_settings.get("autoSearch", True):
             self.after(100, self._start_polling)
 
+        # ── 로컬 API (활성화 시에만 로드, 폴링 제어는 이벤트 큐로 Tk 스레드에 전달) ──
+        if config.get("localApi", {}).get("enabled"):
+            from core.local_api import start_local_api
+
+            start_local_api(
+                self.engine,
+                controls={
+                    "start": lambda: self.engine_events.push(EVT_CONTROL, "start"),
+                    "stop": lambda: self.engine_events.push(EVT_CONTROL, "stop"),
+                },
+            )
+
+    def _on_startup_ready(self):
+        """첫 화면 준비 완료: 스플래시 닫고 창 표시, 타임라인 기록."""
+        if self.splash is not None:
+            self.splash.destroy()
+            self.splash = None
+        if self._start_minimized:
+            self._hide_to_tray()
+        else:
+            self.deiconify()
+        startup.report()
+
+        # ── 업데이트 확인 ── 창이 뜨고 약 3초 뒤
+        self.after(3000, self._check_update_on_start)
+
     # ── 스플래시 ──
 
     def _show_splash(self):
@@ -204,6 +273,8 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
         self.splash.overrideredirect(True)
 
         try:
+            from PIL import Image
+
             img_pil = Image.open(splash_path)
             w, h = img_pil.size
             img_ctk = ctk.CTkImage(light_image=img_pil, size=(w, h))
@@ -218,14 +289,34 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
             label.pack()
 
             self.splash.attributes("-topmost", True)
-            self.after(2000, self.splash.destroy)
+            # 나머지 초기화 동안 보이도록 즉시 그림 (닫기는 _on_startup_ready)
+            self.splash.update()
         except Exception:
             self.splash.destroy()
-            self.deiconify()
+            self.splash = None
 
     def _check_update_on_start(self):
+        from ui.components.update_dialog import UpdateDialog
+
         UpdateDialog(self).check_and_show()
 
+    # ── 디버그 콘솔 ──
+
+    def show_log_window(self):
+        """디버그 콘솔 표시 (최초 호출 시 생성, 쌓인 로그를 한 번에 렌더링)."""
+        if self.log_window is None or not self.log_window.winfo_exists():
+            from ui.components.log_window import LogWindow
+
+            with startup.timed("디버그 콘솔"):
+                self.log_window = LogWindow(
+                    self,
+                    buffer=self.log_buffer,
+                    body_max_bytes=self._sound_config.get("logBodyMaxBytes", 65536),
+                )
+        self.log_window.deiconify()
+        self.log_window.lift()
+        self.log_window.focus_force()
+
     # ── 윈도우 생명주기 ──
 
     def _on_minimize(self, event=None):
@@ -234,6 +325,7 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
 
     def _hide_to_tray(self):
         self.withdraw()
+        self._enter_background()
         # 기존 토스트 알림 (인앱)
         from ui.components.notifier import show_notification
 
@@ -248,17 +340,77 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
         self.deiconify()
         self.lift()
         self.focus_force()
+        self._leave_background()
+
+    # ── 백그라운드 모드 ──
+
+    def _enter_background(self):
+        """창 숨김: 타이머/진행바 애니메이션/카드 재배치 중지 (데이터 모델과 배지만 유지)."""
+        if self._hidden:
+            return
+        self._hidden = True
+        if self._timer_job:
+            self.after_cancel(self._timer_job)
+            self._timer_job = None
+        if self._rebuild_job:
+            self.after_cancel(self._rebuild_job)
+            self._rebuild_job = None
+            self._needs_repack = True
+        if self.search_progress and self.search_progress.winfo_exists():
+            self.search_progress.stop()
+
+    def _leave_background(self):
+        """창 복귀: 멈춘 타이머/애니메이션 재개 + 보이는 페이지만 1회 갱신."""
+        if not self._hidden:
+            return
+        self._hidden = False
+        if self.engine.is_running:
+            if self.search_progress and self.search_progress.winfo_exists():
+                self.search_progress.start()
+            self._update_timer()
+        self._update_total_count()
+        self._apply_deferred_status()
+        if self.current_tab == 0:
+            self._flush_deferred_repack()
+
+    def _flush_deferred_repack(self):
+        """백그라운드 중 밀린 카드 재배치를 1회 수행."""
+        if self._needs_repack:
+            self._needs_repack = False
+            self._repack_cards()
 
     def _quit_app(self):
-        config = load_config()
-        if "lastState" not in config:
-            config["lastState"] = {}
-        config["lastState"]["geometry"] = self.winfo_geometry()
-        config["lastState"]["lastTab"] = self.current_tab
-        save_config(config)
+        update_config(
+            {
+                "lastState": {
+                    "geometry": self.winfo_geometry(),
+                    "lastTab": self.current_tab,
+                }
+            }
+        )
 
-        self.engine.stop()
+        # 디바운스 대기 중인 히스토리 즉시 저장 (런타임 종료 전, 직접 실행)
+        if self._history_job:
+            self.after_cancel(self._history_job)
+        self._flush_history(wait=True)
+
+        if self._dispatch_job:
+            self.after_cancel(self._dispatch_job)
+            self._dispatch_job = None
+        # 남은 요약 알림/기록 flush 를 싱크·런타임이 살아 있을 때 끝냄
+        self.engine.shutdown()
         self.tray.stop()
+        close_sound()
+        close_notify()  # 미전송 외부 알림은 디스크 큐에 보관
+        local_api = sys.modules.get("core.local_api")
+        if local_api is not None:
+            local_api.stop_local_api()
+        auth = sys.modules.get("core.auth")  # 로드된 적 있을 때만 (지연 import 유지)
+        if auth is not None:
+            auth.close_auth()
+        flush_config()
+        # 루프 작업 취소 → 루프 정지 → 스레드 풀 정리 (설정/히스토리 저장 이후)
+        shutdown_runtime()
         self.after(0, self.destroy)
 
     # ── 네비게이션 ──
@@ -398,11 +550,7 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
             return
         self.current_tab = idx
 
-        config = load_config()
-        if "lastState" not in config:
-            config["lastState"] = {}
-        config["lastState"]["lastTab"] = idx
-        save_config(config)
+        update_config({"lastState": {"lastTab": idx}})  # 메모리 반영, 디스크는 지연 저장
 
         # 버튼 활성화 스타일 적용 (enumerate 사용으로 안전)
         for i, btn in enumerate(self.nav_buttons):
@@ -414,29 +562,38 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
         if idx == 0:
             self._new_vehicle_count = 0
             self._update_badge()
+            self._flush_deferred_repack()
 
         for f in self.page_frames.values():
             f.pack_forget()
 
-        if idx not in self.page_frames:
+        if idx not in self.page_frames and idx in _PAGE_BUILDERS:
             page_frame = ctk.CTkFrame(self.page_container, fg_color="transparent")
 
-            # 탭별 빌더 매핑 (인자 순서 보정: f=frame, a=app)
-            builders = {
-                0: lambda f, a: build_alert_tab(a, f),
-                1: lambda f, a: build_filter_tab(a, f),
-                2: lambda f, a: build_login_page(f, a),
-                3: lambda f, a: build_automation_page(f, a),
-                4: lambda f, a: build_settings_tab(a, f),
-            }
-
-            if idx in builders:
-                builders[idx](page_frame, self)
-                self.page_frames[idx] = page_frame
+            # 페이지 모듈은 첫 전환 시 import (인자 순서 보정 포함)
+            module_name, func_name, arg_order = _PAGE_BUILDERS[idx]
+            with startup.timed(f"{self.sidebar_items[idx]['label']} 탭"):
+                build = getattr(importlib.import_module(module_name), func_name)
+                if arg_order == "app_first":
+                    build(self, page_frame)
+                else:
+                    build(page_frame, self)
+            self.page_frames[idx] = page_frame
 
         if idx in self.page_frames:
             self.page_frames[idx].pack(fill="both", expand=True)
 
+    def _on_auth_change(self, logged_in):
+        """로그인 상태 변화 (루프 스레드) → 로그인 탭이 만들어져 있으면 다시 그리기."""
+        self.after(0, self._refresh_login_page)
+
+    def _refresh_login_page(self):
+        frame = self.page_frames.get(2)
+        if frame is not None:
+            from ui.pages.login_page import build_login_page
+
+            build_login_page(frame, self)
+
     # ── 폴링 제어 ──
 
     def _toggle_search(self):
@@ -460,11 +617,17 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
 
         if self.search_progress and self.search_progress.winfo_exists():
             self.search_progress.pack(side="left", padx=12)
-            self.search_progress.start()
+            if not self._hidden:  # 백그라운드면 복귀 시 시작
+                self.search_progress.start()
 
         if not self.vehicles_found:
+            from ui.pages.alert_page import show_empty_msg
+
             show_empty_msg(self)
 
+        if self._timer_job:
+            self.after_cancel(self._timer_job)
+            self._timer_job = None
         self._update_timer()
 
     def _stop_polling(self):
@@ -486,6 +649,8 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
             self.search_progress.pack_forget()
 
         if not self.vehicles_found:
+            from ui.pages.alert_page import show_empty_msg
+
             show_empty_msg(self)
 
         self.server_details = {}
@@ -494,22 +659,25 @@ class CasperFinderApp(TopBarMixin, CardManagerMixin, AlertHandlerMixin, ctk.CTk)
     # ── 엔진 콜백 ──
 
     def _on_log(self, msg):
-        # 디버그 컨트롤 센터(LogWindow)에 항상 기록
-        if hasattr(self, "log_window") and self.log_window.winfo_exists():
-            self.after(0, lambda: self.log_window.append_log(msg))
+        # 디버그 컨트롤 센터 버퍼에 항상 기록 (스레드 안전, 창이 없어도 보관)
+        if hasattr(self, "log_buffer"):
+            self.log_buffer.append(msg)
 
-        # 상태바에는 에러만 표시
+        # 상태바에는 에러만 표시 (다음 프레임 배치에서 마지막 1건만 반영)
         if "에러" in msg or "실패" in msg:
-            self.after(0, lambda: self._update_status(f"⚠ {msg[:50]}", Colors.ERROR))
+            self.engine_events.push(EVT_ERROR, msg)
 
     def _on_poll_count(self, count):
         pass
 
     def _on_server_status(self, status, details=None):
-        """엔진에서 서버 상태가 전달될 때 UI 갱신."""
-        if details:
-            self.server_details = details
-        self.after(0, lambda: self._update_server_status_ui(status))
+        """엔진에서 서버 상태가 전달될 때 UI 갱신 (다음 프레임 배치에서 최신 1건만)."""
+        self.engine_events.push(EVT_STATUS, status, details)
+
+    def on_instance_actions(self, actions):
+        """다른 실행에서 넘어온 요청 (IPC 스레드) → 다음 프레임 배치에서 적용."""
+        for action in actions:
+            self.engine_events.push(EVT_CONTROL, action)
 
     # ── 필터/정렬 ──
 
@@ -1,11 +1,11 @@
 """카드 위젯 풀 관리, 페이징, 정렬/필터 적용 렌더링 (Mixin).
 
 app.py에서 분리된 CardManagerMixin — 카드 생성, 재배치, 페이지 네비게이션.
+창이 숨겨진 동안(백그라운드 모드)에는 재배치를 미뤘다가 복귀 시 보이는 페이지만 1회 구성.
 """
 
-import customtkinter as ctk
-from ui.theme import Colors
 from ui.components.vehicle_card import build_vehicle_card
+from ui.components.pagination import PaginationBar
 from ui.filter_logic import sort_vehicles
 
 
@@ -50,12 +50,7 @@ class CardManagerMixin:
             if widget.winfo_exists():
                 widget.pack_forget()
 
-        # 2) 이전 페이지 바 파괴
-        if self._page_bar and self._page_bar.winfo_exists():
-            self._page_bar.destroy()
-            self._page_bar = None
-
-        # 3) '검색 결과 없음' 메시지 처리
+        # 2) '검색 결과 없음' 메시지 처리
         if self.empty_label and self.empty_label.winfo_exists():
             self.empty_label.pack_forget()
 
@@ -69,6 +64,7 @@ class CardManagerMixin:
                     self.card_scroll.update_idletasks()
                 except Exception:
                     pass
+            self._hide_page_bar()
             from ui.pages.alert_page import show_empty_msg
 
             show_empty_msg(self)
@@ -84,6 +80,7 @@ class CardManagerMixin:
                     self.card_scroll.update_idletasks()
                 except Exception:
                     pass
+            self._hide_page_bar()
             from ui.pages.alert_page import show_empty_msg
 
             show_empty_msg(self)
@@ -106,80 +103,42 @@ class CardManagerMixin:
 
         for v, lbl, url, ts in page_items:
             cid = v.get("carId", v.get("vehicleId"))
-            widget = self.vehicle_widget_map.get(cid)
+            # 백그라운드 중 발견된 차량은 카드가 없음 → 보이는 페이지 것만 생성
+            widget = self.vehicle_widget_map.get(cid) or self._ensure_card_widget(
+                v, lbl, url
+            )
             if widget and widget.winfo_exists():
                 widget.pack(fill="x", pady=3, padx=4)
 
         if total_pages > 1:
             bar_parent = getattr(self, "pagination_container", parent)
             self._render_page_bar(bar_parent, total_pages, total)
+        else:
+            self._hide_page_bar()
 
         # 렌더링 완료 후 레이아웃 즉시 갱신 (스크롤바 크기 조정)
         if self.card_scroll and self.card_scroll.winfo_exists():
             self.card_scroll.update_idletasks()
 
     def _render_page_bar(self, parent, total_pages, total_items):
-        """페이지 네비게이션 바를 렌더링."""
-        self._page_bar = ctk.CTkFrame(parent, fg_color="transparent", height=40)
-        self._page_bar.pack(fill="x", pady=(8, 4))
-
-        inner = ctk.CTkFrame(self._page_bar, fg_color="transparent")
-        inner.pack(anchor="center")
-
-        prev_state = "normal" if self._current_page > 0 else "disabled"
-        ctk.CTkButton(
-            inner,
-            text="◀",
-            width=32,
-            height=28,
-            font=ctk.CTkFont(size=12),
-            fg_color="transparent",
-            border_width=1,
-            border_color=Colors.BORDER,
-            text_color=Colors.TEXT,
-            hover_color=Colors.BG_HOVER,
-            state=prev_state,
-            command=lambda: self._go_to_page(self._current_page - 1),
-        ).pack(side="left", padx=2)
-
-        for i in range(total_pages):
-            is_current = i == self._current_page
-            ctk.CTkButton(
-                inner,
-                text=str(i + 1),
-                width=32,
-                height=28,
-                font=ctk.CTkFont(size=12, weight="bold" if is_current else "normal"),
-                fg_color=Colors.ACCENT if is_current else "transparent",
-                text_color="white" if is_current else Colors.TEXT,
-                border_width=0 if is_current else 1,
-                border_color=Colors.BORDER,
-                hover_color=Colors.ACCENT_HOVER if is_current else Colors.BG_HOVER,
-                command=lambda p=i: self._go_to_page(p),
-            ).pack(side="left", padx=2)
-
-        next_state = "normal" if self._current_page < total_pages - 1 else "disabled"
-        ctk.CTkButton(
-            inner,
-            text="▶",
-            width=32,
-            height=28,
-            font=ctk.CTkFont(size=12),
-            fg_color="transparent",
-            border_width=1,
-            border_color=Colors.BORDER,
-            text_color=Colors.TEXT,
-            hover_color=Colors.BG_HOVER,
-            state=next_state,
-            command=lambda: self._go_to_page(self._current_page + 1),
-        ).pack(side="left", padx=2)
-
-        ctk.CTkLabel(
-            inner,
-            text=f"  ({total_items}대)",
-            font=ctk.CTkFont(size=11),
-            text_color=Colors.TEXT_SUB,
-        ).pack(side="left", padx=(8, 0))
+        """페이지 네비게이션 바를 갱신 (위젯은 최초 1회만 생성)."""
+        if (
+            self._page_bar is None
+            or not self._page_bar.winfo_exists()
+            or self._page_bar.master is not parent
+        ):
+            # 부모가 바뀌면 이전 바(버튼 슬롯 포함)는 정리 후 새로 생성
+            if self._page_bar is not None and self._page_bar.winfo_exists():
+                self._page_bar.destroy()
+            self._page_bar = PaginationBar(parent, on_page=self._go_to_page)
+        # 매핑 여부(winfo_ismapped)는 탭/창이 숨겨져 있으면 거짓 → 관리 여부로 판단
+        if not self._page_bar.winfo_manager():
+            self._page_bar.pack(fill="x", pady=(8, 4))
+        self._page_bar.update_pages(self._current_page, total_pages, total_items)
+
+    def _hide_page_bar(self):
+        if self._page_bar and self._page_bar.winfo_exists():
+            self._page_bar.pack_forget()
 
     def _go_to_page(self, page):
         self._current_page = page
@@ -211,6 +170,9 @@ class CardManagerMixin:
         return None
 
     def _schedule_repack(self):
+        if self._hidden:
+            self._needs_repack = True  # 복귀 시 1회 재배치
+            return
         if self._rebuild_job:
             self.after_cancel(self._rebuild_job)
         self._rebuild_job = self.after(100, self._repack_cards)
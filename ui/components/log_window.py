@@ -1,17 +1,49 @@
-import json
+import re
 import customtkinter as ctk
-from datetime import datetime
+from core.runtime import get_runtime
 from ui.theme import Colors
 from ui.utils import set_window_icon
+from ui.log_buffer import (
+    BODY_MAX_BYTES,
+    FOLD_TAG,
+    TAB_API,
+    TAB_AUTH,
+    TAB_GENERAL,
+    TABS,
+    LogBuffer,
+    pretty_body,
+)
+
+# ── 렌더링 한도 ──
+MAX_LINES = 6000  # 텍스트 위젯에 유지할 최대 줄 수
+TRIM_CHUNK = 1000  # 초과 시 한 번에 잘라낼 줄 수
+DRAIN_MS = 100  # 표시 중 반영 주기
+HIDDEN_DRAIN_MS = 1000  # 숨김 중 (모델만 갱신)
+
+OPEN_TAG = "fold-open"  # 펼쳐진 본문 블록
+_FOLD_ID_RE = re.compile(r"▶ #(\d+) ")  # ui.log_buffer 의 접힌 본문 요약 줄 형식
 
 
 class LogWindow(ctk.CTkToplevel):
-    """JSON 정렬 및 색상 강조 기능이 포함된 프리미엄 로그 윈도우."""
+    """JSON 정렬 및 색상 강조 기능이 포함된 프리미엄 로그 윈도우.
 
-    def __init__(self, parent):
+    메시지는 LogBuffer(링 버퍼)에 쌓이고, 주기적 drain에서 배치로 위젯에 반영된다.
+    창이 숨겨져 있는 동안에는 위젯 렌더링을 멈추고 모델만 갱신한다.
+    """
+
+    def __init__(self, parent, buffer=None, body_max_bytes=BODY_MAX_BYTES):
         super().__init__(parent)
         set_window_icon(self)
 
+        self.buffer = buffer or LogBuffer()
+        self._visible = True
+        self._dirty = set()  # 숨김 중 변경되어 전체 재렌더링이 필요한 탭
+        self._drain_job = None
+
+        # 본문 펼치기 (정렬은 공유 스레드 풀에서)
+        self.body_max_bytes = body_max_bytes
+        self._pending = set()  # 정렬 중인 본문 번호
+
         self.title("CasperFinder Debug Console")
 
         # 화면 중앙 배치 계산
@@ -68,17 +100,22 @@ class LogWindow(ctk.CTkToplevel):
         self.log_area_general = self._create_log_area(self.tab_general)
         self.log_area_api = self._create_log_area(self.tab_api)
         self.log_area_auth = self._create_log_area(self.tab_auth)
+        self._areas = {
+            TAB_GENERAL: self.log_area_general,
+            TAB_API: self.log_area_api,
+            TAB_AUTH: self.log_area_auth,
+        }
 
         # ── 색상 태그 설정 ──
-        # API 탭 전용 색상
-        self._setup_tags(self.log_area_api)
-        # 인증 탭 전용 색상
-        self._setup_tags(self.log_area_auth)
-        # 일반 탭 전용 색상
-        self._setup_tags(self.log_area_general)
+        for area in self._areas.values():
+            self._setup_tags(area)
+
+        # 창 생성 이전에 쌓인 로그가 있으면 전체 렌더링
+        self._dirty.update(TABS)
 
         self.append_log("[System] 프리미엄 디버그 콘솔이 활성화되었습니다.")
         self.protocol("WM_DELETE_WINDOW", self.withdraw)
+        self._drain()
 
     def _create_log_area(self, parent):
         area = ctk.CTkTextbox(
@@ -89,7 +126,7 @@ class LogWindow(ctk.CTkToplevel):
             border_width=1,
             border_color=Colors.DIVIDER,
             corner_radius=6,
-            undo=True,
+            undo=False,  # 읽기 전용 로그 — undo 스택 누적 방지
         )
         area.pack(fill="both", expand=True)
         area.configure(state="disabled")
@@ -109,76 +146,144 @@ class LogWindow(ctk.CTkToplevel):
             "error", foreground="#F44336", font=("Consolas", 11, "bold")
         )  # 빨간색
         text_widget.tag_config("divider", foreground="#333333")  # 어두운 구분선
+        # 접힌 본문 요약 → 클릭 시 펼치기/접기
+        text_widget.tag_bind(FOLD_TAG, "<Button-1>", self._on_fold_click)
+        text_widget.tag_bind(
+            FOLD_TAG, "<Enter>", lambda e: text_widget.configure(cursor="hand2")
+        )
+        text_widget.tag_bind(
+            FOLD_TAG, "<Leave>", lambda e: text_widget.configure(cursor="")
+        )
+
+    # ── 표시/숨김 ──
+
+    def deiconify(self):
+        super().deiconify()
+        if getattr(self, "_areas", None) and not self._visible:
+            self._visible = True
+            self._drain()  # 숨김 중 쌓인 변경을 즉시 반영
+
+    def withdraw(self):
+        super().withdraw()
+        self._visible = False
+
+    # ── 적재/반영 ──
 
     def append_log(self, message):
-        """메시지를 분석하여 마크다운 스타일로 예쁘게 출력."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        if message.startswith("[API]"):
-            area = self.log_area_api
-            content = message[5:].strip()
-            self._append_rich_api_log(area, timestamp, content)
-        elif message.startswith("[Auth]") or message.startswith("[Automation]"):
-            area = self.log_area_auth
-            self._append_text_with_tag(area, f"[{timestamp}] ", "timestamp")
-            self._append_text_with_tag(area, f"{message}\n", None)
-        else:
-            area = self.log_area_general
-            self._append_text_with_tag(area, f"[{timestamp}] ", "timestamp")
-            self._append_text_with_tag(area, f"{message}\n", None)
-
-    def _append_rich_api_log(self, area, timestamp, content):
-        """API 로그를 파싱하여 색상과 정렬 적용."""
-        tag = None
-        display_text = content
-
-        if content.startswith(">>> REQUEST"):
-            tag = "request"
-            display_text = (
-                f"\n─ REQUEST ──────────────────────────────────\n{content}\n"
-            )
-        elif content.startswith("<<< RESPONSE"):
-            tag = "response"
-            display_text = f"{content}\n"
-        elif content.startswith("PAYLOAD:") or content.startswith("BODY:"):
-            tag = "body"
-            prefix = "PAYLOAD: " if content.startswith("PAYLOAD:") else "BODY: "
-            json_str = content[len(prefix) :].strip()
-            try:
-                # JSON 정렬(Pretty Print)
-                parsed = json.loads(json_str)
-                display_text = (
-                    f"{prefix}\n{json.dumps(parsed, indent=2, ensure_ascii=False)}\n"
-                )
-            except Exception:
-                pass  # 파싱 실패 시 원본 그대로 출력
-        elif content.startswith("!!!"):
-            tag = "error"
-            display_text = f"{content}\n"
-
-        # 타임스탬프 출력
-        self._append_text_with_tag(area, f"[{timestamp}] ", "timestamp")
-        # 본문 출력 (해당 태그 적용)
-        self._append_text_with_tag(area, display_text, tag)
-
-    def _append_text_with_tag(self, area, text, tag_name):
-        # 현재 스크롤 위치 확인 (1.0이면 맨 아래)
-        # 약간의 여유(0.9)를 두어 스크롤이 거의 아래면 자동으로 따라가게 함
-        at_bottom = area._textbox.yview()[1] > 0.9
+        """로그 적재 (스레드 안전). 위젯 반영은 다음 drain 주기에 배치 처리."""
+        self.buffer.append(message)
 
-        area.configure(state="normal")
-        if tag_name:
-            area._textbox.insert("end", text, tag_name)
+    def _drain(self):
+        if self._drain_job:
+            self.after_cancel(self._drain_job)
+            self._drain_job = None
+        if not self.winfo_exists():
+            return
+
+        new = self.buffer.drain()
+        if self._visible:
+            for tab in self._dirty:
+                self._render_all(tab)
+            for tab, entries in new.items():
+                if tab not in self._dirty:
+                    self._insert_entries(self._areas[tab], entries)
+            self._dirty.clear()
         else:
-            area._textbox.insert("end", text)
+            self._dirty.update(new)
 
+        delay = DRAIN_MS if self._visible else HIDDEN_DRAIN_MS
+        self._drain_job = self.after(delay, self._drain)
+
+    def _insert_entries(self, area, entries):
+        """여러 항목을 한 번의 insert 호출로 추가 + 오래된 줄 일괄 정리."""
+        text_widget = area._textbox
+        # 스크롤이 거의 아래면 자동으로 따라가게 함
+        at_bottom = text_widget.yview()[1] > 0.9
+
+        args = []
+        for segments in entries:
+            for text, tag in segments:
+                args.append(text)
+                args.append(tag or ())
+        if not args:
+            return
+
+        area.configure(state="normal")
+        text_widget.insert("end", *args)
+        self._trim(text_widget)
         if at_bottom:
-            area.see("end")
+            text_widget.see("end")
+        area.configure(state="disabled")
 
+    def _trim(self, text_widget):
+        lines = int(text_widget.index("end-1c").split(".")[0])
+        if lines > MAX_LINES + TRIM_CHUNK:
+            text_widget.delete("1.0", f"{lines - MAX_LINES}.0")
+
+    def _render_all(self, tab):
+        """링 버퍼 내용으로 탭 전체를 다시 그림 (숨김 해제 시)."""
+        area = self._areas[tab]
+        area.configure(state="normal")
+        area._textbox.delete("1.0", "end")
         area.configure(state="disabled")
+        self._insert_entries(area, self.buffer.entries[tab])
+
+    # ── 본문 펼치기/접기 ──
+
+    def _on_fold_click(self, event):
+        text_widget = event.widget
+        line = text_widget.index("current linestart")
+        m = _FOLD_ID_RE.search(text_widget.get(line, f"{line} lineend"))
+        if not m:
+            return
+        body_id = int(m.group(1))
+
+        opened = self._open_range(text_widget, line)
+        if opened:  # 펼쳐져 있으면 접기
+            text_widget.configure(state="normal")
+            text_widget.delete(*opened)
+            text_widget.configure(state="disabled")
+            return
+        if body_id in self._pending:
+            return
+
+        raw = self.buffer.bodies.get(body_id)
+        if raw is None:
+            self._show_expanded(text_widget, body_id, "(원본이 버퍼에서 제거됨)")
+            return
+        self._pending.add(body_id)
+        get_runtime().run_blocking(
+            pretty_body,
+            raw,
+            self.body_max_bytes,
+            on_done=lambda text, error: self._show_expanded(
+                text_widget, body_id, text if error is None else f"(정렬 실패: {error})"
+            ),
+            widget=self,
+        )
+
+    def _open_range(self, text_widget, line):
+        """요약 줄 바로 아래에 펼쳐진 블록이 있으면 (시작, 끝) 반환."""
+        next_line = text_widget.index(f"{line} +1 lines")
+        found = text_widget.tag_nextrange(OPEN_TAG, next_line, f"{next_line} +1c")
+        return found or None
+
+    def _show_expanded(self, text_widget, body_id, text):
+        """Tk 스레드: 요약 줄 바로 아래에 정렬된 본문 삽입."""
+        self._pending.discard(body_id)
+        found = text_widget.search(f"▶ #{body_id} ", "1.0", "end")
+        if not found:  # 이미 잘려 나간 줄
+            return
+        line = text_widget.index(f"{found} linestart")
+        if self._open_range(text_widget, line):
+            return
+        text_widget.configure(state="normal")
+        text_widget.insert(f"{line} +1 lines", f"{text}\n", ("body", OPEN_TAG))
+        text_widget.configure(state="disabled")
 
     def _clear_all_logs(self):
-        for area in [self.log_area_general, self.log_area_api, self.log_area_auth]:
+        self.buffer.clear()
+        for area in self._areas.values():
             area.configure(state="normal")
             area.delete("1.0", "end")
             area.configure(state="disabled")
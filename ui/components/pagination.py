@@ -0,0 +1,175 @@
+"""페이지 네비게이션 바 컴포넌트 (위젯 재사용).
+
+매 repack마다 버튼을 파괴/재생성하지 않고, 고정 개수의 슬롯 버튼을
+한 번만 만들어 두고 라벨/상태만 제자리에서 갱신한다.
+슬롯 구성: ◀ | 첫 페이지 | … | 현재±window | … | 마지막 페이지 | ▶ | (N대)
+"""
+
+import customtkinter as ctk
+from ui.theme import Colors
+
+
+def page_slots(current, total_pages, window=2):
+    """표시할 슬롯 목록 계산.
+
+    Args:
+        current: 현재 페이지 (0부터)
+        total_pages: 전체 페이지 수
+        window: 현재 페이지 좌우로 보여줄 페이지 수
+    Returns:
+        list: 페이지 번호(int, 0부터) 또는 생략 기호 자리(None).
+              길이는 최대 2 * window + 5 로 고정.
+    """
+    slot_count = 2 * window + 5
+    if total_pages <= slot_count:
+        return list(range(total_pages))
+
+    last = total_pages - 1
+    # 앞쪽: 첫 페이지 ~ (slot_count - 3) + … + 마지막
+    if current <= window + 2:
+        return list(range(slot_count - 2)) + [None, last]
+    # 뒤쪽: 첫 페이지 + … + 마지막 (slot_count - 2)개
+    if current >= last - (window + 2):
+        return [0, None] + list(range(total_pages - (slot_count - 2), total_pages))
+    # 가운데: 첫 페이지 + … + 현재±window + … + 마지막
+    middle = list(range(current - window, current + window + 1))
+    return [0, None] + middle + [None, last]
+
+
+class PaginationBar(ctk.CTkFrame):
+    """슬롯 재사용 페이지 바. 페이지 수와 무관하게 위젯 수가 일정."""
+
+    def __init__(self, parent, on_page, window=2):
+        super().__init__(parent, fg_color="transparent", height=40)
+        self._on_page = on_page
+        self._window = window
+        self._state = None  # (current, total_pages, total_items)
+        self._current = 0
+        self._total_pages = 0
+
+        # 폰트는 한 번만 생성하여 공유
+        self._font = ctk.CTkFont(size=12)
+        self._font_bold = ctk.CTkFont(size=12, weight="bold")
+
+        inner = ctk.CTkFrame(self, fg_color="transparent")
+        inner.pack(anchor="center")
+
+        self._prev_btn = self._make_button(
+            inner, "◀", lambda: self._on_page(self._current - 1)
+        )
+        self._prev_btn.grid(row=0, column=0, padx=2)
+
+        # 슬롯별 페이지 번호 / 버튼 / 마지막으로 적용된 (page, is_current)
+        self._slot_pages = []
+        self._slot_buttons = []
+        self._slot_applied = []
+        for i in range(2 * window + 5):
+            btn = self._make_button(inner, "", lambda s=i: self._on_slot(s))
+            btn.grid(row=0, column=i + 1, padx=2)
+            btn.grid_remove()
+            self._slot_buttons.append(btn)
+            self._slot_pages.append(None)
+            self._slot_applied.append(False)
+
+        self._next_btn = self._make_button(
+            inner, "▶", lambda: self._on_page(self._current + 1)
+        )
+        self._next_btn.grid(row=0, column=2 * window + 6, padx=2)
+
+        self._count_label = ctk.CTkLabel(
+            inner,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color=Colors.TEXT_SUB,
+        )
+        self._count_label.grid(row=0, column=2 * window + 7, padx=(8, 0))
+
+    def _make_button(self, parent, text, command):
+        return ctk.CTkButton(
+            parent,
+            text=text,
+            width=32,
+            height=28,
+            font=self._font,
+            fg_color="transparent",
+            border_width=1,
+            border_color=Colors.BORDER,
+            text_color=Colors.TEXT,
+            hover_color=Colors.BG_HOVER,
+            command=command,
+        )
+
+    def _on_slot(self, slot):
+        page = self._slot_pages[slot]
+        if page is not None and page != self._current:
+            self._on_page(page)
+
+    def update_pages(self, current, total_pages, total_items):
+        """현재 상태를 반영. 이전과 동일하면 아무것도 하지 않음."""
+        state = (current, total_pages, total_items)
+        if state == self._state:
+            return
+        prev = self._state
+        self._state = state
+        self._current = current
+        self._total_pages = total_pages
+
+        if prev is None or prev[2] != total_items:
+            self._count_label.configure(text=f"  ({total_items}대)")
+
+        if prev is None or prev[0] != current or prev[1] != total_pages:
+            self._prev_btn.configure(state="normal" if current > 0 else "disabled")
+            self._next_btn.configure(
+                state="normal" if current < total_pages - 1 else "disabled"
+            )
+            self._apply_slots(page_slots(current, total_pages, self._window))
+
+    def _apply_slots(self, slots):
+        for i, btn in enumerate(self._slot_buttons):
+            if i >= len(slots):
+                if self._slot_applied[i] is not False:
+                    btn.grid_remove()
+                    self._slot_applied[i] = False
+                self._slot_pages[i] = None
+                continue
+
+            page = slots[i]
+            self._slot_pages[i] = page
+            applied = (page, page == self._current)
+            if self._slot_applied[i] == applied:
+                continue
+
+            if self._slot_applied[i] is False:
+                btn.grid()
+
+            if page is None:
+                btn.configure(
+                    text="…",
+                    font=self._font,
+                    fg_color="transparent",
+                    text_color=Colors.TEXT_MUTED,
+                    border_width=0,
+                    hover_color=Colors.BG,
+                    state="disabled",
+                )
+            elif page == self._current:
+                btn.configure(
+                    text=str(page + 1),
+                    font=self._font_bold,
+                    fg_color=Colors.ACCENT,
+                    text_color="white",
+                    border_width=0,
+                    hover_color=Colors.ACCENT_HOVER,
+                    state="normal",
+                )
+            else:
+                btn.configure(
+                    text=str(page + 1),
+                    font=self._font,
+                    fg_color="transparent",
+                    text_color=Colors.TEXT,
+                    border_width=1,
+                    hover_color=Colors.BG_HOVER,
+                    state="normal",
+                )
+            self._slot_applied[i] = applied
@@ -7,8 +7,15 @@ from datetime import datetime, timedelta
 from ui.theme import Colors
 from ui.utils import set_window_icon
 from core.version import APP_VERSION
-from core.updater import check_update, download_update, run_installer_and_exit
-from core.config import load_config, save_config
+from core.updater import (
+    check_update,
+    cleanup_staged,
+    download_update,
+    run_installer_and_exit,
+    stage_update,
+    staged_update,
+)
+from core.config import load_config, update_config
 
 
 class UpdateDialog:
@@ -36,18 +43,28 @@ class UpdateDialog:
                 pass
 
         def _on_result(has_update, latest_ver, download_url, error):
-            if has_update and download_url:
+            if not (has_update and download_url):
+                if not error:
+                    cleanup_staged()  # 설치 완료된 버전의 스테이징 정리
+                return
+
+            def _show(*_args):
                 self.parent.after(
                     0, lambda: self._show_dialog(latest_ver, download_url)
                 )
 
+            if app_settings.get("updatePrefetch", True):
+                # 미리 받아 검증까지 끝낸 뒤 알림 (실패 시 기존처럼 바로 알림)
+                stage_update(download_url, latest_ver, on_staged=_show, on_error=_show)
+            else:
+                _show()
+
         check_update(_on_result)
 
     def _dismiss_for_days(self, dialog, days=3):
         """N일 후에 다시 알림."""
-        cfg = load_config()
-        cfg["updateDismissUntil"] = (datetime.now() + timedelta(days=days)).isoformat()
-        save_config(cfg)
+        until = (datetime.now() + timedelta(days=days)).isoformat()
+        update_config({"updateDismissUntil": until})
         dialog.destroy()
 
     def _show_dialog(self, latest_ver, download_url):
@@ -62,8 +79,10 @@ class UpdateDialog:
         dialog.grab_set()
         dialog.protocol("WM_DELETE_WINDOW", lambda: None)
 
+        staged = staged_update(latest_ver) is not None
+
         # 중앙 배치
-        dw, dh = 400, 240
+        dw, dh = 400, 264 if staged else 240
         sw = dialog.winfo_screenwidth()
         sh = dialog.winfo_screenheight()
         dx = (sw // 2) - (dw // 2)
@@ -87,6 +106,14 @@ class UpdateDialog:
             text_color=Colors.TEXT_SUB,
         ).pack(pady=(0, 10))
 
+        if staged:
+            ctk.CTkLabel(
+                dialog,
+                text="다운로드 완료 — 재시작하면 바로 적용됩니다.",
+                font=ctk.CTkFont(size=11),
+                text_color=Colors.SUCCESS,
+            ).pack(pady=(0, 6))
+
         # 진행률 바 (초기에는 숨김)
         progress_frame = ctk.CTkFrame(dialog, fg_color="transparent")
 
@@ -158,11 +185,13 @@ class UpdateDialog:
 
                 self.parent.after(0, _show_error)
 
-            download_update(download_url, _on_progress, _on_complete, _on_error)
+            download_update(
+                download_url, _on_progress, _on_complete, _on_error, version=latest_ver
+            )
 
         ctk.CTkButton(
             btn_row,
-            text="다운로드 및 설치",
+            text="지금 업데이트" if staged else "다운로드 및 설치",
             width=140,
             fg_color=Colors.ACCENT,
             hover_color=Colors.ACCENT_HOVER,
@@ -2,66 +2,10 @@
 
 import os
 import customtkinter as ctk
-from PIL import Image
 from ui.theme import Colors
+from ui.image_service import get_image_service
+from core.colors import CHIP_SIZE
 from core.formatter import get_field, get_option_info, format_price
-from core.config import BASE_DIR
-
-_image_cache = {}
-_dir_cache = {}  # {dir_path: [filename, ...]} — os.listdir 캐시
-
-ASSETS_COLORS_DIR = str(BASE_DIR / "assets" / "colors")
-
-
-def find_color_image(color_name, chip_type="exterior"):
-    target_dir = os.path.join(ASSETS_COLORS_DIR, chip_type)
-    if not os.path.exists(target_dir):
-        return None
-
-    name_map = {
-        # 외장 — API 응답명 → 에셋 파일명 변환
-        "소울트로닉 오렌지 펄": "시에나 오렌지 메탈릭",
-        "소울트로닉 오렌지 펄투톤": "시에나 오렌지 메탈릭투톤",
-        # 내장 — API 응답명 → 에셋 파일명 변환
-        "블랙(인조가죽)": "블랙 인조가죽",
-        "블랙 (인조가죽)": "블랙 인조가죽",
-        "블랙(직물)": "블랙 인조가죽",
-        "다크 그레이/라이트 카키": "다크 그레이 라이트 카키",
-        "다크 그레이 / 라이트 카키": "다크 그레이 라이트 카키",
-        "다크 그레이/아마조나스 그린": "다크 그레이 아마조나스 그린",
-        "다크 그레이 / 아마조나스 그린": "다크 그레이 아마조나스 그린",
-    }
-    target_name = name_map.get(color_name, color_name)
-    clean_name = (
-        target_name.replace(" ", "_")
-        .replace("/", "_")
-        .replace("(", "")
-        .replace(")", "")
-    )
-    path = os.path.join(target_dir, f"{clean_name}.png")
-    if os.path.exists(path):
-        return path
-    # fallback: 디렉토리 캐시 사용 (매번 os.listdir 방지)
-    if target_dir not in _dir_cache:
-        try:
-            _dir_cache[target_dir] = os.listdir(target_dir)
-        except Exception:
-            _dir_cache[target_dir] = []
-    for f in _dir_cache[target_dir]:
-        if clean_name in f.split(".")[0]:
-            return os.path.join(target_dir, f)
-    return None
-
-
-def get_cached_image(img_path, size=(55, 22)):
-    key = (img_path, size)
-    if key not in _image_cache:
-        try:
-            pil_img = Image.open(img_path)
-            _image_cache[key] = ctk.CTkImage(light_image=pil_img, size=size)
-        except Exception:
-            return None
-    return _image_cache[key]
 
 
 class VehicleCard(ctk.CTkFrame):
@@ -119,16 +63,13 @@ class VehicleCard(ctk.CTkFrame):
         cbox.pack(side="left", padx=(0, 15))
         ext_color = get_field(vehicle, "extCrNm", "exteriorColorName")
         int_color = get_field(vehicle, "intCrNm", "interiorColorName")
+        images = get_image_service()
         for name, ctype in [(ext_color, "exterior"), (int_color, "interior")]:
             row = ctk.CTkFrame(cbox, fg_color="transparent")
             row.pack(fill="x")
-            img_path = find_color_image(name, ctype)
-            if img_path:
-                img_obj = get_cached_image(img_path)
-                if img_obj:
-                    ctk.CTkLabel(row, image=img_obj, text="").pack(
-                        side="left", padx=(0, 4)
-                    )
+            chip_key = images.resolve(name, ctype)
+            if chip_key:
+                self._add_color_chip(row, images, chip_key)
             ctk.CTkLabel(
                 row, text=name, font=ctk.CTkFont(size=12), text_color=Colors.TEXT
             ).pack(side="left")
@@ -203,6 +144,26 @@ class VehicleCard(ctk.CTkFrame):
                 command=lambda: os.startfile(detail_url),
             ).pack(side="right")
 
+    def _add_color_chip(self, row, images, chip_key):
+        """컬러칩 라벨 배치. 캐시에 없으면 placeholder 후 디코딩 완료 시 교체."""
+        chip = ctk.CTkLabel(
+            row,
+            text="",
+            width=CHIP_SIZE[0],
+            height=CHIP_SIZE[1],
+            fg_color=Colors.DIVIDER,
+            corner_radius=3,
+        )
+        chip.pack(side="left", padx=(0, 4))
+
+        def _swap(img):
+            if chip.winfo_exists():
+                chip.configure(image=img, fg_color="transparent")
+
+        img_obj = images.request(chip, chip_key, _swap)
+        if img_obj:
+            _swap(img_obj)
+
     def highlight(self):
         """1.5초간 노란색 하이라이트 효과"""
         orig_color = Colors.BG_CARD
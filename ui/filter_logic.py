@@ -3,7 +3,12 @@
 우선순위 스코어링, 정렬 기준, 필터 값 관리, 필터 업데이트 로직을 담당.
 """
 
+import logging
+
 from core.formatter import get_option_info
+from core.rules import compile_rule, quote, RuleError, VehicleFields
+
+log = logging.getLogger("CasperFinder")
 
 # ── 기본 필터 목록 (2026 캐스퍼 일렉트릭 기준) ──
 FILTER_DEFAULTS = {
@@ -105,6 +110,65 @@ def passes_filter(vehicle_item, filters):
     return True
 
 
+def filters_to_rule(filters):
+    """필터 → 알림 규칙 조건식 (core.rules 문법). 기본값(필터 없음)이면 None.
+
+    passes_filter 와 같은 의미: 트림은 하나라도, 색상은 부분 일치, 옵션은 모두 포함.
+    값은 quote() 로 감싼다 (따옴표가 모두 들어간 값이면 RuleError).
+    """
+    parts = []
+    if filters["trim"] != ["트림"]:
+        trims = [t.replace("✓ ", "") for t in filters["trim"] if t != "트림"]
+        if not trims:
+            return "price < 0"  # 선택 없는 복수선택 → 일치 없음 (passes_filter 와 동일)
+        parts.append("trim in [" + ", ".join(quote(t) for t in trims) + "]")
+    if filters["ext"] != "외장색상":
+        parts.append(f"ext ~ {quote(filters['ext'])}")
+    if filters["int"] != "내장색상":
+        parts.append(f"int ~ {quote(filters['int'])}")
+    if filters["opt"] != ["옵션"]:
+        for opt in (o.replace("✓ ", "") for o in filters["opt"] if o != "옵션"):
+            parts.append(f"option ~ {quote(opt)}")
+    return " and ".join(parts) or None
+
+
+_compiled_filter = (None, None)  # (필터 키, 조건 함수) — 마지막 필터 조합 1개만 보관
+
+
+def filter_predicate(filters):
+    """필터 → 컴파일된 조건 함수 fn(vehicle, label) -> bool. 필터가 없으면 None.
+
+    필터 조합이 바뀔 때만 다시 컴파일 (자동 계약/우선 알림 판정용, 아무 스레드에서나).
+    """
+    global _compiled_filter
+    key = (tuple(filters["trim"]), filters["ext"], filters["int"], tuple(filters["opt"]))
+    cached_key, match = _compiled_filter
+    if cached_key == key:
+        return match
+    try:
+        rule = filters_to_rule(filters)
+    except RuleError as e:
+        # 조건식으로 옮길 수 없는 값 → 기존 필터 함수로 판정 (결과는 같음)
+        log.warning(f"[필터] 조건식 변환 불가, 기본 판정 사용: {e}")
+        snapshot = {k: list(v) if isinstance(v, list) else v for k, v in filters.items()}
+
+        def match(vehicle, label):
+            return passes_filter((vehicle, label, None, None), snapshot)
+
+        _compiled_filter = (key, match)
+        return match
+
+    match = None
+    if rule is not None:
+        predicate, _ = compile_rule(rule)
+
+        def match(vehicle, label):
+            return predicate(VehicleFields(vehicle, label))
+
+    _compiled_filter = (key, match)
+    return match
+
+
 def get_sort_val(vehicle_item, sort_key):
     """정렬 기준값 계산.
 
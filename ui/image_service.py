@@ -0,0 +1,190 @@
+"""컬러칩 이미지 서비스.
+
+- 빌드 시 생성된 아틀라스(assets/colors/atlas.png + atlas.json)를 한 번만 열어
+  칩을 잘라 쓴다. 아틀라스가 없으면(미빌드 개발 환경) 개별 PNG 로 대체.
+- 색상명 → 칩 키 조회는 정규화 이름의 정확 일치 (유사 일치는 빌드 시점).
+  인덱스에 없는 새 색상명만 이름당 1회 유사 일치로 찾고, 결과(없음 포함)를 인덱스에 기억.
+- 디코딩/자르기는 공유 런타임 스레드 풀에서 수행 (Tk 스레드 차단 없음).
+- 완성된 이미지는 (칩 키, 크기) 키의 LRU 캐시에 보관 (최대 개수 제한).
+
+카드는 placeholder 라벨을 먼저 그리고, 이미지가 준비되면 교체한다.
+"""
+
+import os
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+import customtkinter as ctk
+from PIL import Image
+
+from core.runtime import get_runtime
+from core.colors import (
+    ATLAS_INDEX_PATH,
+    ATLAS_PNG_PATH,
+    ATLAS_VERSION,
+    CHIP_SIZE,
+    CHIP_TYPES,
+    COLORS_DIR,
+    build_name_index,
+    match_stem,
+    normalize_color_name,
+)
+from ui.filter_logic import FILTER_DEFAULTS
+
+log = logging.getLogger("CasperFinder")
+
+
+class ColorImageService:
+    """컬러칩 이름 인덱스 + 백그라운드 디코딩 + LRU 캐시."""
+
+    def __init__(self, max_cached=64):
+        self._max_cached = max_cached
+        self._cache = OrderedDict()  # {(chip_key, size): CTkImage}
+        self._pending = {}  # {(chip_key, size): [(widget, callback), ...]}
+        self._lock = threading.Lock()
+        self._runtime = get_runtime()
+
+        self._rects = {}  # 아틀라스 모드: {chip_key: [x, y, w, h]}
+        self._files = {}  # 개별 파일 모드: {chip_key: 경로}
+        self._atlas = None
+        self._atlas_lock = threading.Lock()
+        self._names = self._load_atlas_index() or self._build_file_index()
+
+        # 아틀라스 디코딩은 첫 카드 이전에 미리 시작
+        if self._rects:
+            self._runtime.run_blocking(self._atlas_image)
+
+    def _load_atlas_index(self):
+        """atlas.json 로드. 없거나 버전이 다르면 None."""
+        if not (ATLAS_INDEX_PATH.exists() and ATLAS_PNG_PATH.exists()):
+            return None
+        try:
+            with open(ATLAS_INDEX_PATH, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != ATLAS_VERSION:
+                log.warning("[이미지] 아틀라스 버전 불일치 — 개별 파일 사용")
+                return None
+            self._rects = index["chips"]
+            return index["names"]
+        except Exception as e:
+            log.warning(f"[이미지] 아틀라스 인덱스 로드 실패: {e}")
+            self._rects = {}
+            return None
+
+    def _build_file_index(self):
+        """개별 PNG 스캔 (아틀라스 미빌드 환경용). 시작 시 1회."""
+        stems_by_type = {}
+        for chip_type in CHIP_TYPES:
+            stems = []
+            try:
+                for fname in os.listdir(COLORS_DIR / chip_type):
+                    stem, ext = os.path.splitext(fname)
+                    if ext.lower() == ".png":
+                        stems.append(stem)
+                        self._files[f"{chip_type}/{stem}"] = str(
+                            COLORS_DIR / chip_type / fname
+                        )
+            except OSError:
+                pass
+            stems_by_type[chip_type] = stems
+        extra = {"exterior": FILTER_DEFAULTS["ext"], "interior": FILTER_DEFAULTS["int"]}
+        return build_name_index(stems_by_type, extra)
+
+    def resolve(self, color_name, chip_type="exterior"):
+        """색상명 → 칩 키 (없으면 None).
+
+        인덱스에 없는 이름은 처음 한 번만 유사 일치로 찾고 결과(None 포함)를 기억.
+        """
+        names = self._names.setdefault(chip_type, {})
+        norm = normalize_color_name(color_name)
+        try:
+            return names[norm]
+        except KeyError:
+            pass
+        prefix = f"{chip_type}/"
+        stems = {key[len(prefix) :] for key in names.values() if key}
+        stem = match_stem(color_name, stems) if norm else None
+        names[norm] = chip_key = f"{prefix}{stem}" if stem else None
+        if chip_key:
+            log.info(f"[이미지] 유사 일치: {color_name} → {chip_key}")
+        return chip_key
+
+    def request(self, widget, chip_key, callback, size=CHIP_SIZE):
+        """이미지 요청. 캐시 적중 시 즉시 반환, 아니면 None 반환 후
+        준비가 끝나면 Tk 스레드에서 callback(CTkImage) 호출.
+        """
+        key = (chip_key, size)
+        with self._lock:
+            img = self._cache.get(key)
+            if img is not None:
+                self._cache.move_to_end(key)
+                return img
+            waiters = self._pending.get(key)
+            if waiters is not None:
+                waiters.append((widget, callback))
+                return None
+            self._pending[key] = [(widget, callback)]
+
+        self._runtime.run_blocking(self._decode, key)
+        return None
+
+    def _atlas_image(self):
+        """아틀라스 PNG 를 1회만 디코딩 (동시 호출 시 대기)."""
+        with self._atlas_lock:
+            if self._atlas is None:
+                with Image.open(ATLAS_PNG_PATH) as src:
+                    self._atlas = src.convert("RGBA")
+            return self._atlas
+
+    def _decode(self, key):
+        """워커 스레드: 아틀라스에서 잘라내거나 개별 PNG 디코딩."""
+        chip_key, size = key
+        try:
+            if chip_key in self._rects:
+                x, y, w, h = self._rects[chip_key]
+                pil_img = self._atlas_image().crop((x, y, x + w, y + h))
+            else:
+                with Image.open(self._files[chip_key]) as src:
+                    pil_img = src.convert("RGBA").resize(size, Image.LANCZOS)
+        except Exception as e:
+            log.warning(f"[이미지] 컬러칩 로드 실패 ({chip_key}): {e}")
+            pil_img = None
+
+        with self._lock:
+            waiters = self._pending.pop(key, [])
+
+        for widget, callback in waiters:
+            try:
+                widget.after(
+                    0, lambda w=widget, cb=callback: self._deliver(w, cb, key, pil_img)
+                )
+            except Exception:
+                pass  # 위젯이 이미 파괴됨
+
+    def _deliver(self, widget, callback, key, pil_img):
+        """Tk 스레드: CTkImage 생성(또는 캐시 재사용) 후 콜백."""
+        if pil_img is None or not widget.winfo_exists():
+            return
+        with self._lock:
+            img = self._cache.get(key)
+            if img is None:
+                img = ctk.CTkImage(light_image=pil_img, size=key[1])
+                self._cache[key] = img
+                while len(self._cache) > self._max_cached:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(key)
+        callback(img)
+
+
+_service = None
+
+
+def get_image_service():
+    """싱글턴 서비스 반환 (최초 호출 시 인덱스 로드)."""
+    global _service
+    if _service is None:
+        _service = ColorImageService()
+    return _service
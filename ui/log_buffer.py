@@ -0,0 +1,143 @@
+"""디버그 콘솔 로그 모델 — 탭별 링 버퍼 + 메시지 분류/요약.
+
+GUI 프레임워크 의존성 없음 (표준 라이브러리만): 앱 시작 시 바로 만들어 로그를 쌓고,
+창(ui.components.log_window.LogWindow)은 처음 열 때 import/생성한다.
+"""
+
+import re
+import json
+import itertools
+from collections import OrderedDict, deque
+from datetime import datetime
+
+# ── 로그 버퍼 한도 ──
+MAX_ENTRIES = 2000  # 탭별 링 버퍼 보관 개수 (메시지 단위)
+MAX_BODIES = 200  # 펼치기용으로 보관하는 원본 BODY/PAYLOAD 개수
+BODY_MAX_BYTES = 64 * 1024  # 펼칠 때 표시할 최대 바이트 (설정: logBodyMaxBytes)
+
+TAB_GENERAL = "general"
+TAB_API = "api"
+TAB_AUTH = "auth"
+TABS = (TAB_GENERAL, TAB_API, TAB_AUTH)
+
+FOLD_TAG = "fold"  # 접힌 본문 요약 줄 (클릭 시 펼치기)
+_fold_ids = itertools.count(1)
+
+# 요약 줄용 필드 추출 (전체 JSON 파싱 없이 정규식으로만)
+_RSP_CODE_RE = re.compile(r'"rspCode"\s*:\s*"?([^",}]*)')
+_TOTAL_COUNT_RE = re.compile(r'"totalCount"\s*:\s*(\d+)')
+
+
+def format_log_entry(timestamp, message, bodies=None):
+    """메시지를 분류하여 (탭, [(텍스트, 태그|None), ...]) 반환.
+
+    bodies: {본문 번호: 원본 문자열} — BODY/PAYLOAD 원본을 펼치기용으로 보관.
+    """
+    if message.startswith("[API]"):
+        return TAB_API, _format_api_entry(timestamp, message[5:].strip(), bodies)
+
+    tab = (
+        TAB_AUTH
+        if message.startswith("[Auth]") or message.startswith("[Automation]")
+        else TAB_GENERAL
+    )
+    return tab, [(f"[{timestamp}] ", "timestamp"), (f"{message}\n", None)]
+
+
+def _format_api_entry(timestamp, content, bodies=None):
+    """API 로그를 파싱하여 색상 적용. 본문은 한 줄 요약으로 접어 둔다."""
+    tag = None
+    display_text = content
+
+    if content.startswith(">>> REQUEST"):
+        tag = "request"
+        display_text = f"\n─ REQUEST ──────────────────────────────────\n{content}\n"
+    elif content.startswith("<<< RESPONSE"):
+        tag = "response"
+        display_text = f"{content}\n"
+    elif content.startswith("PAYLOAD:") or content.startswith("BODY:"):
+        prefix = "PAYLOAD:" if content.startswith("PAYLOAD:") else "BODY:"
+        raw = content[len(prefix) :].strip()
+        # 항목별 태그 대신 요약 줄에 번호를 넣어 둠 (Tk 태그 테이블 누적 방지)
+        body_id = next(_fold_ids)
+        if bodies is not None:
+            bodies[body_id] = raw
+        tag = ("body", FOLD_TAG)
+        display_text = f"{prefix} ▶ #{body_id} {summarize_body(raw)}\n"
+    elif content.startswith("!!!"):
+        tag = "error"
+        display_text = f"{content}\n"
+
+    return [(f"[{timestamp}] ", "timestamp"), (display_text, tag)]
+
+
+def summarize_body(raw):
+    """본문 한 줄 요약: 응답 코드 · 건수 · 크기."""
+    parts = []
+    m = _RSP_CODE_RE.search(raw)
+    if m:
+        parts.append(f"rspCode={m.group(1)}")
+    m = _TOTAL_COUNT_RE.search(raw)
+    if m:
+        parts.append(f"totalCount={m.group(1)}")
+    parts.append(_format_size(len(raw.encode("utf-8"))))
+    return " · ".join(parts)
+
+
+def _format_size(n):
+    return f"{n / 1024:.1f}KB" if n >= 1024 else f"{n}B"
+
+
+def pretty_body(raw, max_bytes=BODY_MAX_BYTES):
+    """본문 정렬(Pretty Print) + 크기 제한. 워커 스레드에서 호출."""
+    try:
+        text = json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
+    except Exception:
+        text = raw  # JSON 아님 (Raw Text 등) → 원본 그대로
+
+    encoded = text.encode("utf-8")
+    if len(encoded) > max_bytes:
+        shown = encoded[:max_bytes].decode("utf-8", errors="ignore")
+        text = (
+            f"{shown}\n… (잘림: {_format_size(len(encoded))} 중 "
+            f"{_format_size(max_bytes)} 표시)"
+        )
+    return text
+
+
+class LogBuffer:
+    """탭별 링 버퍼 로그 모델.
+
+    append()는 어느 스레드에서든 호출 가능 (deque append만 수행).
+    drain()은 Tk 스레드에서 호출하여 수신함 → 탭별 링 버퍼로 옮긴다.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bodies=MAX_BODIES):
+        self._inbox = deque(maxlen=max_entries * len(TABS))
+        self.entries = {tab: deque(maxlen=max_entries) for tab in TABS}
+        self._max_bodies = max_bodies
+        self.bodies = OrderedDict()  # {본문 번호: 원본 본문} (오래된 것부터 제거)
+
+    def append(self, message):
+        self._inbox.append((datetime.now().strftime("%H:%M:%S"), message))
+
+    def drain(self):
+        """수신함 비우기. Returns: {tab: [segments, ...]} (새 항목만)"""
+        new = {}
+        while self._inbox:
+            try:
+                timestamp, message = self._inbox.popleft()
+            except IndexError:
+                break
+            tab, segments = format_log_entry(timestamp, message, self.bodies)
+            self.entries[tab].append(segments)
+            new.setdefault(tab, []).append(segments)
+        while len(self.bodies) > self._max_bodies:
+            self.bodies.popitem(last=False)
+        return new
+
+    def clear(self):
+        self._inbox.clear()
+        self.bodies.clear()
+        for ring in self.entries.values():
+            ring.clear()
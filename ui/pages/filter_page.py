@@ -3,26 +3,17 @@
 각 기획전의 실제 웹페이지 레이아웃(보조금/배송지)에 맞춰 필드 구성 최적화.
 """
 
-import json
 import customtkinter as ctk
 from ui.theme import Colors
-from core.config import load_config, save_config, BASE_DIR
+from core.config import load_config, save_config
+from core.regions import get_region_index, region_kinds, target_fields
 from ui.components.notifier import show_notification
 
-REGIONS_PATH = BASE_DIR / "constants" / "regions.json"
-
-
-def load_regions():
-    if not REGIONS_PATH.exists():
-        return {"delivery": [], "subsidy": []}
-    with open(REGIONS_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 
 def build_filter_tab(app, container):
     """조건설정 탭 UI를 container에 그린다."""
     frame = container
-    regions_data = load_regions()
+    regions = get_region_index()
     config = load_config()
     targets = config.get("targets", [])
 
@@ -57,40 +48,21 @@ def build_filter_tab(app, container):
             text_color=Colors.PRIMARY,
         ).pack(side="left")
 
-        if exhb_no.startswith("E"):
+        kinds = region_kinds(exhb_no)
+        if kinds:
             build_section_layout(
                 scroll,
                 target,
                 app.filter_vars[t_id],
-                regions_data,
+                regions,
                 config,
-                show_delivery=True,
-                show_subsidy=True,
-            )
-        elif exhb_no.startswith("D"):
-            build_section_layout(
-                scroll,
-                target,
-                app.filter_vars[t_id],
-                regions_data,
-                config,
-                show_delivery=False,
-                show_subsidy=True,
-            )
-        elif exhb_no.startswith("R"):
-            build_section_layout(
-                scroll,
-                target,
-                app.filter_vars[t_id],
-                regions_data,
-                config,
-                show_delivery=True,
-                show_subsidy=False,
+                show_delivery="delivery" in kinds,
+                show_subsidy="subsidy" in kinds,
             )
 
     # ───── 하단 통합 저장 버튼 ─────
     def on_save_all():
-        do_save_all(app, targets, regions_data)
+        do_save_all(app, targets, regions)
 
     ctk.CTkButton(
         frame,
@@ -105,7 +77,7 @@ def build_filter_tab(app, container):
 
 
 def build_section_layout(
-    parent, target, vars, regions_data, config, show_delivery=True, show_subsidy=True
+    parent, target, vars, regions, config, show_delivery=True, show_subsidy=True
 ):
     """공통 카드 레이아웃에 필요한 필드만 활성화하여 배치"""
     card = ctk.CTkFrame(
@@ -139,14 +111,13 @@ def build_section_layout(
         d_row.pack(fill="x", pady=(0, 10))
 
         def update_sigun(val):
-            sido = next((r for r in regions_data["delivery"] if r["name"] == val), None)
-            if sido:
-                names = [s["name"] for s in sido["siguns"]]
+            names = regions.sigun_names("delivery", val)
+            if names:
                 d_sigun_cb.configure(values=names)
                 if vars["d_sigun"].get() not in names:
                     vars["d_sigun"].set(names[0])
 
-        sidos = [r["name"] for r in regions_data["delivery"]]
+        sidos = regions.sido_names("delivery")
         ctk.CTkLabel(d_row, text="시/도:").pack(side="left", padx=(0, 5))
         ctk.CTkComboBox(
             d_row,
@@ -174,14 +145,13 @@ def build_section_layout(
         s_row.pack(fill="x")
 
         def update_ssigun(val):
-            sido = next((r for r in regions_data["subsidy"] if r["name"] == val), None)
-            if sido:
-                names = [s["name"] for s in sido["siguns"]]
+            names = regions.sigun_names("subsidy", val)
+            if names:
                 s_sigun_cb.configure(values=names)
                 if vars["s_sigun"].get() not in names:
                     vars["s_sigun"].set(names[0])
 
-        ssidos = [r["name"] for r in regions_data["subsidy"]]
+        ssidos = regions.sido_names("subsidy")
         ctk.CTkLabel(s_row, text="시/도:").pack(side="left", padx=(0, 5))
         ctk.CTkComboBox(
             s_row,
@@ -197,11 +167,11 @@ def build_section_layout(
         s_sigun_cb.pack(side="left")
 
     # 초기값 적용
-    apply_to_ui(target, vars, regions_data, config, d_sigun_cb, s_sigun_cb)
+    apply_to_ui(target, vars, regions, config, d_sigun_cb, s_sigun_cb)
 
 
-def apply_to_ui(target, vars, regions_data, config, d_cb, s_cb):
-    """JSON 설정값을 UI 변수에 매핑"""
+def apply_to_ui(target, vars, regions, config, d_cb, s_cb):
+    """JSON 설정값을 UI 변수에 매핑 (코드 → 이름, 못 찾으면 "전국")"""
     default_payload = config["api"]["defaultPayload"]
 
     # 배송지 매핑
@@ -210,50 +180,38 @@ def apply_to_ui(target, vars, regions_data, config, d_cb, s_cb):
         dl_code = target.get(
             "deliveryLocalAreaCode", default_payload["deliveryLocalAreaCode"]
         )
-
-        sido = next(
-            (r for r in regions_data["delivery"] if r["code"] == d_code),
-            regions_data["delivery"][0],  # 기본값: 전국
-        )
-        vars["d_sido"].set(sido["name"])
-
-        sigun_names = [s["name"] for s in sido["siguns"]]
-        d_cb.configure(values=sigun_names)
-
-        sigun = next(
-            (s for s in sido["siguns"] if s["code"] == dl_code), sido["siguns"][0]
-        )
-        vars["d_sigun"].set(sigun["name"])
+        default_sido, _ = regions.default("delivery")
+        sido = regions.sido_by_code("delivery", d_code) or default_sido
+        if sido is not None:
+            _, sigun = regions.sigun_by_code("delivery", dl_code, sido=sido)
+            _set_region_vars(vars, "d_sido", "d_sigun", d_cb, sido, sigun)
 
     # 보조금 매핑
     if s_cb:
         sub_code = target.get("subsidyRegion", default_payload["subsidyRegion"])
-        found_sido, found_sigun = None, None
-        for r in regions_data["subsidy"]:
-            for s in r["siguns"]:
-                if s["code"] == sub_code:
-                    found_sido, found_sigun = r, s
-                    break
-            if found_sido:
-                break
-
-        if found_sido:
-            vars["s_sido"].set(found_sido["name"])
-            s_cb.configure(values=[s["name"] for s in found_sido["siguns"]])
-            vars["s_sigun"].set(found_sigun["name"])
-        else:
-            # 매칭 실패 시 "전국" 선택
-            vars["s_sido"].set(regions_data["subsidy"][0]["name"])
-            s_cb.configure(
-                values=[s["name"] for s in regions_data["subsidy"][0]["siguns"]]
-            )
-            vars["s_sigun"].set(regions_data["subsidy"][0]["siguns"][0]["name"])
+        sido, sigun = regions.sigun_by_code("subsidy", sub_code)
+        if sido is None:
+            sido, sigun = regions.default("subsidy")
+        if sido is not None:
+            _set_region_vars(vars, "s_sido", "s_sigun", s_cb, sido, sigun)
+
 
+def _set_region_vars(vars, sido_key, sigun_key, sigun_cb, sido, sigun):
+    """시/도 · 시/군/구 콤보박스 값 설정 (시/군/구 미지정 시 첫 항목)."""
+    names = [s["name"] for s in sido["siguns"]]
+    vars[sido_key].set(sido["name"])
+    sigun_cb.configure(values=names)
+    if sigun is None and sido["siguns"]:
+        sigun = sido["siguns"][0]
+    if sigun is not None:
+        vars[sigun_key].set(sigun["name"])
 
-def do_save_all(app, targets, regions_data):
+
+def do_save_all(app, targets, regions):
     """모든 타겟의 UI 변수값을 한 번에 저장"""
     config = load_config()
     targets_in_config = config.get("targets", [])
+    var_keys = {"delivery": ("d_sido", "d_sigun"), "subsidy": ("s_sido", "s_sigun")}
 
     for target in targets_in_config:
         t_id = target.get("exhbNo", "")
@@ -261,76 +219,15 @@ def do_save_all(app, targets, regions_data):
             continue
 
         vars = app.filter_vars[t_id]
-        exhb_no = t_id
-
-        # 기획전 타입 인지
-        has_delivery = exhb_no.startswith("E") or exhb_no.startswith("R")
-        has_subsidy = exhb_no.startswith("E") or exhb_no.startswith("D")
-
-        if has_delivery:
-            s_name = vars["d_sido"].get().strip()
-            sg_name = vars["d_sigun"].get().strip()
-
-            # 1. 시/도 매칭 (정확 -> 유사업)
-            s_obj = next(
-                (r for r in regions_data["delivery"] if r["name"].strip() == s_name),
-                next(
-                    (
-                        r
-                        for r in regions_data["delivery"]
-                        if s_name in r["name"] or r["name"] in s_name
-                    ),
-                    None,
-                ),
-            )
-            if s_obj is not None:
-                # 2. 시/군/구 매칭 (정확 -> 유사 -> 첫 번째 항목)
-                sg_obj = next(
-                    (s for s in s_obj["siguns"] if s["name"].strip() == sg_name),
-                    next(
-                        (
-                            s
-                            for s in s_obj["siguns"]
-                            if sg_name in s["name"] or s["name"] in sg_name
-                        ),
-                        s_obj["siguns"][0] if s_obj["siguns"] else None,
-                    ),
-                )
-                if sg_obj is not None:
-                    target["deliveryAreaCode"] = s_obj["code"]
-                    target["deliveryLocalAreaCode"] = sg_obj["code"]
-
-        if has_subsidy:
-            ss_name = vars["s_sido"].get().strip()
-            ssg_name = vars["s_sigun"].get().strip()
-
-            # 1. 보조금 시/도 매칭
-            ss_obj = next(
-                (r for r in regions_data["subsidy"] if r["name"].strip() == ss_name),
-                next(
-                    (
-                        r
-                        for r in regions_data["subsidy"]
-                        if ss_name in r["name"] or r["name"] in ss_name
-                    ),
-                    None,
-                ),
+
+        # 기획전 타입별 지역 설정 (정확 → 별칭 → 유사 매칭)
+        for kind in region_kinds(t_id):
+            sido_key, sigun_key = var_keys[kind]
+            sido, sigun = regions.resolve(
+                kind, vars[sido_key].get(), vars[sigun_key].get()
             )
-            if ss_obj is not None:
-                # 2. 보조금 시/군/구 매칭
-                ssg_obj = next(
-                    (s for s in ss_obj["siguns"] if s["name"].strip() == ssg_name),
-                    next(
-                        (
-                            s
-                            for s in ss_obj["siguns"]
-                            if ssg_name in s["name"] or s["name"] in ssg_name
-                        ),
-                        ss_obj["siguns"][0] if ss_obj["siguns"] else None,
-                    ),
-                )
-                if ssg_obj is not None:
-                    target["subsidyRegion"] = ssg_obj["code"]
+            if sigun is not None:
+                target.update(target_fields(kind, sido, sigun))
 
     save_config(config)
     show_notification(
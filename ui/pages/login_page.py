@@ -1,4 +1,3 @@
-import asyncio
 import customtkinter as ctk
 from ui.theme import Colors
 from core.auth import casper_auth
@@ -54,8 +53,8 @@ def build_login_page(frame, app):
     if casper_auth.is_logged_in:
 
         def on_logout():
-            asyncio.run_coroutine_threadsafe(casper_auth.logout(), app.loop)
-            app.after(100, lambda: build_login_page(frame, app))
+            # 상태가 바뀌면 앱이 on_change 로 이 탭을 다시 그림
+            app.runtime.submit(casper_auth.logout())
             show_notification("로그아웃 완료")
 
         ctk.CTkButton(
@@ -100,13 +99,16 @@ def build_login_page(frame, app):
 
             login_btn.configure(state="disabled", text="접속 중...")
 
-            async def do_login():
-                success = await casper_auth.login(email, password)
-                app.after(0, lambda: build_login_page(frame, app))
-                if not success:
+            def on_done(success, error):
+                # Tk 스레드에서 호출 (runtime 이 after 로 전달).
+                # 성공 시 다시 그리기는 앱의 on_change 가 담당 → 실패 시에만 폼 복구
+                if error or not success:
+                    build_login_page(frame, app)
                     show_notification("로그인 실패 (로그 확인)")
 
-            asyncio.run_coroutine_threadsafe(do_login(), app.loop)
+            app.runtime.submit(
+                casper_auth.login(email, password), on_done=on_done, widget=app
+            )
 
         login_btn = ctk.CTkButton(
             f_inner,
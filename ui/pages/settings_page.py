@@ -3,11 +3,12 @@
 import os
 import customtkinter as ctk
 from ui.theme import Colors
-from core.config import load_config, save_config, BASE_DIR
+from core.config import load_config, update_config, BASE_DIR
 from core.dummy import get_dummy_vehicle
 from core.utils import set_auto_start
 from core.version import APP_VERSION
 from core.updater import check_update
+from core.digest import ALERT_VEHICLE
 from core.sound import play_alert
 
 
@@ -30,20 +31,28 @@ def build_settings_tab(app, container):
     )
 
     # ── 자동 저장 핸들러 ──
+    auto_start_state = [app_settings.get("autoStart", False)]
+
     def _on_setting_changed(*_args):
-        """체크박스/슬라이더 변경 시 즉시 저장."""
-        cfg = load_config()
-        cfg["appSettings"] = {
-            "autoStart": app.auto_start_var.get(),
-            "startMinimized": app.tray_start_var.get(),
-            "autoSearch": app.auto_search_var.get(),
-            "autoContract": app.auto_contract_var.get(),
-            "updateNotify": app.update_notify_var.get(),
-            "soundEnabled": app.sound_enabled_var.get(),
-            "soundVolume": int(app.sound_volume_var.get()),
-        }
-        set_auto_start(app.auto_start_var.get())
-        save_config(cfg)
+        """체크박스/슬라이더 변경 시 메모리에 즉시 반영 (디스크는 지연 저장)."""
+        auto_start = app.auto_start_var.get()
+        update_config(
+            {
+                "appSettings": {
+                    "autoStart": auto_start,
+                    "startMinimized": app.tray_start_var.get(),
+                    "autoSearch": app.auto_search_var.get(),
+                    "autoContract": app.auto_contract_var.get(),
+                    "updateNotify": app.update_notify_var.get(),
+                    "soundEnabled": app.sound_enabled_var.get(),
+                    "soundVolume": int(app.sound_volume_var.get()),
+                }
+            }
+        )
+        # 레지스트리는 값이 바뀔 때만 기록 (슬라이더 이동마다 쓰지 않음)
+        if auto_start != auto_start_state[0]:
+            auto_start_state[0] = auto_start
+            set_auto_start(auto_start)
         # 소리 설정 캐시 갱신
         if hasattr(app, "refresh_sound_config"):
             app.refresh_sound_config()
@@ -323,7 +332,7 @@ def build_settings_tab(app, container):
 
             app.after(0, _update_ui)
 
-        check_update(_on_result)
+        check_update(_on_result, force=True)
 
     ctk.CTkButton(
         update_row,
@@ -390,10 +399,7 @@ def build_settings_tab(app, container):
 
     def _show_debug_log():
         """디버그 로그 창 띄우기."""
-        if hasattr(app, "log_window"):
-            app.log_window.deiconify()
-            app.log_window.lift()
-            app.log_window.focus_force()
+        app.show_log_window()
 
     ctk.CTkButton(
         btn_row,
@@ -410,6 +416,12 @@ def build_settings_tab(app, container):
         command=_show_debug_log,
     ).pack(side="left")
 
+    def _add_dummy():
+        """더미 차량 1대 추가 + 즉시 알림 (엔진 발견과 같은 경로)."""
+        vehicle, url = get_dummy_vehicle(), "https://casper.hyundai.com"
+        app._on_notification(vehicle, "테스트", url)
+        app._on_alert(ALERT_VEHICLE, [(vehicle, "테스트", url)])
+
     ctk.CTkButton(
         btn_row,
         text="더미 데이터 생성",
@@ -422,9 +434,7 @@ def build_settings_tab(app, container):
         text_color=Colors.ACCENT,
         hover_color=Colors.BG_HOVER,
         corner_radius=4,
-        command=lambda: app._on_notification(
-            get_dummy_vehicle(), "테스트", "https://casper.hyundai.com"
-        ),
+        command=_add_dummy,
     ).pack(side="right")
 
     app._deer_click_count = 0
@@ -125,8 +125,12 @@ class TopBarMixin:
         )
 
     def _update_timer(self):
-        """메인 타이머 루프 (1초 주기) - 검색 시간 및 서버 상세 정보 갱신"""
-        if not self.winfo_exists():
+        """메인 타이머 루프 (1초 주기) - 검색 시간 및 서버 상세 정보 갱신
+
+        백그라운드(트레이) 모드에서는 멈추고, 복귀 시 _leave_background 가 재시작.
+        """
+        self._timer_job = None
+        if not self.winfo_exists() or self._hidden:
             return
 
         # 1. 검색 타이머 업데이트
@@ -5,10 +5,6 @@ tkinter withdraw/deiconify 와 연동.
 
 import logging
 import threading
-from PIL import Image
-import pystray
-from pystray import MenuItem
-from plyer import notification
 
 from core.config import BASE_DIR
 
@@ -19,6 +15,8 @@ ICON_PATH = BASE_DIR / "assets" / "app_icon.png"
 
 def _create_icon_image():
     """제공된 앱 아이콘 이미지 로드."""
+    from PIL import Image
+
     if ICON_PATH.exists():
         return Image.open(ICON_PATH)
     # Fallback: 기존과 유사한 기본 이미지 (혹은 빈 이미지)
@@ -31,41 +29,48 @@ class TrayManager:
         self._on_quit = on_quit
         self._icon = None
         self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._stopped = False
 
     def start(self):
-        menu = pystray.Menu(
-            MenuItem("열기", self._show, default=True),
-            pystray.Menu.SEPARATOR,
-            MenuItem("종료", self._quit),
-        )
-        self._icon = pystray.Icon(
-            name="CasperFinder",
-            icon=_create_icon_image(),
-            title="CasperFinder — 캐스퍼 기획전 알리미",
-            menu=menu,
-        )
-
-        def _run():
-            try:
-                self._icon.run(setup=self._on_setup)
-            except Exception as e:
-                log.error(f"[트레이] 실행 실패: {e}")
-
-        t = threading.Thread(target=_run, daemon=True)
-        t.start()
-        ready = self._ready.wait(timeout=5)
-        if ready:
-            log.info("[트레이] 아이콘 생성 완료")
-        else:
-            log.warning("[트레이] 아이콘 생성 타임아웃")
+        """트레이 스레드 시작 (pystray import/아이콘 생성은 트레이 스레드에서, 바로 반환)."""
+        threading.Thread(target=self._run, name="tray", daemon=True).start()
+
+    def _run(self):
+        try:
+            # pystray 는 로딩이 무거우므로 트레이 스레드에서 import (UI 스레드 차단 없음)
+            import pystray
+            from pystray import MenuItem
+
+            menu = pystray.Menu(
+                MenuItem("열기", self._show, default=True),
+                pystray.Menu.SEPARATOR,
+                MenuItem("종료", self._quit),
+            )
+            icon = pystray.Icon(
+                name="CasperFinder",
+                icon=_create_icon_image(),
+                title="CasperFinder — 캐스퍼 기획전 알리미",
+                menu=menu,
+            )
+            with self._lock:
+                if self._stopped:  # 준비 전에 stop() 호출됨
+                    return
+                self._icon = icon
+            icon.run(setup=self._on_setup)
+        except Exception as e:
+            log.error(f"[트레이] 실행 실패: {e}")
 
     def _on_setup(self, icon):
         icon.visible = True
         self._ready.set()
+        log.info("[트레이] 아이콘 생성 완료")
 
     def notify(self, message, title="CasperFinder"):
         log.info(f"[트레이] 알림 시도 (plyer): {message}")
         try:
+            from plyer import notification
+
             notification.notify(
                 title=title,
                 message=message,
@@ -76,9 +81,12 @@ class TrayManager:
             log.error(f"[트레이] 알림 실패: {e}")
 
     def stop(self):
-        if self._icon:
+        with self._lock:
+            self._stopped = True
+            icon = self._icon
+        if icon:
             try:
-                self._icon.stop()
+                icon.stop()
             except Exception:
                 pass
 